@@ -0,0 +1,175 @@
+"""Benchmark of decoding experiment and task listings.
+
+Run from the repository root:
+
+    python -m benchmarks.decoding --experiments 10000 --files 10
+
+The references decode the records the way the client did before: into dataclasses with
+a per-instance `__dict__`, parsing every timestamp separately and converting task
+identifiers in Python before pydantic validation.
+"""
+
+import argparse
+import json
+import timeit
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from pyaqueduct.client.decoding import loads, orjson, parse_datetime
+from pyaqueduct.client.experiment_types import ExperimentsInfo
+from pyaqueduct.client.task_types import TaskData
+
+
+@dataclass
+class ReferenceFile:
+    """Experiment file record as it was before, without slots."""
+
+    name: str
+    path: str
+    modified_at: datetime
+
+
+@dataclass
+class ReferenceExperiment:  # pylint: disable=too-many-instance-attributes
+    """Experiment record as it was before, without slots."""
+
+    uuid: UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    eid: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    tags: List[str] = field(default_factory=list)
+    files: List[ReferenceFile] = field(default_factory=list)
+
+
+def make_experiments(count: int, files: int) -> Dict[str, Any]:
+    """Listing response with `count` experiments, each having `files` files."""
+    start = datetime(2024, 1, 1)
+    experiments = []
+    for index in range(count):
+        created_at = (start + timedelta(minutes=index)).isoformat()
+        experiments.append(
+            {
+                "uuid": str(uuid4()),
+                "title": f"experiment {index}",
+                "description": "description of the experiment " * 4,
+                "eid": f"240101-{index}",
+                "createdAt": created_at,
+                "updatedAt": created_at,
+                "tags": ["tag1", "tag2"],
+                "files": [
+                    {"name": f"file{file}.csv", "path": f"file{file}.csv", "modifiedAt": created_at}
+                    for file in range(files)
+                ],
+            }
+        )
+    return {"experimentsData": experiments, "totalExperimentsCount": count}
+
+
+def make_tasks(count: int) -> List[Dict[str, Any]]:
+    """Listing of `count` tasks without parameters and experiment."""
+    received_at = "2024-09-25T15:31:42.922265+00:00"
+    return [
+        {
+            "uuid": str(uuid4()),
+            "taskStatus": "SUCCESS",
+            "resultCode": 0,
+            "extensionName": "Dummy extension",
+            "actionName": "echo",
+            "createdBy": "admin",
+            "receivedAt": received_at,
+            "endedAt": received_at,
+            "stdOut": "output " * 20,
+            "stdErr": "",
+        }
+        for _ in range(count)
+    ]
+
+
+def reference_experiment(data: Dict[str, Any]) -> ReferenceExperiment:
+    """Reference decoding of an experiment."""
+    return ReferenceExperiment(
+        uuid=UUID(data["uuid"]),
+        title=data["title"],
+        description=data["description"],
+        tags=data["tags"],
+        eid=data["eid"],
+        files=[
+            ReferenceFile(
+                name=file["name"],
+                path=file["path"],
+                modified_at=datetime.fromisoformat(file["modifiedAt"]),
+            )
+            for file in data["files"]
+        ],
+        created_at=datetime.fromisoformat(data["createdAt"]),
+        updated_at=datetime.fromisoformat(data["updatedAt"]),
+    )
+
+
+def reference_task(data: Dict[str, Any]) -> TaskData:
+    """Reference decoding of a task."""
+    return TaskData(
+        task_id=UUID(data["uuid"]),
+        task_status=data["taskStatus"],
+        result_code=data["resultCode"],
+        extension_name=data["extensionName"],
+        action_name=data["actionName"],
+        created_by=data["createdBy"],
+        received_at=data["receivedAt"],
+        ended_at=data["endedAt"],
+        std_out=data["stdOut"],
+        std_err=data["stdErr"],
+    )
+
+
+def report(name: str, records: int, function: Callable[[], Any], repeat: int) -> None:
+    """Print throughput of the best of `repeat` runs."""
+    seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+    print(f"{name:<45} {seconds * 1000:9.1f} ms {records / seconds:12,.0f} records/s")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--experiments", type=int, default=10000)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    listing = make_experiments(args.experiments, args.files)
+    content = json.dumps({"data": {"experiments": listing}}).encode()
+    tasks = make_tasks(args.tasks)
+    print(f"{args.experiments} experiments with {args.files} files, {len(content):,} bytes")
+    print(f"orjson is {'available' if orjson is not None else 'not installed'}")
+
+    report("json.loads", args.experiments, lambda: json.loads(content), args.repeat)
+    report("decoding.loads", args.experiments, lambda: loads(content), args.repeat)
+
+    def decode():
+        parse_datetime.cache_clear()
+        return ExperimentsInfo.from_dict(listing)
+
+    report(
+        "experiments, reference",
+        args.experiments,
+        lambda: [reference_experiment(data) for data in listing["experimentsData"]],
+        args.repeat,
+    )
+    report("experiments", args.experiments, decode, args.repeat)
+
+    report(
+        "tasks, reference",
+        args.tasks,
+        lambda: [reference_task(data) for data in tasks],
+        args.repeat,
+    )
+    report("tasks", args.tasks, lambda: [TaskData.from_dict(data) for data in tasks], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark of memory held by decoded experiment and task listings.
+
+Run from the repository root:
+
+    python -m benchmarks.memory --experiments 50000 --files 10
+
+The references are the record classes as they were before: dataclasses with a per-instance
+`__dict__` and no interning of repeated strings. Experiments are measured both right after
+decoding, with the files never read, and after reading the files, which should retain
+the same memory.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, List
+from uuid import UUID
+
+from pyaqueduct.client.decoding import parse_datetime
+from pyaqueduct.client.experiment_types import ExperimentsInfo
+from pyaqueduct.client.task_types import TaskData
+from benchmarks.decoding import (
+    ReferenceExperiment,
+    ReferenceFile,
+    make_experiments,
+    make_tasks,
+)
+
+
+def reference_experiments(content: bytes) -> List[ReferenceExperiment]:
+    """Decode the listing into the reference records."""
+    return [
+        ReferenceExperiment(
+            uuid=UUID(data["uuid"]),
+            title=data["title"],
+            description=data["description"],
+            eid=data["eid"],
+            created_at=datetime.fromisoformat(data["createdAt"]),
+            updated_at=datetime.fromisoformat(data["updatedAt"]),
+            tags=data["tags"],
+            files=[
+                ReferenceFile(
+                    name=file["name"],
+                    path=file["path"],
+                    modified_at=datetime.fromisoformat(file["modifiedAt"]),
+                )
+                for file in data["files"]
+            ],
+        )
+        for data in json.loads(content)["experimentsData"]
+    ]
+
+
+def compact_experiments(content: bytes) -> List[Any]:
+    """Decode the listing into the client records without reading the files."""
+    return ExperimentsInfo.from_dict(json.loads(content)).experiments
+
+
+def read_files_experiments(content: bytes) -> List[Any]:
+    """Decode the listing into the client records and read the files."""
+    experiments = compact_experiments(content)
+    for experiment in experiments:
+        for file in experiment.files:
+            _ = file.name, file.path, file.modified_at
+    return experiments
+
+
+def reference_tasks(content: bytes) -> List[TaskData]:
+    """Decode the tasks without interning."""
+    return [
+        TaskData(
+            task_id=data["uuid"],
+            task_status=data["taskStatus"],
+            result_code=data["resultCode"],
+            extension_name=data["extensionName"],
+            action_name=data["actionName"],
+            created_by=data["createdBy"],
+            received_at=data["receivedAt"],
+            ended_at=data["endedAt"],
+            std_out=data["stdOut"],
+            std_err=data["stdErr"],
+        )
+        for data in json.loads(content)
+    ]
+
+
+def compact_tasks(content: bytes) -> List[TaskData]:
+    """Decode the tasks with the client."""
+    return [TaskData.from_dict(data) for data in json.loads(content)]
+
+
+def measure(name: str, records: int, decode: Callable[[bytes], Any], content: bytes) -> None:
+    """Print memory retained by the decoded records."""
+    parse_datetime.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    decoded = decode(content)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    print(f"{name:<40} {size / 2**20:9.1f} MiB {size / records:9.0f} bytes/record")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--experiments", type=int, default=50000)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=100000)
+    args = parser.parse_args()
+
+    experiments = json.dumps(make_experiments(args.experiments, args.files)).encode()
+    tasks = json.dumps(make_tasks(args.tasks)).encode()
+    print(f"{args.experiments} experiments with {args.files} files, {args.tasks} tasks")
+
+    measure("experiments, reference", args.experiments, reference_experiments, experiments)
+    measure("experiments, files never read", args.experiments, compact_experiments, experiments)
+    measure("experiments, files read", args.experiments, read_files_experiments, experiments)
+    measure("tasks, reference", args.tasks, reference_tasks, tasks)
+    measure("tasks", args.tasks, compact_tasks, tasks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of argument validation overhead of the API and experiment methods.
+
+Run from the repository root:
+
+    python -m benchmarks.validation --calls 100000
+
+The client is replaced with a stub answering immediately, so the timings show the cost
+of the Python layer only: argument validation and object construction.
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+from pyaqueduct.api import API
+from pyaqueduct.client import AqueductClient, ExperimentData
+from pyaqueduct.client.batch_types import BatchResult
+
+
+class StubClient(AqueductClient):
+    """Client answering without sending requests."""
+
+    def get_experiment(self, experiment_uuid: UUID, fields=None) -> ExperimentData:
+        return ExperimentData(uuid=experiment_uuid, eid="eid", created_at=datetime(2024, 1, 1))
+
+    def add_tags_to_experiment(self, experiment_uuid: UUID, tags: List[str]) -> ExperimentData:
+        return ExperimentData(uuid=experiment_uuid, eid="eid", created_at=datetime(2024, 1, 1))
+
+    def add_tags_to_experiments(
+        self, tags: Dict[UUID, List[str]], chunk_size: int = 100
+    ) -> BatchResult:
+        return BatchResult()
+
+
+def make_api(validate_arguments: bool) -> API:
+    """API object with the stub client."""
+    api = API(url="http://localhost", timeout=1, validate_arguments=validate_arguments)
+    api._client = StubClient(url="http://localhost", timeout=1)  # pylint: disable=protected-access
+    return api
+
+
+def report(name: str, calls: int, function, repeat: int) -> None:
+    """Print per call cost of the best of `repeat` runs."""
+    seconds = min(timeit.repeat(function, number=calls, repeat=repeat))
+    print(f"{name:<45} {seconds / calls * 1e6:9.2f} us/call")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--bulk", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    uuid = uuid4()
+    tags = ["tag1", "tag2"]
+    bulk_tags = {uuid4(): tags for _ in range(args.bulk)}
+    for validate_arguments in (True, False):
+        api = make_api(validate_arguments)
+        experiment = api.get_experiment_by_uuid(uuid)
+        suffix = "validated" if validate_arguments else "trusted"
+        report(
+            f"API.get_experiment_by_uuid, {suffix}",
+            args.calls,
+            lambda api=api: api.get_experiment_by_uuid(uuid),
+            args.repeat,
+        )
+        report(
+            f"Experiment.add_tags, {suffix}",
+            args.calls,
+            lambda experiment=experiment: experiment.add_tags(tags),
+            args.repeat,
+        )
+        report(
+            f"API.bulk_add_tags of {args.bulk}, {suffix}",
+            args.calls // args.bulk or 1,
+            lambda api=api: api.bulk_add_tags(bulk_tags),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
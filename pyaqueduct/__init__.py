@@ -1,8 +1,10 @@
 """Aqueduct Python Library."""
 
 from pyaqueduct.api import API
-from pyaqueduct.client import AqueductClient
+from pyaqueduct.async_api import AsyncAPI
+from pyaqueduct.client import AqueductClient, AsyncAqueductClient
 
 __all__ = [
     "AqueductClient",
+    "AsyncAqueductClient",
 ]
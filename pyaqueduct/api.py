@@ -3,32 +3,57 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import (
+    AwareDatetime,
     BaseModel,
     HttpUrl,
+    NonNegativeFloat,
     NonNegativeInt,
     PositiveFloat,
     PositiveInt,
     PrivateAttr,
-    validate_call,
 )
 
-from pyaqueduct.client import AqueductClient
+from pyaqueduct.arguments import client_arguments, experiment_filters
+from pyaqueduct.client import AqueductClient, BatchResult, ExperimentData
+from pyaqueduct.client.task_types import TASK_SUMMARY_FIELDS, TaskData
 from pyaqueduct.experiment import Experiment
-from pyaqueduct.extensions import Extension
-from pyaqueduct.settings import Settings
-from pyaqueduct.task import Task
+from pyaqueduct.extensions import Extension, ExtensionCatalogue
+from pyaqueduct.polling import Backoff, wait_for_tasks
+from pyaqueduct.store import LocalStore
+from pyaqueduct.table import Table
+from pyaqueduct.task import Task, TaskCursor, TaskSummary
+from pyaqueduct.validation import validate_call
 
 
-class API(BaseModel):
+class API(BaseModel):  # pylint: disable=too-many-public-methods
     """Aqueduct API interface to interact with experiments.
 
     Args:
         url: URL of the Aqueduct server including the prefix.
         timeout: Timeout of operations in seconds.
+        max_connections: Maximum number of concurrent connections to the server.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+        experiment_cache_ttl: Time in seconds for which experiment objects reuse
+            the fetched experiment data. Zero disables the caching.
+        eid_cache_size: Maximum number of EID to UUID mappings remembered from the fetched
+            experiments, so operations by EID can skip resolving it. Zero disables the cache.
+        validate_arguments: Validate and coerce arguments of the API and experiment object
+            methods. Disabling it saves the validation overhead in tight loops, but then
+            the arguments have to be of the annotated types already.
+        task_cache_size: Maximum number of tasks which data is kept in memory. Data of
+            finished tasks doesn't change, so it's reused until it's evicted.
+        task_cache_ttl: Time in seconds for which data of unfinished tasks is reused.
+            Zero disables the caching of unfinished tasks.
+        task_cache_path: Path of an SQLite database keeping data of finished tasks across
+            sessions. By default they are kept in memory only.
+        extension_cache_ttl: Time in seconds for which the fetched extension list is reused.
+            Zero fetches the list on every access.
+        extension_cache_path: Path of a JSON file keeping the fetched extension list across
+            sessions. By default it's kept in memory only.
 
     """
 
@@ -36,15 +61,42 @@ class API(BaseModel):
     timeout: PositiveFloat
 
     _client: AqueductClient = PrivateAttr()
+    _experiment_cache_ttl: float = PrivateAttr()
+    _validate_arguments: bool = PrivateAttr()
+    _extensions: ExtensionCatalogue = PrivateAttr()
 
-    def __init__(self, url: str, timeout: float = 0.5):
+    def __init__(  # pylint: disable=too-many-arguments, duplicate-code
+        self,
+        url: str,
+        timeout: float = 0.5,
+        max_connections: PositiveInt = 100,
+        max_keepalive_connections: NonNegativeInt = 20,
+        experiment_cache_ttl: NonNegativeFloat = 5.0,
+        eid_cache_size: NonNegativeInt = 1024,
+        validate_arguments: bool = True,
+        task_cache_size: NonNegativeInt = 4096,
+        task_cache_ttl: NonNegativeFloat = 1.0,
+        task_cache_path: Optional[str] = None,
+        extension_cache_ttl: NonNegativeFloat = 60.0,
+        extension_cache_path: Optional[str] = None,
+    ):
         super().__init__(url=url, timeout=timeout)
+        self._experiment_cache_ttl = experiment_cache_ttl
+        self._validate_arguments = validate_arguments
+        self._client = AqueductClient(
+            **client_arguments(url, timeout, max_connections, max_keepalive_connections),
+            eid_cache_size=eid_cache_size,
+            task_cache_size=task_cache_size,
+            task_cache_ttl=task_cache_ttl,
+            task_cache_path=task_cache_path,
+        )
+        self._extensions = ExtensionCatalogue(
+            client=self._client, ttl=extension_cache_ttl, path=extension_cache_path
+        )
 
-        if not url.endswith("/"):
-            url = url + "/"
-        api_url = f"{url}api"
-
-        self._client = AqueductClient(url=api_url, timeout=timeout, api_token=Settings().api_token)
+    def close(self) -> None:
+        """Close the connections held by the API object."""
+        self._client.close()
 
     @validate_call
     def create_experiment(
@@ -64,12 +116,7 @@ class API(BaseModel):
         """
 
         experiment_data = self._client.create_experiment(title=title, description=description)
-        return Experiment(
-            client=self._client,
-            uuid=experiment_data.uuid,
-            eid=experiment_data.eid,
-            created_at=experiment_data.created_at,
-        )
+        return self._make_experiment(experiment_data)
 
     @validate_call
     def get_experiment_by_eid(self, eid: str) -> Experiment:
@@ -83,12 +130,7 @@ class API(BaseModel):
 
         """
         experiment_data = self._client.get_experiment_by_eid(eid=eid)
-        return Experiment(
-            client=self._client,
-            uuid=experiment_data.uuid,
-            eid=experiment_data.eid,
-            created_at=experiment_data.created_at,
-        )
+        return self._make_experiment(experiment_data)
 
     @validate_call
     def get_experiment_by_uuid(self, uuid: UUID) -> Experiment:
@@ -102,11 +144,162 @@ class API(BaseModel):
 
         """
         experiment_data = self._client.get_experiment(experiment_uuid=uuid)
+        return self._make_experiment(experiment_data)
+
+    @validate_call
+    def get_experiments_by_uuids(
+        self, uuids: List[UUID], chunk_size: PositiveInt = 100
+    ) -> BatchResult:
+        """Get many experiments by UUID. Experiments are requested in chunks, each chunk
+        takes a single request to the server.
+
+        Args:
+            uuids: UUIDs of the experiments.
+            chunk_size: Maximum number of experiments fetched in a single request.
+
+        Returns:
+            Experiment objects keyed by UUID in `succeeded` and error messages
+            for the experiments which couldn't be fetched in `failed`.
+
+        """
+        return self._to_experiments(
+            self._client.get_experiments_by_uuids(experiment_uuids=uuids, chunk_size=chunk_size)
+        )
+
+    @validate_call
+    def get_experiments_by_eids(
+        self, eids: List[str], chunk_size: PositiveInt = 100
+    ) -> BatchResult:
+        """Get many experiments by EID. Experiments are requested in chunks, each chunk
+        takes a single request to the server.
+
+        Args:
+            eids: EIDs of the experiments.
+            chunk_size: Maximum number of experiments fetched in a single request.
+
+        Returns:
+            Experiment objects keyed by EID in `succeeded` and error messages
+            for the experiments which couldn't be fetched in `failed`.
+
+        """
+        return self._to_experiments(
+            self._client.get_experiments_by_eids(eids=eids, chunk_size=chunk_size)
+        )
+
+    @validate_call
+    def bulk_add_tags(
+        self, tags: Dict[UUID, List[str]], chunk_size: PositiveInt = 100
+    ) -> BatchResult:
+        """Add tags to many experiments. Mutations are sent in chunks, each chunk
+        takes a single request to the server.
+
+        Args:
+            tags: Lists of tags to add keyed by UUID of the experiment.
+            chunk_size: Maximum number of mutations sent in a single request.
+
+        Returns:
+            Updated experiment objects keyed by UUID in `succeeded` and error messages
+            for the experiments which couldn't be updated in `failed`.
+
+        """
+        return self._to_experiments(
+            self._client.add_tags_to_experiments(tags=tags, chunk_size=chunk_size)
+        )
+
+    @validate_call
+    def bulk_remove_tags(
+        self, tags: Dict[UUID, List[str]], chunk_size: PositiveInt = 100
+    ) -> BatchResult:
+        """Remove tags from many experiments. Mutations are sent in chunks, each chunk
+        takes a single request to the server.
+
+        Args:
+            tags: Lists of tags to remove keyed by UUID of the experiment.
+            chunk_size: Maximum number of mutations sent in a single request.
+
+        Returns:
+            Updated experiment objects keyed by UUID in `succeeded` and error messages
+            for the experiments which couldn't be updated in `failed`.
+
+        """
+        return self._to_experiments(
+            self._client.remove_tags_from_experiments(tags=tags, chunk_size=chunk_size)
+        )
+
+    @validate_call
+    def bulk_update(
+        self,
+        updates: Dict[UUID, Dict[Literal["title", "description"], str]],
+        chunk_size: PositiveInt = 100,
+    ) -> BatchResult:
+        """Update title or description of many experiments. Mutations are sent in chunks,
+        each chunk takes a single request to the server.
+
+        Args:
+            updates: Dictionaries with new `title` and `description` keyed by UUID
+                of the experiment.
+            chunk_size: Maximum number of mutations sent in a single request.
+
+        Returns:
+            Updated experiment objects keyed by UUID in `succeeded` and error messages
+            for the experiments which couldn't be updated in `failed`.
+
+        """
+        return self._to_experiments(
+            self._client.update_experiments(updates=updates, chunk_size=chunk_size)
+        )
+
+    @validate_call
+    def bulk_remove(self, uuids: List[UUID], chunk_size: PositiveInt = 100) -> BatchResult:
+        """Remove many experiments from the database together with their files.
+        Mutations are sent in chunks, each chunk takes a single request to the server.
+
+        Args:
+            uuids: UUIDs of the experiments.
+            chunk_size: Maximum number of mutations sent in a single request.
+
+        Returns:
+            UUIDs of removed experiments in `succeeded` and error messages for the
+            experiments which couldn't be removed in `failed`.
+
+        """
+        return self._client.remove_experiments(experiment_uuids=uuids, chunk_size=chunk_size)
+
+    def _to_experiments(self, result: BatchResult) -> BatchResult:
+        return BatchResult(
+            succeeded={
+                key: self._make_experiment(experiment_data)
+                for key, experiment_data in result.succeeded.items()
+            },
+            failed=result.failed,
+        )
+
+    @staticmethod
+    def _experiment_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+        # identifiers are needed to construct experiment objects
+        return None if fields is None else [*fields, "eid", "created_at"]
+
+    def _make_experiment(
+        self, experiment_data: ExperimentData, fields: Optional[List[str]] = None
+    ) -> Experiment:
+        if not self._validate_arguments:
+            # the data was decoded from the server response, nothing to validate
+            return Experiment.from_data(
+                self._client,
+                experiment_data,
+                fields,
+                cache_ttl=self._experiment_cache_ttl,
+                validate_arguments=False,
+            )
         return Experiment(
             client=self._client,
             uuid=experiment_data.uuid,
             eid=experiment_data.eid,
             created_at=experiment_data.created_at,
+            snapshot=experiment_data,
+            snapshot_fields=fields,
+            cache_ttl=self._experiment_cache_ttl,
+            validate_arguments=self._validate_arguments,
         )
 
     @validate_call
@@ -117,11 +310,10 @@ class API(BaseModel):
             eid: EID of the specified experiment.
 
         """
-        experiment_data = self._client.get_experiment_by_eid(eid=eid)
-        self._client.remove_experiment(experiment_uuid=experiment_data.uuid)
+        self._client.remove_experiment(experiment_uuid=self._client.resolve_eid(eid))
 
     @validate_call
-    def find_experiments(
+    def find_experiments(  # pylint: disable=too-many-arguments, duplicate-code
         self,
         search: Optional[str] = None,
         limit: PositiveInt = 10,
@@ -129,6 +321,7 @@ class API(BaseModel):
         tags: Optional[List[str]] = None,
         start_datetime: Optional[datetime] = None,
         end_datetime: Optional[datetime] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Experiment]:
         """Find the experiments that have the search criteria provided in arguments.
 
@@ -139,71 +332,202 @@ class API(BaseModel):
             tags: List of tags to filter the experiments by.
             start_datetime: Start datetime to filter the experiments after this date and time.
             end_datetime: End datetime to filter the experiments before this date and time.
+            fields: Names of experiment data fields to fetch, e.g. `["title", "tags"]`.
+                All fields are fetched by default. The other fields are fetched on access.
 
         Returns:
-            List of experiment objects to operate on their data.
+            List of experiment objects to operate on their data. The objects are populated
+            with the data of the search results, so reading their properties doesn't
+            require further requests until the cached data expires.
 
         """
+        fields = self._experiment_fields(fields)
         experiments = self._client.get_experiments(
-            title=search,
             limit=limit,
             offset=offset,
-            tags=tags,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
+            fields=fields,
+            **experiment_filters(search, tags, start_datetime, end_datetime),
         ).experiments
-        return [
-            Experiment(
-                client=self._client,
-                uuid=experiment.uuid,
-                eid=experiment.eid,
-                created_at=experiment.created_at,
+        return [self._make_experiment(experiment, fields) for experiment in experiments]
+
+    @validate_call
+    def iter_experiments(  # pylint: disable=too-many-arguments
+        self,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        page_size: PositiveInt = 100,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Experiment]:
+        """Iterate over all the experiments that have the search criteria provided in arguments.
+        Experiments are fetched page by page, the next page is requested in background while
+        the current one is being processed.
+
+        Args:
+            search: The string to search for in the title field of experiments.
+            tags: List of tags to filter the experiments by.
+            start_datetime: Start datetime to filter the experiments after this date and time.
+            end_datetime: End datetime to filter the experiments before this date and time.
+            page_size: The number of experiments to fetch in a single request.
+            fields: Names of experiment data fields to fetch, e.g. `["title", "tags"]`.
+                All fields are fetched by default. The other fields are fetched on access.
+
+        Returns:
+            Iterator over experiment objects to operate on their data.
+
+        """
+        fields = self._experiment_fields(fields)
+        for page in self._client.iter_experiment_pages(
+            page_size=page_size,
+            fields=fields,
+            **experiment_filters(search, tags, start_datetime, end_datetime),
+        ):
+            for experiment in page.experiments:
+                yield self._make_experiment(experiment, fields)
+
+    @validate_call
+    def scan_experiments(  # pylint: disable=too-many-arguments
+        self,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        page_size: PositiveInt = 100,
+        max_workers: PositiveInt = 8,
+        fields: Optional[List[str]] = None,
+    ) -> List[Experiment]:
+        """Get all the experiments that have the search criteria provided in arguments.
+        Pages of the search results are fetched concurrently, which makes it faster than
+        `iter_experiments` for large scans, but all the results are held in memory.
+
+        Args:
+            search: The string to search for in the title field of experiments.
+            tags: List of tags to filter the experiments by.
+            start_datetime: Start datetime to filter the experiments after this date and time.
+            end_datetime: End datetime to filter the experiments before this date and time.
+            page_size: The number of experiments to fetch in a single request.
+            max_workers: The maximum number of concurrent requests.
+            fields: Names of experiment data fields to fetch, e.g. `["title", "tags"]`.
+                All fields are fetched by default. The other fields are fetched on access.
+
+        Returns:
+            List of unique experiment objects in the order of the search results.
+
+        """
+        fields = self._experiment_fields(fields)
+        experiments = self._client.scan_experiments(
+            page_size=page_size,
+            max_workers=max_workers,
+            fields=fields,
+            **experiment_filters(search, tags, start_datetime, end_datetime),
+        )
+        return [self._make_experiment(experiment, fields) for experiment in experiments]
+
+    @validate_call
+    def export_experiments(  # pylint: disable=too-many-arguments
+        self,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        page_size: PositiveInt = 1000,
+        fields: Optional[List[str]] = None,
+    ) -> Table:
+        """Get all the experiments that have the search criteria provided in arguments
+        as a table. The columns are filled directly from the response pages, which is much
+        cheaper than creating an experiment object per result for large listings.
+
+        Args:
+            search: The string to search for in the title field of experiments.
+            tags: List of tags to filter the experiments by.
+            start_datetime: Start datetime to filter the experiments after this date and time.
+            end_datetime: End datetime to filter the experiments before this date and time.
+            page_size: The number of experiments to fetch in a single request.
+            fields: Names of experiment data fields to export as columns, e.g.
+                `["created_at", "tags"]`. All fields are exported by default, `uuid` column
+                is always present. The `files` column holds the file names.
+
+        Returns:
+            Table of the experiments in the order of the search results.
+
+        """
+        return Table(
+            self._client.get_experiment_columns(
+                page_size=page_size,
+                fields=fields,
+                **experiment_filters(search, tags, start_datetime, end_datetime),
             )
-            for experiment in experiments
-        ]
+        )
+
+    @validate_call
+    def open_local_store(
+        self, path: str, page_size: PositiveInt = 100, max_workers: PositiveInt = 8
+    ) -> LocalStore:
+        """Open a local SQLite copy of the experiment metadata. Call `sync()` of the store to
+        fetch the experiments changed since the previous sync, then query it without
+        requests to the server.
+
+        Args:
+            path: Path of the database file. It's created if it doesn't exist.
+            page_size: The number of experiments to list in a single request during sync.
+            max_workers: The maximum number of concurrent requests during sync.
+
+        Returns:
+            Local store object.
+
+        """
+        return LocalStore(
+            path=path, client=self._client, page_size=page_size, max_workers=max_workers
+        )
 
     @validate_call
     def get_extensions(self) -> List[Extension]:
-        """Gets the current fresh extension list from the server.
-        Extension list may change without server restart.
+        """Gets the extension list from the server. Extension list may change without
+        server restart, so the fetched list is reused for `extension_cache_ttl` seconds
+        only. Call `invalidate_extensions()` to fetch it again on the next access.
 
         Returns:
             List of extension objects.
         """
-        return [
-            Extension(
-                name=extension_data.name,
-                description=extension_data.description,
-                authors=extension_data.authors,
-                actions=extension_data.actions,
-                client=self._client,
-            )
-            for extension_data in self._client.get_extensions()
-        ]
+        return self._extensions.get_extensions()
+
+    @validate_call
+    def get_extension(self, name: str) -> Extension:
+        """Get the extension by its name from the cached extension list, which is fetched
+        like in `get_extensions()`. Actions of the extension are looked up by name with
+        `Extension.action()`, e.g. `api.get_extension("name").action("action")`.
+
+        Args:
+            name: Name of the extension.
+
+        Returns:
+            Extension object.
+        """
+        return self._extensions.get_extension(name)
+
+    def invalidate_extensions(self) -> None:
+        """Drop the cached extension list, so it's fetched again on the next access."""
+        self._extensions.invalidate()
 
     @validate_call
     def get_task(
         self,
         task_id: UUID,
+        fields: Optional[List[str]] = None,
     ) -> Task:
         """Get task by passing task_id.
 
+        Args:
+            task_id: Identifier of the task.
+            fields: Names of task data fields to fetch, e.g. `["task_status"]`.
+                All fields are fetched by default.
+
         Returns:
             Task object
         """
-        task = self._client.get_task(
-            task_id=task_id
-        )
-        return Task(
-            client=self._client,
-            uuid=task_id,
-            created_by=task.created_by,
-            received_at=task.received_at,
-            experiment=task.experiment,
-            extension_name=task.extension_name,
-            action_name=task.action_name,
-            parameters=task.parameters,
-        )
+        task = self._client.get_task(task_id=task_id, fields=fields)
+        return self._make_task(task)
 
     @validate_call
     def get_tasks(  # pylint: disable=too-many-arguments, duplicate-code
@@ -216,11 +540,67 @@ class API(BaseModel):
         username: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Task]:
-        """Get task by passing task_id.
+        """Get tasks with the filters provided in arguments.
+
+        Args:
+            limit: The maximum number of tasks to fetch in a single request.
+            offset: The number of tasks to skip from the beginning of the results.
+            extension_name: Name of the extension the tasks belong to.
+            experiment_uuid: UUID of the experiment the tasks were run for.
+            action_name: Name of the action the tasks ran.
+            username: Name of the user who ran the tasks.
+            start_date: Start datetime to filter the tasks received after it.
+            end_date: End datetime to filter the tasks received before it.
+            fields: Names of task data fields to fetch, e.g. `["task_status", "ended_at"]`.
+                All fields are fetched by default. Omitting `std_out`, `std_err` and
+                `experiment` considerably reduces the response size.
 
         Returns:
-            Task object
+            List of task objects.
+        """
+        tasks = self._client.get_tasks(
+            limit=limit,
+            offset=offset,
+            extension_name=extension_name,
+            experiment_uuid=experiment_uuid,
+            action_name=action_name,
+            username=username,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+        )
+        return [self._make_task(task) for task in tasks]
+
+    @validate_call
+    def get_task_summaries(  # pylint: disable=too-many-arguments, duplicate-code
+        self,
+        limit: PositiveInt = 10,
+        offset: NonNegativeInt = 0,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TaskSummary]:
+        """Get summaries of the tasks with the filters provided in arguments. Summaries omit
+        logs, experiment and parameters of the tasks, so the response stays small even for
+        tasks with long output. Logs of a task are fetched when they're read.
+
+        Args:
+            limit: The maximum number of tasks to fetch in a single request.
+            offset: The number of tasks to skip from the beginning of the results.
+            extension_name: Name of the extension the tasks belong to.
+            experiment_uuid: UUID of the experiment the tasks were run for.
+            action_name: Name of the action the tasks ran.
+            username: Name of the user who ran the tasks.
+            start_date: Start datetime to filter the tasks received after it.
+            end_date: End datetime to filter the tasks received before it.
+
+        Returns:
+            List of task summary objects.
         """
         tasks = self._client.get_tasks(
             limit=limit,
@@ -231,17 +611,163 @@ class API(BaseModel):
             username=username,
             start_date=start_date,
             end_date=end_date,
+            fields=TASK_SUMMARY_FIELDS,
         )
-        return [
-            Task(
-                client=self._client,
-                uuid=task.task_id,
-                created_by=task.created_by,
-                received_at=task.received_at,
-                experiment=task.experiment,
-                extension_name=task.extension_name,
-                action_name=task.action_name,
-                parameters=task.parameters
+        return [TaskSummary.from_data(self._client, task) for task in tasks]
+
+    @validate_call
+    def export_tasks(  # pylint: disable=too-many-arguments, duplicate-code
+        self,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page_size: PositiveInt = 1000,
+        fields: Optional[List[str]] = None,
+    ) -> Table:
+        """Get all the tasks with the filters provided in arguments as a table.
+        The columns are filled directly from the response pages.
+
+        Args:
+            extension_name: Name of the extension the tasks belong to.
+            experiment_uuid: UUID of the experiment the tasks were run for.
+            action_name: Name of the action the tasks ran.
+            username: Name of the user who ran the tasks.
+            start_date: Start datetime to filter the tasks received after it.
+            end_date: End datetime to filter the tasks received before it.
+            page_size: The number of tasks to fetch in a single request.
+            fields: Names of task data fields to export as columns, e.g.
+                `["task_status", "received_at", "ended_at"]`. All fields except `std_out`,
+                `std_err` and `parameters` are exported by default, `task_id` column is always
+                present. Parameters can't be exported. The experiment is exported as its UUID
+                in `experiment_uuid` column.
+
+        Returns:
+            Table of the tasks in the server order.
+
+        """
+        return Table(
+            self._client.get_task_columns(
+                page_size=page_size,
+                extension_name=extension_name,
+                experiment_uuid=experiment_uuid,
+                action_name=action_name,
+                username=username,
+                start_date=start_date,
+                end_date=end_date,
+                fields=fields,
             )
-            for task in tasks
-        ]
+        )
+
+    @validate_call
+    def iter_new_tasks(  # pylint: disable=too-many-arguments
+        self,
+        since: Union[TaskCursor, AwareDatetime, None] = None,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        page_size: PositiveInt = 100,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Task]:
+        """Iterate over the tasks received after the cursor, from the oldest to the newest.
+        Only the tasks received since the cursor time are requested, the ones consumed
+        already are skipped, also when they're repeated at page boundaries.
+
+        The cursor passed in `since` is advanced past every yielded task, so it can be
+        saved with `TaskCursor.save()` and used in the next run to get the newer tasks only:
+
+        ```python
+        cursor = TaskCursor.load("cursor.json")
+        for task in api.iter_new_tasks(since=cursor):
+            ...
+        cursor.save("cursor.json")
+        ```
+
+        Args:
+            since: Cursor or receiving time (timezone aware) to start after. `None` starts
+                from the first task.
+            extension_name: Name of the extension the tasks belong to.
+            experiment_uuid: UUID of the experiment the tasks were run for.
+            action_name: Name of the action the tasks ran.
+            username: Name of the user who ran the tasks.
+            page_size: The number of tasks to fetch in a single request.
+            fields: Names of task data fields to fetch, e.g. `["task_status"]`. All fields
+                are fetched by default, `received_at` is always fetched.
+
+        Returns:
+            Iterator over task objects.
+        """
+        cursor = since if isinstance(since, TaskCursor) else TaskCursor(received_at=since)
+        tasks = self._client.get_tasks_since(
+            start_date=cursor.received_at,
+            page_size=page_size,
+            extension_name=extension_name,
+            experiment_uuid=experiment_uuid,
+            action_name=action_name,
+            username=username,
+            fields=fields,
+        )
+        new_tasks = sorted(
+            (task for task in tasks if task.received_at is not None and cursor.is_new(task)),
+            key=lambda task: (task.received_at, str(task.task_id)),
+        )
+        for task in new_tasks:
+            cursor.advance(task)
+            yield self._make_task(task)
+
+    @validate_call
+    def as_completed(
+        self,
+        tasks: List[Union[Task, TaskSummary]],
+        timeout: Optional[NonNegativeFloat] = None,
+        backoff: Optional[Backoff] = None,
+    ) -> Iterator[TaskData]:
+        """Wait for the tasks to finish, yielding each one as soon as it's finished.
+        Every poll fetches the status of all the outstanding tasks in a single request,
+        with growing intervals between the polls. Finished tasks aren't polled anymore,
+        their full data is fetched once.
+
+        Args:
+            tasks: Tasks to wait for.
+            timeout: Maximum time to wait in seconds, `None` waits without limit.
+                `TaskTimeoutError` is raised when it expires.
+            backoff: Polling intervals, the default ones if not given.
+
+        Returns:
+            Iterator over the data of the finished tasks in the order of completion.
+        """
+        return wait_for_tasks(
+            self._client, [task.uuid for task in tasks], timeout=timeout, backoff=backoff
+        )
+
+    @validate_call
+    def wait_tasks(
+        self,
+        tasks: List[Union[Task, TaskSummary]],
+        timeout: Optional[NonNegativeFloat] = None,
+        backoff: Optional[Backoff] = None,
+    ) -> List[TaskData]:
+        """Wait for all the tasks to finish, polling them like `as_completed()` does.
+
+        Args:
+            tasks: Tasks to wait for.
+            timeout: Maximum time to wait in seconds, `None` waits without limit.
+                `TaskTimeoutError` is raised when it expires.
+            backoff: Polling intervals, the default ones if not given.
+
+        Returns:
+            Data of the finished tasks in the order of the given tasks.
+        """
+        finished = {
+            task.task_id: task
+            for task in wait_for_tasks(
+                self._client, [task.uuid for task in tasks], timeout=timeout, backoff=backoff
+            )
+        }
+        return [finished[task.uuid] for task in tasks]
+
+    def _make_task(self, task: TaskData) -> Task:
+        return Task.from_data(self._client, task)
@@ -0,0 +1,59 @@
+"""Arguments shared by the synchronous and asynchronous API."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pyaqueduct.settings import Settings
+
+
+def client_arguments(
+    url: str, timeout: float, max_connections: int, max_keepalive_connections: int
+) -> Dict[str, Any]:
+    """Arguments of the client connecting to the API of the Aqueduct server. The API token
+    is read from the environment.
+
+    Args:
+        url: URL of the Aqueduct server including the prefix.
+        timeout: Timeout of operations in seconds.
+        max_connections: Maximum number of concurrent connections to the server.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+
+    Returns:
+        Keyword arguments of the client.
+
+    """
+    if not url.endswith("/"):
+        url = url + "/"
+    return {
+        "url": f"{url}api",
+        "timeout": timeout,
+        "api_token": Settings().api_token,
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+    }
+
+
+def experiment_filters(
+    search: Optional[str],
+    tags: Optional[List[str]],
+    start_datetime: Optional[datetime],
+    end_datetime: Optional[datetime],
+) -> Dict[str, Any]:
+    """Filters of the client experiment queries matching the search criteria of the API.
+
+    Args:
+        search: The string to search for in the title field of experiments.
+        tags: List of tags to filter the experiments by.
+        start_datetime: Start datetime to filter the experiments after this date and time.
+        end_datetime: End datetime to filter the experiments before this date and time.
+
+    Returns:
+        Keyword arguments of the client queries.
+
+    """
+    return {
+        "title": search,
+        "tags": tags,
+        "start_datetime": start_datetime,
+        "end_datetime": end_datetime,
+    }
@@ -0,0 +1,352 @@
+"""Aqueduct asynchronous application programming interface (API) module."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    HttpUrl,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    PrivateAttr,
+)
+
+from pyaqueduct.arguments import client_arguments, experiment_filters
+from pyaqueduct.client.async_client import AsyncAqueductClient
+from pyaqueduct.client.experiment_types import ExperimentData
+from pyaqueduct.client.extension_types import (
+    ExtensionCancelResultData,
+    ExtensionData,
+    ExtensionExecutionResultData,
+)
+from pyaqueduct.client.task_types import TaskData
+from pyaqueduct.validation import validate_call
+
+
+class AsyncAPI(BaseModel):
+    """Aqueduct asyncio API interface to interact with experiments, extensions and tasks.
+
+    Every method is a coroutine. Experiments and tasks are returned as data records and
+    are addressed by their UUID in the subsequent operations.
+
+    Args:
+        url: URL of the Aqueduct server including the prefix.
+        timeout: Timeout of operations in seconds.
+        max_connections: Maximum number of concurrent connections to the server.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+        validate_arguments: Validate and coerce arguments of the methods. Disabling it saves
+            the validation overhead, but then the arguments have to be of the annotated
+            types already.
+
+    """
+
+    url: HttpUrl
+    timeout: PositiveFloat
+
+    _client: AsyncAqueductClient = PrivateAttr()
+    _validate_arguments: bool = PrivateAttr()
+
+    def __init__(  # pylint: disable=duplicate-code
+        self,
+        url: str,
+        timeout: float = 0.5,
+        max_connections: PositiveInt = 100,
+        max_keepalive_connections: NonNegativeInt = 20,
+        validate_arguments: bool = True,
+    ):
+        super().__init__(url=url, timeout=timeout)
+        self._validate_arguments = validate_arguments
+        self._client = AsyncAqueductClient(
+            **client_arguments(url, timeout, max_connections, max_keepalive_connections)
+        )
+
+    async def close(self) -> None:
+        """Close the connections held by the API object."""
+        await self._client.close()
+
+    async def __aenter__(self) -> AsyncAPI:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @validate_call
+    async def create_experiment(
+        self,
+        title: str,
+        description: str,
+        tags: Optional[List[str]] = None,
+    ) -> ExperimentData:
+        """Create an experiment with specific title and description.
+
+        Args:
+            title: Title of the experiment.
+            description: Description of the experiment.
+            tags: List of tags to assign to the experiment.
+
+        Returns:
+            Data of the created experiment.
+
+        """
+        return await self._client.create_experiment(
+            title=title, description=description, tags=tags
+        )
+
+    @validate_call
+    async def get_experiment_by_eid(self, eid: str) -> ExperimentData:
+        """Get the experiment by the specified identifier.
+
+        Args:
+            eid: EID of the specified experiment.
+
+        Returns:
+            Data of the experiment.
+
+        """
+        return await self._client.get_experiment_by_eid(eid=eid)
+
+    @validate_call
+    async def get_experiment_by_uuid(self, uuid: UUID) -> ExperimentData:
+        """Get the experiment by the specified identifier.
+
+        Args:
+            uuid: UUID of the specified experiment.
+
+        Returns:
+            Data of the experiment.
+
+        """
+        return await self._client.get_experiment(experiment_uuid=uuid)
+
+    @validate_call
+    async def update_experiment(
+        self, uuid: UUID, title: Optional[str] = None, description: Optional[str] = None
+    ) -> ExperimentData:
+        """Update title, description or both for the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            title: New title of the experiment.
+            description: New description of the experiment.
+
+        Returns:
+            Updated data of the experiment.
+
+        """
+        return await self._client.update_experiment(
+            experiment_uuid=uuid, title=title, description=description
+        )
+
+    @validate_call
+    async def add_tags(self, uuid: UUID, tags: List[str]) -> ExperimentData:
+        """Add new tags to the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            tags: List of tags to be added to the experiment.
+
+        Returns:
+            Updated data of the experiment.
+
+        """
+        return await self._client.add_tags_to_experiment(experiment_uuid=uuid, tags=tags)
+
+    @validate_call
+    async def remove_tag(self, uuid: UUID, tag: str) -> ExperimentData:
+        """Remove tag from the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            tag: Tag to be removed from the experiment.
+
+        Returns:
+            Updated data of the experiment.
+
+        """
+        return await self._client.remove_tag_from_experiment(experiment_uuid=uuid, tag=tag)
+
+    @validate_call
+    async def get_tags(
+        self, limit: PositiveInt = 10, offset: NonNegativeInt = 0, dangling: bool = True
+    ) -> List[str]:
+        """Get existing tags.
+
+        Args:
+            limit: The maximum number of tags to fetch in a single request.
+            offset: The number of tags to skip.
+            dangling: Include tags which are not linked to any experiment.
+
+        Returns:
+            List of tags.
+
+        """
+        tags = await self._client.get_tags(limit=limit, offset=offset, dangling=dangling)
+        return tags.tags
+
+    @validate_call
+    async def remove_experiment_by_uuid(self, uuid: UUID) -> None:
+        """Remove experiment from the database. Experiment's files will be also removed.
+
+        Args:
+            uuid: UUID of the specified experiment.
+
+        """
+        await self._client.remove_experiment(experiment_uuid=uuid)
+
+    @validate_call
+    async def remove_experiment_by_eid(self, eid: str) -> None:
+        """Remove experiment from the database. Experiment's files will be also removed.
+
+        Args:
+            eid: EID of the specified experiment.
+
+        """
+        experiment_data = await self._client.get_experiment_by_eid(eid=eid)
+        await self._client.remove_experiment(experiment_uuid=experiment_data.uuid)
+
+    @validate_call
+    async def find_experiments(  # pylint: disable=duplicate-code
+        self,
+        search: Optional[str] = None,
+        limit: PositiveInt = 10,
+        offset: NonNegativeInt = 0,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+    ) -> List[ExperimentData]:
+        """Find the experiments that have the search criteria provided in arguments.
+
+        Args:
+            search: The string to search for in the title field of experiments.
+            limit: The maximum number of experiments to fetch in a single request.
+            offset: The number of experiments to skip from the beginning of the search results.
+            tags: List of tags to filter the experiments by.
+            start_datetime: Start datetime to filter the experiments after this date and time.
+            end_datetime: End datetime to filter the experiments before this date and time.
+
+        Returns:
+            List of experiments data.
+
+        """
+        experiments = await self._client.get_experiments(
+            limit=limit,
+            offset=offset,
+            **experiment_filters(search, tags, start_datetime, end_datetime),
+        )
+        return experiments.experiments
+
+    @validate_call
+    async def upload_file(self, uuid: UUID, file: str) -> None:
+        """Upload the specified file to the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            file: Local path of the file.
+
+        """
+        await self._client.upload_file(experiment_uuid=uuid, file=file)
+
+    @validate_call
+    async def download_file(self, uuid: UUID, file_name: str, destination_dir: str) -> None:
+        """Download the specified file of the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            file_name: Name of the file in the experiment.
+            destination_dir: Local directory to save the file to.
+
+        """
+        await self._client.download_file(
+            experiment_uuid=uuid, file_name=file_name, destination_dir=destination_dir
+        )
+
+    @validate_call
+    async def remove_files(self, uuid: UUID, files: List[str]) -> None:
+        """Remove files from the experiment.
+
+        Args:
+            uuid: UUID of the experiment.
+            files: List of file names to be removed from the experiment.
+
+        """
+        await self._client.remove_files_from_experiment(experiment_uuid=uuid, files=files)
+
+    @validate_call
+    async def get_extensions(self) -> List[ExtensionData]:
+        """Gets the current fresh extension list from the server.
+
+        Returns:
+            List of extension definitions.
+        """
+        return await self._client.get_extensions()
+
+    @validate_call
+    async def execute_extension_action(
+        self, extension: str, action: str, parameters: Dict[str, Any]
+    ) -> ExtensionExecutionResultData:
+        """Execute an extension action on a server.
+
+        Args:
+            extension: Name of the extension.
+            action: Name of the action within the extension.
+            parameters: Dictionary of parameters to pass to the action.
+
+        Returns:
+            Result of the extension execution. `returnCode==0` corresponds to success.
+        """
+        return await self._client.execute_extension_action(
+            extension=extension, action=action, params=parameters
+        )
+
+    @validate_call
+    async def get_task(self, task_id: UUID) -> TaskData:
+        """Get task by passing task_id.
+
+        Returns:
+            Task data.
+        """
+        return await self._client.get_task(task_id=task_id)
+
+    @validate_call
+    async def get_tasks(  # pylint: disable=too-many-arguments, duplicate-code
+        self,
+        limit: PositiveInt = 10,
+        offset: NonNegativeInt = 0,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[TaskData]:
+        """Get tasks with the filters provided in arguments.
+
+        Returns:
+            List of task data.
+        """
+        return await self._client.get_tasks(
+            limit=limit,
+            offset=offset,
+            extension_name=extension_name,
+            experiment_uuid=experiment_uuid,
+            action_name=action_name,
+            username=username,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    @validate_call
+    async def cancel_task(self, task_id: UUID) -> ExtensionCancelResultData:
+        """Cancel or revoke an executing task.
+
+        Args:
+            task_id: Task identifier.
+
+        Returns:
+            Cancellation result.
+        """
+        return await self._client.cancel_task(task_id=str(task_id))
@@ -0,0 +1,519 @@
+"""Asynchronous Aqueduct client class to enable experiment based operations."""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from gql import Client
+from gql.client import AsyncClientSession
+from gql.transport.httpx import HTTPXAsyncTransport
+from graphql import DocumentNode
+from httpx import AsyncClient as AsyncHTTPClient
+from httpx import TransportError, codes
+from pydantic import BaseModel, HttpUrl, PrivateAttr
+
+from pyaqueduct.client.decoding import FastJSONResultMixin
+from pyaqueduct.client.experiment_types import ExperimentData, ExperimentsInfo, TagsData
+from pyaqueduct.client.extension_types import (
+    ExtensionCancelResultData,
+    ExtensionData,
+    ExtensionExecutionResultData,
+)
+from pyaqueduct.client.operations import (
+    experiment_request,
+    experiments_request,
+    extension_action_variables,
+    graphql_errors,
+    http_client_arguments,
+    log_experiments_page,
+    log_extension_result,
+    process_response_common,
+    tags_from_response,
+    tags_request,
+    task_filters,
+    task_request,
+    tasks_document,
+)
+from pyaqueduct.client.task_types import TaskData
+from pyaqueduct.exceptions import FileDownloadError, FileRemovalError, FileUploadError
+from pyaqueduct.schemas.mutations import (
+    add_tags_to_experiment_mutation,
+    cancel_task_mutation,
+    create_experiment_mutation,
+    execute_extension_action_mutation,
+    remove_experiment_mutation,
+    remove_tag_from_experiment_mutation,
+    update_experiment_mutation,
+)
+from pyaqueduct.schemas.queries import get_all_extensions_query, get_tasks_query
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+class SharedHTTPXAsyncTransport(  # pylint: disable=abstract-method
+    FastJSONResultMixin, HTTPXAsyncTransport
+):
+    """Asynchronous GraphQL transport which sends requests through an externally owned
+    HTTP client. The transport is connected from construction and never closes the client.
+    """
+
+    def __init__(self, url: str, http_client: AsyncHTTPClient, **kwargs):
+        super().__init__(url=url, **kwargs)
+        self._http_client = http_client
+        self.client = http_client
+
+    async def connect(self):
+        self.client = self._http_client
+
+    async def close(self):
+        self.client = None
+
+
+class AsyncAqueductClient(BaseModel):
+    """
+    AsyncAqueductClient - An asyncio client class for managing experiments, tags, files,
+    extensions and tasks.
+
+    It mirrors the operations of `AqueductClient`, but every operation is a coroutine, so
+    a single event loop can drive many concurrent requests over one connection pool.
+
+    """
+
+    url: HttpUrl
+    timeout: float
+    _gql_client: Client = PrivateAttr()
+    _session: AsyncClientSession = PrivateAttr()
+    _http_client: AsyncHTTPClient = PrivateAttr()
+    _headers: Dict[str, str] = PrivateAttr()
+
+    def __init__(  # pylint: disable=too-many-arguments,duplicate-code
+        self,
+        url: str,
+        timeout: float,
+        api_token: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+    ):
+        """
+        Args:
+            url: URL of the Aqueduct server endpoint.
+            timeout: Response timeout in seconds.
+            api_token: Token used to authorize requests.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+
+        """
+        super().__init__(url=url, timeout=timeout)
+        http_arguments = http_client_arguments(
+            api_token, self.timeout, max_connections, max_keepalive_connections
+        )
+        self._headers = http_arguments["headers"]
+        self._http_client = AsyncHTTPClient(**http_arguments)
+        self._gql_client = Client(
+            transport=SharedHTTPXAsyncTransport(
+                url=f"{url}/graphql", http_client=self._http_client
+            )
+        )
+        self._session = AsyncClientSession(client=self._gql_client)
+
+    async def close(self) -> None:
+        """Close the GraphQL session and release pooled connections."""
+        await self._gql_client.transport.close()
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncAqueductClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def fetch_response(
+        self, operation: DocumentNode, variable_values: Dict
+    ) -> Dict[str, Any]:
+        """
+        Send query or mutation request to the server.
+
+        Args:
+            operation: Query or mutation schema.
+            variable_values: Values for the params to be sent in the request.
+
+        Returns:
+            A JSON object
+        """
+        with graphql_errors():
+            return await self._session.execute(operation, variable_values=variable_values)
+
+    async def create_experiment(
+        self, title: str, description: str, tags: Optional[List[str]] = None
+    ) -> ExperimentData:
+        """
+        Create an experiment with title, description and list of tags.
+
+        Args:
+            title: Title of experiment.
+            description: Description of experiment.
+            tags: List of tags to be assigned to experiment.
+
+        Returns:
+            Experiment object.
+        """
+        data = await self.fetch_response(
+            create_experiment_mutation,
+            {"title": title, "description": description, "tags": tags or []},
+        )
+        experiment_obj = ExperimentData.from_dict(data["createExperiment"])
+        logging.info("Created experiment - %s - %s", experiment_obj.uuid, experiment_obj.title)
+        return experiment_obj
+
+    async def update_experiment(
+        self, experiment_uuid: UUID, title: Optional[str] = None, description: Optional[str] = None
+    ) -> ExperimentData:
+        """
+        Update title or description or both for experiment.
+
+        Args:
+            experiment_uuid: UUID of experiment.
+            title: New title of experiment.
+            description: New description of experiment.
+
+        Returns:
+            Experiment object.
+
+        """
+        data = await self.fetch_response(
+            update_experiment_mutation,
+            {
+                "uuid": str(experiment_uuid),
+                "title": title,
+                "description": description,
+            },
+        )
+        experiment_obj = ExperimentData.from_dict(data["updateExperiment"])
+        logging.info("Updated experiment - %s", experiment_obj.uuid)
+        return experiment_obj
+
+    async def get_experiments(  # pylint: disable=too-many-arguments,duplicate-code
+        self,
+        limit: int,
+        offset: int,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> ExperimentsInfo:
+        """
+        Get a list of experiments
+
+        Args:
+            limit: Pagination field, number of experiments to be fetched.
+            offset: Pagination field, number of experiments to skip.
+            title: Perform search on experiments through their title and EID.
+            tags: Get experiments that have these tags.
+            start_date: Start datetime to filter experiments (timezone aware).
+            end_date: End datetime to filter experiments to (timezone aware).
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            List of experiments with filters applied.
+
+        """
+        data = await self.fetch_response(
+            *experiments_request(limit, offset, title, tags, start_datetime, end_datetime, fields)
+        )
+        experiments_obj = ExperimentsInfo.from_dict(data["experiments"])
+        log_experiments_page(experiments_obj)
+        return experiments_obj
+
+    async def get_experiment(
+        self, experiment_uuid: UUID, fields: Optional[Sequence[str]] = None
+    ) -> ExperimentData:
+        """
+        Get an Experiment by UUID.
+
+        Args:
+            experiment_uuid: UUID of experiment.
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            Experiment object.
+
+        """
+        data = await self.fetch_response(
+            *experiment_request("UUID", str(experiment_uuid), fields)
+        )
+        experiment_obj = ExperimentData.from_dict(data["experiment"])
+        logging.info("Fetched experiment - %s", experiment_obj.title)
+        return experiment_obj
+
+    async def get_experiment_by_eid(
+        self, eid: str, fields: Optional[Sequence[str]] = None
+    ) -> ExperimentData:
+        """
+        Get an experiment by its EID.
+
+        Args:
+            EID: Experiment's EID.
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            Experiment object.
+
+        """
+        data = await self.fetch_response(*experiment_request("EID", eid, fields))
+        experiment_obj = ExperimentData.from_dict(data["experiment"])
+        logging.info("Fetched experiment - %s", experiment_obj.title)
+        return experiment_obj
+
+    async def add_tags_to_experiment(
+        self, experiment_uuid: UUID, tags: List[str]
+    ) -> ExperimentData:
+        """
+        Add tags to an experiment.
+
+        Args:
+            experiment_uuid: UUID of experiment.
+            tags: List of tags to be added to experiment.
+
+        Returns:
+            Updated experiment.
+
+        """
+        data = await self.fetch_response(
+            add_tags_to_experiment_mutation,
+            {"uuid": str(experiment_uuid), "tags": tags},
+        )
+        experiment_obj = ExperimentData.from_dict(data["addTagsToExperiment"])
+        logging.info("Added tags %s to experiment <%s>", tags, experiment_obj.title)
+        return experiment_obj
+
+    async def remove_experiment(self, experiment_uuid: UUID) -> None:
+        """
+        Remove experiment from the database. It removes the experiments files as well.
+
+        Args:
+            experiment_uuid: UUID of experiment.
+
+        """
+        await self.fetch_response(
+            remove_experiment_mutation,
+            {"uuid": str(experiment_uuid)},
+        )
+
+    async def remove_tag_from_experiment(self, experiment_uuid: UUID, tag: str) -> ExperimentData:
+        """
+        Remove a tag from an experiment
+
+        Args:
+            experiment_uuid: UUID of experiment from which tag has to be removed.
+            tag: Tag to be removed from experiment.
+
+        Returns:
+            Experiment having tag removed.
+        """
+        data = await self.fetch_response(
+            remove_tag_from_experiment_mutation,
+            {"uuid": str(experiment_uuid), "tag": tag},
+        )
+        experiment_obj = ExperimentData.from_dict(data["removeTagFromExperiment"])
+        logging.info("Removed tag %s from experiment <%s>", tag, experiment_obj.title)
+        return experiment_obj
+
+    async def remove_files_from_experiment(self, experiment_uuid: UUID, files: List[str]) -> None:
+        """
+        Remove files from an experiment
+
+        Args:
+            experiment_uuid: UUID of experiment for which files has to be removed from.
+            files: List of file names to be removed.
+
+        """
+        remove_url = f"{self.url}/files/{experiment_uuid}/delete_files"
+        try:
+            response = await self._http_client.post(remove_url, json={"file_list": files})
+        except TransportError as error:
+            raise FileRemovalError("Couldn't remove files due to server error.") from error
+
+        process_response_common(codes(response.status_code))
+
+        logging.info("Successfully removed files %s from experiment.", files)
+
+    async def get_tags(self, limit: int, offset: int, dangling: bool = True) -> TagsData:
+        """
+        Get a list of existing tags
+
+        Args:
+            limit: Number of tags to be fetched.
+            offset: Number of tags to skip.
+            dangling: If tags not linked to any experiment should be included or not.
+
+        Returns:
+            A list of existing tags.
+        """
+        return tags_from_response(await self.fetch_response(*tags_request(limit, offset, dangling)))
+
+    async def upload_file(self, experiment_uuid: UUID, file: str) -> None:
+        """
+        Upload file to a specific experiment.
+
+        Args:
+            experiment_uuid : The ID of the experiment.
+            file: The local path to the file to be uploaded.
+
+        """
+        headers = {"file_name": os.path.basename(file)}
+
+        upload_url = f"{self.url}/files/{str(experiment_uuid)}"
+        # file reads would block the event loop, so the content is read in the default executor
+        content = await asyncio.get_running_loop().run_in_executor(None, _read_file, file)
+        try:
+            response = await self._http_client.post(
+                upload_url, headers=headers, files={"file": (headers["file_name"], content)}
+            )
+        except TransportError as error:
+            raise FileUploadError(f"Couldn't upload {file} due to transport error.") from error
+
+        process_response_common(codes(response.status_code))
+
+        logging.info("Successfully uploaded file %s", file)
+
+    async def download_file(
+        self, experiment_uuid: UUID, file_name: str, destination_dir: str
+    ) -> None:
+        """
+        Download file from a specific experiment.
+
+        Args:
+            experiment_uuid: The ID of the experiment.
+            file_name: The name of the file to be downloaded.
+            destination_dir: The local directory where the downloaded file will be saved.
+
+        """
+        download_url: str = f"{self.url}/files/{experiment_uuid}/{file_name}"
+        destination = f"{destination_dir}/{file_name}"
+        loop = asyncio.get_running_loop()
+
+        try:
+            async with self._http_client.stream("GET", download_url) as response:
+                response.raise_for_status()
+                # file writes would block the event loop, so they run in the default executor
+                download_file = await loop.run_in_executor(None, open, destination, "wb")
+                try:
+                    async for chunk in response.aiter_bytes():
+                        await loop.run_in_executor(None, download_file.write, chunk)
+                finally:
+                    await loop.run_in_executor(None, download_file.close)
+
+        except Exception as error:
+            raise FileDownloadError(
+                f"Couldn't download {file_name} due to transport error."
+            ) from error
+
+    async def get_extensions(self) -> List[ExtensionData]:
+        """Get the list of extensions from the server.
+
+        Returns:
+            List of extension objects.
+        """
+        extensions_response = await self.fetch_response(get_all_extensions_query, {})
+
+        extensions_list = [
+            ExtensionData.from_dict(extension) for extension in extensions_response["extensions"]
+        ]
+        logging.info("Fetched %s extensions", len(extensions_list))
+        return extensions_list
+
+    async def execute_extension_action(
+        self, extension: str, action: str, params: Dict[str, Any]
+    ) -> ExtensionExecutionResultData:
+        """Executes extension action on a server.
+
+        Args:
+            extension: extension name.
+            action: action name within an extension.
+            params: dictionary with parameters passed to an extension.
+
+        Raises:
+            RemoteOperationError: Communication error.
+
+        Returns:
+            Extension execution result, `returnCode==0` corresponds to success.
+        """
+        extension_result = await self.fetch_response(
+            execute_extension_action_mutation,
+            extension_action_variables(extension, action, params),
+        )
+
+        result = ExtensionExecutionResultData.from_dict(extension_result["executeExtension"])
+        log_extension_result(extension, action, result)
+        return result
+
+    async def get_task(self, task_id: UUID, fields: Optional[Sequence[str]] = None) -> TaskData:
+        """Get details for a submitted task.
+
+        Args:
+            task_id: Task identifier
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier is always selected.
+        """
+        task_result = await self.fetch_response(*task_request(str(task_id), fields))
+
+        return TaskData.from_dict(task_result["task"])
+
+    async def get_tasks(  # pylint: disable=too-many-arguments,duplicate-code
+        self,
+        limit: int,
+        offset: int,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[TaskData]:
+        """Get a list of submitted tasks.
+
+        Args:
+            limit: Pagination field, number of tasks to be fetched.
+            offset: Pagination field, number of tasks to skip.
+            extension_name: Name of extension for which task was ran.
+            experiment_uuid: Uuid of experiment for which task was ran.
+            action_name: Name of action for which task was ran.
+            username: Username of user who ran the task.
+            start_date: Start datetime to filter tasks (timezone aware).
+            end_date: End datetime to filter tasks to (timezone aware).
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier is always selected.
+        """
+        task_result = await self.fetch_response(
+            tasks_document(get_tasks_query, fields),
+            {
+                "limit": limit,
+                "offset": offset,
+                **task_filters(
+                    extension_name, experiment_uuid, action_name, username, start_date, end_date
+                ),
+            },
+        )
+
+        return [TaskData.from_dict(task) for task in task_result["tasks"]["tasksData"]]
+
+    async def cancel_task(self, task_id: str) -> ExtensionCancelResultData:
+        """Stops and cancels task running in Celery
+
+        Args:
+            task_id: Task identifier
+        """
+        revoke_result = await self.fetch_response(cancel_task_mutation, {"taskId": task_id})
+
+        return ExtensionCancelResultData.from_dict(revoke_result["cancelTask"])
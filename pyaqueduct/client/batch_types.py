@@ -0,0 +1,15 @@
+"""Dataclasses for results of batched operations"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+
+@dataclass
+class BatchResult:
+    """Dataclass for outcome of a batched operation.
+
+    Both dictionaries are keyed by the identifier the item was requested with.
+    """
+
+    succeeded: Dict[Any, Any] = field(default_factory=dict)
+    failed: Dict[Any, str] = field(default_factory=dict)
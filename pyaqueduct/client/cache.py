@@ -0,0 +1,59 @@
+"""Bounded in-memory caches used by the clients."""
+
+import threading
+from collections import OrderedDict
+from typing import Collection, Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe mapping which keeps at most `maxsize` most recently used entries.
+
+    Args:
+        maxsize: Maximum number of entries. Zero disables the cache.
+
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Get the cached value and mark it as recently used, `None` if it isn't cached."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: K, value: V) -> None:
+        """Cache the value, evicting the least recently used entry if the cache is full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove the entry and return its value, `None` if it isn't cached."""
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def discard_values(self, values: Collection[V]) -> None:
+        """Remove all the entries having any of the values."""
+        with self._lock:
+            for key in [key for key, value in self._entries.items() if value in values]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
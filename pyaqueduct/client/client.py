@@ -1,9 +1,25 @@
 """Aqueduct client class to enable experiment based operations."""
 
+# pylint: disable=too-many-lines
+
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
 from gql import Client
@@ -11,24 +27,56 @@ from gql.client import SyncClientSession
 from gql.transport import exceptions as gql_exceptions
 from gql.transport.httpx import HTTPXTransport
 from graphql import DocumentNode
-from httpx import TransportError, codes, post, stream
+from httpx import Client as HTTPClient
+from httpx import TransportError, codes
 from pydantic import BaseModel, HttpUrl, PrivateAttr
 from tqdm import tqdm
 
-from pyaqueduct.client.experiment_types import ExperimentData, ExperimentsInfo, TagsData
+from pyaqueduct.client.batch_types import BatchResult
+from pyaqueduct.client.cache import LRUCache
+from pyaqueduct.client.columns import EXPERIMENT_COLUMNS, TASK_COLUMNS, ColumnarData
+from pyaqueduct.client.decoding import FastJSONResultMixin
+from pyaqueduct.client.experiment_types import (
+    EXPERIMENT_FIELDS,
+    ExperimentData,
+    ExperimentsInfo,
+    TagsData,
+)
 from pyaqueduct.client.extension_types import (
     ExtensionCancelResultData,
     ExtensionData,
     ExtensionExecutionResultData,
 )
-from pyaqueduct.client.task_types import TaskData
+from pyaqueduct.client.operations import (
+    experiment_request,
+    experiments_request,
+    extension_action_variables,
+    graphql_errors,
+    http_client_arguments,
+    log_experiments_page,
+    log_extension_result,
+    process_response_common,
+    server_errors,
+    tags_from_response,
+    tags_request,
+    task_filters,
+    task_request,
+    tasks_document,
+)
+from pyaqueduct.client.subscriptions import subscribe, websocket_url
+from pyaqueduct.client.task_cache import TaskCache
+from pyaqueduct.client.task_types import TASK_FIELDS, TaskData
 from pyaqueduct.exceptions import (
     FileDownloadError,
     FileRemovalError,
     FileUploadError,
-    ForbiddenError,
     RemoteOperationError,
-    UnAuthorizedError,
+)
+from pyaqueduct.schemas.batching import (
+    compose_documents,
+    compose_variables,
+    is_mutation,
+    split_results,
 )
 from pyaqueduct.schemas.mutations import (
     add_tags_to_experiment_mutation,
@@ -39,31 +87,37 @@ from pyaqueduct.schemas.mutations import (
     remove_tag_from_experiment_mutation,
     update_experiment_mutation,
 )
+from pyaqueduct.schemas.projection import check_fields, project_document
 from pyaqueduct.schemas.queries import (
     get_all_extensions_query,
-    get_all_tags_query,
     get_experiment_query,
-    get_experiments_query,
-    get_task_query,
     get_tasks_query,
 )
 
+PageT = TypeVar("PageT")
 
-def process_response_common(code: codes) -> None:
-    """Process common HTTP return codes."""
-    if code is codes.OK:
-        return
 
-    if code is codes.FORBIDDEN:
-        raise ForbiddenError("Operation is not allowed for the current user.") from None
+class SharedHTTPXTransport(  # pylint: disable=abstract-method
+    FastJSONResultMixin, HTTPXTransport
+):
+    """GraphQL transport which sends requests through an externally owned HTTP client.
 
-    if code is codes.UNAUTHORIZED:
-        raise UnAuthorizedError("API token couldn't be verified or is missing.") from None
+    The transport never opens or closes connections itself, so GraphQL queries reuse
+    the keep-alive connection pool of the HTTP client shared with file operations.
+    """
+
+    def __init__(self, url: str, http_client: HTTPClient, **kwargs):
+        super().__init__(url=url, **kwargs)
+        self._http_client = http_client
+
+    def connect(self):
+        self.client = self._http_client
 
-    raise RemoteOperationError("Remote operation failed.")
+    def close(self):
+        self.client = None
 
 
-class AqueductClient(BaseModel):
+class AqueductClient(BaseModel):  # pylint: disable=too-many-public-methods
     """
     AqueductClient - A client class for managing experiments, tags and files.
 
@@ -76,23 +130,64 @@ class AqueductClient(BaseModel):
     timeout: float
     _gql_client: Client = PrivateAttr()
     _session: SyncClientSession = PrivateAttr()
+    _http_client: HTTPClient = PrivateAttr()
     _headers: Dict[str, str] = PrivateAttr()
+    _websocket_url: str = PrivateAttr()
+    _eid_cache: LRUCache[str, UUID] = PrivateAttr()
+    _task_cache: TaskCache = PrivateAttr()
 
-    def __init__(self, url: str, timeout: float, api_token: Optional[str] = None):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        url: str,
+        timeout: float,
+        api_token: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        eid_cache_size: int = 1024,
+        task_cache_size: int = 4096,
+        task_cache_ttl: float = 1.0,
+        task_cache_path: Optional[str] = None,
+    ):
         """
         Args:
             url: URL of the Aqueduct server endpoint.
             timeout: Response timeout in seconds.
+            api_token: Token used to authorize requests.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            eid_cache_size: Maximum number of remembered EID to UUID mappings.
+            task_cache_size: Maximum number of tasks kept in memory.
+            task_cache_ttl: Time in seconds for which data of unfinished tasks is reused.
+            task_cache_path: Path of the SQLite database keeping data of finished tasks.
 
         """
         super().__init__(url=url, timeout=timeout)
-        self._headers = {"Authorization": f"Bearer {api_token}"} if api_token else {}
-
+        self._eid_cache = LRUCache(maxsize=eid_cache_size)
+        self._task_cache = TaskCache(
+            maxsize=task_cache_size, ttl=task_cache_ttl, path=task_cache_path
+        )
+        http_arguments = http_client_arguments(
+            api_token, self.timeout, max_connections, max_keepalive_connections
+        )
+        self._headers = http_arguments["headers"]
+        self._http_client = HTTPClient(**http_arguments)
         self._gql_client = Client(
-            transport=HTTPXTransport(
-                url=f"{url}/graphql", timeout=self.timeout, headers=self._headers
-            )
+            transport=SharedHTTPXTransport(url=f"{url}/graphql", http_client=self._http_client)
         )
+        self._session = self._gql_client.connect_sync()
+        self._websocket_url = websocket_url(f"{url}/graphql")
+
+    def close(self) -> None:
+        """Close the GraphQL session and release pooled connections."""
+        self._gql_client.close_sync()
+        self._http_client.close()
+        self._task_cache.close()
+
+    def __enter__(self) -> "AqueductClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     def fetch_response(self, operation: DocumentNode, variable_values: Dict) -> Dict[str, Any]:
         """
@@ -105,20 +200,112 @@ class AqueductClient(BaseModel):
         Returns:
             A JSON object
         """
+        with graphql_errors():
+            return self._session.execute(operation, variable_values=variable_values)
+
+    def subscribe(
+        self, operation: DocumentNode, variable_values: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Subscribe to the operation over a websocket connection to the server.
+
+        Args:
+            operation: Subscription schema.
+            variable_values: Values for the params to be sent with the subscription.
+
+        Returns:
+            Asynchronous iterator over the results. `SubscriptionUnavailableError` is
+            raised if the subscription can't be established or gets interrupted.
+
+        """
+        return subscribe(
+            self._websocket_url,
+            operation,
+            variable_values,
+            headers=self._headers,
+            timeout=self.timeout,
+        )
+
+    def execute_batch(
+        self, operations: Sequence[Tuple[DocumentNode, Dict[str, Any]]], chunk_size: int = 100
+    ) -> Tuple[Dict[int, Any], Dict[int, str]]:
+        """
+        Send many queries or many mutations composed into one request per chunk.
+
+        Args:
+            operations: Pairs of operation schema and its variable values.
+            chunk_size: Maximum number of operations sent in one request.
+
+        Returns:
+            Results and error messages of the operations keyed by their index.
+
+        """
+        results: Dict[int, Any] = {}
+        failures: Dict[int, str] = {}
+        retry_unresolved = not any(is_mutation(operation) for operation, _ in operations)
+        for start in range(0, len(operations), chunk_size):
+            pending = list(range(start, min(start + chunk_size, len(operations))))
+            while pending:
+                chunk_results, chunk_failures = self._fetch_composed_response(
+                    [operations[index] for index in pending]
+                )
+                results.update({pending[index]: value for index, value in chunk_results.items()})
+                failures.update({pending[index]: value for index, value in chunk_failures.items()})
+                pending = [
+                    index for index in pending if index not in results and index not in failures
+                ]
+                if pending and not retry_unresolved:
+                    # Mutations preceding the failed one might have been applied already.
+                    message = "Outcome is unknown, the batch was interrupted."
+                    failures.update({index: message for index in pending})
+                    pending = []
+        return results, failures
+
+    def _fetch_composed_response(
+        self, operations: Sequence[Tuple[DocumentNode, Dict[str, Any]]]
+    ) -> Tuple[Dict[int, Any], Dict[int, str]]:
+        document = compose_documents(tuple(operation for operation, _ in operations))
+        variable_values = compose_variables([variables for _, variables in operations])
         try:
-            data = self._gql_client.execute(
-                operation,
-                variable_values=variable_values,
-            )
-        except gql_exceptions.TransportServerError as error:
-            if error.code:
-                process_response_common(codes(error.code))
-            raise
+            with server_errors():
+                data = self._session.execute(document, variable_values=variable_values)
+            errors: List[Any] = []
         except gql_exceptions.TransportQueryError as error:
+            data, errors = error.data, error.errors or []
+
+        results, failures = split_results(data, errors, len(operations))
+        if not results and not failures:
             raise RemoteOperationError(
-                error.errors if error.errors else "Unknown error occurred in the remote operation."
-            ) from error
-        return data
+                errors if errors else "Unknown error occurred in the remote operation."
+            )
+        return results, failures
+
+    def _decode_experiment(self, data: Dict[str, Any]) -> ExperimentData:
+        experiment_obj = ExperimentData.from_dict(data)
+        self._remember_eids([experiment_obj])
+        return experiment_obj
+
+    def _remember_eids(self, experiments: Iterable[Optional[ExperimentData]]) -> None:
+        for experiment in experiments:
+            if experiment is not None and experiment.eid is not None:
+                self._eid_cache.put(experiment.eid, experiment.uuid)
+
+    def resolve_eid(self, eid: str) -> UUID:
+        """
+        Get UUID of the experiment with the given EID. The mapping is remembered from
+        the fetched experiments, otherwise only the UUID is requested from the server.
+
+        Args:
+            eid: Experiment's EID.
+
+        Returns:
+            UUID of the experiment.
+
+        """
+        uuid = self._eid_cache.get(eid)
+        if uuid is None:
+            uuid = self.get_experiment_by_eid(eid, fields=["eid"]).uuid
+        return uuid
 
     def create_experiment(
         self, title: str, description: str, tags: Optional[List[str]] = None
@@ -139,7 +326,7 @@ class AqueductClient(BaseModel):
             create_experiment_mutation,
             {"title": title, "description": description, "tags": tags or []},
         )
-        experiment_obj = ExperimentData.from_dict(
+        experiment_obj = self._decode_experiment(
             data["createExperiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Created experiment - %s - %s", experiment_obj.uuid, experiment_obj.title)
@@ -168,13 +355,69 @@ class AqueductClient(BaseModel):
                 "description": description,
             },
         )
-        experiment_obj = ExperimentData.from_dict(
+        experiment_obj = self._decode_experiment(
             data["updateExperiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Updated experiment - %s", experiment_obj.uuid)
         return experiment_obj
 
-    def get_experiments(
+    def apply_experiment_changes(  # pylint: disable=too-many-arguments
+        self,
+        experiment_uuid: UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        add_tags: Optional[List[str]] = None,
+        remove_tags: Optional[List[str]] = None,
+    ) -> Optional[ExperimentData]:
+        """
+        Update fields and tags of experiment with all the mutations sent in one request.
+
+        Mutations are executed in order: title and description update, tags addition,
+        then removal of every tag.
+
+        Args:
+            experiment_uuid: UUID of experiment.
+            title: New title of experiment.
+            description: New description of experiment.
+            add_tags: List of tags to be added to experiment.
+            remove_tags: List of tags to be removed from experiment.
+
+        Returns:
+            Experiment object after all the changes, or `None` if there were no changes.
+
+        """
+        operations: List[Tuple[DocumentNode, Dict[str, Any]]] = []
+        if title is not None or description is not None:
+            operations.append(
+                (
+                    update_experiment_mutation,
+                    {"uuid": str(experiment_uuid), "title": title, "description": description},
+                )
+            )
+        if add_tags:
+            operations.append(
+                (add_tags_to_experiment_mutation, {"uuid": str(experiment_uuid), "tags": add_tags})
+            )
+        for tag in remove_tags or []:
+            operations.append(
+                (remove_tag_from_experiment_mutation, {"uuid": str(experiment_uuid), "tag": tag})
+            )
+        if not operations:
+            return None
+
+        results, failures = self._fetch_composed_response(operations)
+        if failures or len(results) != len(operations):
+            raise RemoteOperationError(
+                [failures[index] for index in sorted(failures)]
+                or "Outcome is unknown, the batch was interrupted."
+            )
+        experiment_obj = self._decode_experiment(results[len(operations) - 1])
+        logging.info(
+            "Applied %s changes to experiment - %s", len(operations), experiment_obj.uuid
+        )
+        return experiment_obj
+
+    def get_experiments(  # pylint: disable=too-many-arguments
         self,
         limit: int,
         offset: int,
@@ -182,6 +425,7 @@ class AqueductClient(BaseModel):
         tags: Optional[List[str]] = None,
         start_datetime: Optional[datetime] = None,
         end_datetime: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> ExperimentsInfo:
         """
         Get a list of experiments
@@ -193,74 +437,302 @@ class AqueductClient(BaseModel):
             tags: Get experiments that have these tags.
             start_date: Start datetime to filter experiments (timezone aware).
             end_date: End datetime to filter experiments to (timezone aware).
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
 
         Returns:
             List of experiments with filters applied.
 
         """
+        experiments_obj = ExperimentsInfo.from_dict(
+            self._fetch_experiments_page(
+                limit, offset, title, tags, start_datetime, end_datetime, fields
+            )
+        )
+        self._remember_eids(experiments_obj.experiments)
+        log_experiments_page(experiments_obj)
+        return experiments_obj
+
+    def _fetch_experiments_page(  # pylint: disable=too-many-arguments
+        self,
+        limit: int,
+        offset: int,
+        title: Optional[str],
+        tags: Optional[List[str]],
+        start_datetime: Optional[datetime],
+        end_datetime: Optional[datetime],
+        fields: Optional[Sequence[str]],
+    ) -> Dict[str, Any]:
         data = self.fetch_response(
-            get_experiments_query,
-            {
-                "limit": limit,
-                "offset": offset,
-                "title": title,
-                "startDate": start_datetime.isoformat() if start_datetime else None,
-                "endDate": end_datetime.isoformat() if end_datetime else None,
-                "tags": tags,
-            },
+            *experiments_request(limit, offset, title, tags, start_datetime, end_datetime, fields)
         )
-        experiments_obj = ExperimentsInfo.from_dict(
-            data["experiments"]  # pylint: disable=unsubscriptable-object
+        return data["experiments"]  # pylint: disable=unsubscriptable-object
+
+    @staticmethod
+    def _prefetch_pages(
+        fetch_page: Callable[[int], PageT], page_size: int, has_next: Callable[[PageT, int], bool]
+    ) -> Iterator[PageT]:
+        """Fetch pages one by one, requesting the next page in a background thread while
+        the current one is being processed.
+
+        Args:
+            fetch_page: Function fetching the page at the given offset.
+            page_size: Number of records in a page.
+            has_next: Function telling whether there's a page after the given one,
+                which would start at the given offset.
+
+        Returns:
+            Iterator over the pages.
+
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            next_page = executor.submit(fetch_page, offset)
+            while next_page is not None:
+                page = next_page.result()
+                offset += page_size
+                next_page = (
+                    executor.submit(fetch_page, offset) if has_next(page, offset) else None
+                )
+                yield page
+
+    def iter_experiment_pages(  # pylint: disable=too-many-arguments
+        self,
+        page_size: int,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[ExperimentsInfo]:
+        """
+        Iterate over pages of experiments. The next page is fetched in a background thread
+        while the current one is being processed, so at most two pages are held in memory.
+
+        Args:
+            page_size: Number of experiments fetched in one request.
+            title: Perform search on experiments through their title and EID.
+            tags: Get experiments that have these tags.
+            start_datetime: Start datetime to filter experiments (timezone aware).
+            end_datetime: End datetime to filter experiments to (timezone aware).
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            Iterator over pages of experiments with filters applied.
+
+        """
+
+        def fetch_page(offset: int) -> ExperimentsInfo:
+            return self.get_experiments(
+                limit=page_size,
+                offset=offset,
+                title=title,
+                tags=tags,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                fields=fields,
+            )
+
+        return self._prefetch_pages(
+            fetch_page,
+            page_size,
+            lambda page, offset: bool(page.experiments) and offset < page.total_count,
         )
-        logging.info(
-            "Fetched %s experiments, total %s experiments",
-            len(experiments_obj.experiments),
-            experiments_obj.total_count,
+
+    def get_experiment_columns(  # pylint: disable=too-many-arguments
+        self,
+        page_size: int,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> ColumnarData:
+        """
+        Get all the experiments matching the filters as columns. The records of each page
+        are appended to the columns directly from the response, the next page is fetched
+        in a background thread meanwhile.
+
+        Args:
+            page_size: Number of experiments fetched in one request.
+            title: Perform search on experiments through their title and EID.
+            tags: Get experiments that have these tags.
+            start_datetime: Start datetime to filter experiments (timezone aware).
+            end_datetime: End datetime to filter experiments to (timezone aware).
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            Columns of the experiment fields in the server order.
+
+        """
+        selected = ["uuid"] + [name for name in fields or EXPERIMENT_FIELDS if name != "uuid"]
+        check_fields(EXPERIMENT_FIELDS, selected)
+        columns = ColumnarData.for_fields(EXPERIMENT_COLUMNS, EXPERIMENT_FIELDS, selected)
+        pages = self._prefetch_pages(
+            lambda offset: self._fetch_experiments_page(
+                page_size, offset, title, tags, start_datetime, end_datetime, selected
+            ),
+            page_size,
+            lambda page, offset: bool(page["experimentsData"])
+            and offset < page["totalExperimentsCount"],
         )
-        return experiments_obj
+        for page in pages:
+            columns.extend(page["experimentsData"])
+        logging.info("Fetched %s experiments as columns", len(columns))
+        return columns
+
+    def scan_experiments(  # pylint: disable=too-many-arguments
+        self,
+        page_size: int,
+        max_workers: int,
+        title: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ExperimentData]:
+        """
+        Get all the experiments matching the filters. The first page tells the total number
+        of experiments, the remaining pages are then fetched concurrently.
+
+        Args:
+            page_size: Number of experiments fetched in one request.
+            max_workers: Maximum number of concurrent requests.
+            title: Perform search on experiments through their title and EID.
+            tags: Get experiments that have these tags.
+            start_datetime: Start datetime to filter experiments (timezone aware).
+            end_datetime: End datetime to filter experiments to (timezone aware).
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
+
+        Returns:
+            List of experiments in the server order, without duplicates which may appear
+            if experiments were added or removed during the scan.
+
+        """
+
+        def fetch_page(offset: int) -> ExperimentsInfo:
+            return self.get_experiments(
+                limit=page_size,
+                offset=offset,
+                title=title,
+                tags=tags,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                fields=fields,
+            )
 
-    def get_experiment(self, experiment_uuid: UUID) -> ExperimentData:
+        first_page = fetch_page(0)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = [first_page] + list(
+                executor.map(fetch_page, range(page_size, first_page.total_count, page_size))
+            )
+
+        experiments: Dict[UUID, ExperimentData] = {}
+        for page in pages:
+            for experiment in page.experiments:
+                experiments.setdefault(experiment.uuid, experiment)
+        logging.info("Scanned %s experiments in %s pages", len(experiments), len(pages))
+        return list(experiments.values())
+
+    def get_experiment(
+        self, experiment_uuid: UUID, fields: Optional[Sequence[str]] = None
+    ) -> ExperimentData:
         """
         Get an Experiment by UUID.
 
         Args:
             experiment_uuid: UUID of experiment.
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
 
         Returns:
             Experiment object.
 
         """
-        data = self.fetch_response(
-            get_experiment_query,
-            {"type": "UUID", "value": str(experiment_uuid)},
-        )
-        experiment_obj = ExperimentData.from_dict(
+        data = self.fetch_response(*experiment_request("UUID", str(experiment_uuid), fields))
+        experiment_obj = self._decode_experiment(
             data["experiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Fetched experiment - %s", experiment_obj.title)
         return experiment_obj
 
-    def get_experiment_by_eid(self, eid: str) -> ExperimentData:
+    def get_experiment_by_eid(
+        self, eid: str, fields: Optional[Sequence[str]] = None
+    ) -> ExperimentData:
         """
         Get an experiment by its EID.
 
         Args:
             EID: Experiment's EID.
+            fields: Names of `ExperimentData` fields to select. All fields are selected
+                by default, UUID is always selected.
 
         Returns:
             Updated experiment.
 
         """
-        data = self.fetch_response(
-            get_experiment_query,
-            {"type": "EID", "value": eid},
-        )
-        experiment_obj = ExperimentData.from_dict(
+        data = self.fetch_response(*experiment_request("EID", eid, fields))
+        experiment_obj = self._decode_experiment(
             data["experiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Fetched experiment - %s", experiment_obj.title)
         return experiment_obj
 
+    def get_experiments_by_uuids(
+        self, experiment_uuids: Sequence[UUID], chunk_size: int = 100
+    ) -> BatchResult:
+        """
+        Get many experiments by UUID with one request per chunk.
+
+        Args:
+            experiment_uuids: UUIDs of experiments.
+            chunk_size: Maximum number of experiments fetched in one request.
+
+        Returns:
+            Experiment objects and errors keyed by the UUID.
+
+        """
+        return self._get_experiments_by_identifiers(
+            "UUID", {str(uuid): uuid for uuid in experiment_uuids}, chunk_size
+        )
+
+    def get_experiments_by_eids(self, eids: Sequence[str], chunk_size: int = 100) -> BatchResult:
+        """
+        Get many experiments by EID with one request per chunk.
+
+        Args:
+            eids: EIDs of experiments.
+            chunk_size: Maximum number of experiments fetched in one request.
+
+        Returns:
+            Experiment objects and errors keyed by the EID.
+
+        """
+        return self._get_experiments_by_identifiers("EID", {eid: eid for eid in eids}, chunk_size)
+
+    def _get_experiments_by_identifiers(
+        self, identifier_type: str, identifiers: Dict[str, Any], chunk_size: int
+    ) -> BatchResult:
+        keys = list(identifiers.values())
+        results, failures = self.execute_batch(
+            [
+                (get_experiment_query, {"type": identifier_type, "value": value})
+                for value in identifiers
+            ],
+            chunk_size=chunk_size,
+        )
+        batch = BatchResult(
+            succeeded={
+                keys[index]: self._decode_experiment(data) for index, data in results.items()
+            },
+            failed={keys[index]: message for index, message in failures.items()},
+        )
+        logging.info("Fetched %s experiments, %s failed", len(batch.succeeded), len(batch.failed))
+        return batch
+
     def add_tags_to_experiment(self, experiment_uuid: UUID, tags: List[str]) -> ExperimentData:
         """
         Add tags to an experiment.
@@ -277,7 +749,7 @@ class AqueductClient(BaseModel):
             add_tags_to_experiment_mutation,
             {"uuid": str(experiment_uuid), "tags": tags},
         )
-        experiment_obj = ExperimentData.from_dict(
+        experiment_obj = self._decode_experiment(
             data["addTagsToExperiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Added tags %s to experiment <%s>", tags, experiment_obj.title)
@@ -295,6 +767,7 @@ class AqueductClient(BaseModel):
             remove_experiment_mutation,
             {"uuid": str(experiment_uuid)},
         )
+        self._eid_cache.discard_values({experiment_uuid})
 
     def remove_tag_from_experiment(self, experiment_uuid: UUID, tag: str) -> ExperimentData:
         """
@@ -312,12 +785,143 @@ class AqueductClient(BaseModel):
             {"uuid": str(experiment_uuid), "tag": tag},
         )
 
-        experiment_obj = ExperimentData.from_dict(
+        experiment_obj = self._decode_experiment(
             data["removeTagFromExperiment"]  # pylint: disable=unsubscriptable-object
         )
         logging.info("Removed tag %s from experiment <%s>", tag, experiment_obj.title)
         return experiment_obj
 
+    def add_tags_to_experiments(
+        self, tags: Dict[UUID, List[str]], chunk_size: int = 100
+    ) -> BatchResult:
+        """
+        Add tags to many experiments with one request per chunk.
+
+        Args:
+            tags: Lists of tags to be added keyed by UUID of experiment.
+            chunk_size: Maximum number of mutations sent in one request.
+
+        Returns:
+            Updated experiments and errors keyed by the UUID.
+
+        """
+        return self._mutate_experiments(
+            [
+                (uuid, add_tags_to_experiment_mutation, {"uuid": str(uuid), "tags": tags_list})
+                for uuid, tags_list in tags.items()
+            ],
+            chunk_size,
+        )
+
+    def remove_tags_from_experiments(
+        self, tags: Dict[UUID, List[str]], chunk_size: int = 100
+    ) -> BatchResult:
+        """
+        Remove tags from many experiments with one request per chunk.
+
+        Args:
+            tags: Lists of tags to be removed keyed by UUID of experiment.
+            chunk_size: Maximum number of mutations sent in one request.
+
+        Returns:
+            Updated experiments and errors keyed by the UUID.
+
+        """
+        return self._mutate_experiments(
+            [
+                (uuid, remove_tag_from_experiment_mutation, {"uuid": str(uuid), "tag": tag})
+                for uuid, tags_list in tags.items()
+                for tag in tags_list
+            ],
+            chunk_size,
+        )
+
+    def update_experiments(
+        self, updates: Dict[UUID, Dict[str, Optional[str]]], chunk_size: int = 100
+    ) -> BatchResult:
+        """
+        Update title or description or both for many experiments with one request per chunk.
+
+        Args:
+            updates: Dictionaries with new `title` and `description` keyed by UUID of experiment.
+            chunk_size: Maximum number of mutations sent in one request.
+
+        Returns:
+            Updated experiments and errors keyed by the UUID.
+
+        """
+        for update in updates.values():
+            if not set(update).issubset({"title", "description"}):
+                raise ValueError("Only title and description of experiment can be updated.")
+        return self._mutate_experiments(
+            [
+                (
+                    uuid,
+                    update_experiment_mutation,
+                    {
+                        "uuid": str(uuid),
+                        "title": update.get("title"),
+                        "description": update.get("description"),
+                    },
+                )
+                for uuid, update in updates.items()
+            ],
+            chunk_size,
+        )
+
+    def remove_experiments(
+        self, experiment_uuids: Sequence[UUID], chunk_size: int = 100
+    ) -> BatchResult:
+        """
+        Remove many experiments with one request per chunk. It removes the experiments files
+        as well.
+
+        Args:
+            experiment_uuids: UUIDs of experiments.
+            chunk_size: Maximum number of mutations sent in one request.
+
+        Returns:
+            Removal results and errors keyed by the UUID.
+
+        """
+        # outcome of failed removals is unknown, so all the mappings are forgotten
+        self._eid_cache.discard_values(set(experiment_uuids))
+        return self._mutate_experiments(
+            [
+                (uuid, remove_experiment_mutation, {"uuid": str(uuid)})
+                for uuid in dict.fromkeys(experiment_uuids)
+            ],
+            chunk_size,
+            decode=False,
+        )
+
+    def _mutate_experiments(
+        self,
+        operations: List[Tuple[Any, DocumentNode, Dict[str, Any]]],
+        chunk_size: int,
+        decode: bool = True,
+    ) -> BatchResult:
+        results, failures = self.execute_batch(
+            [(operation, variables) for _, operation, variables in operations],
+            chunk_size=chunk_size,
+        )
+        batch = BatchResult()
+        for index, (key, _, _) in enumerate(operations):
+            if index in failures:
+                batch.failed.setdefault(key, failures[index])
+                batch.succeeded.pop(key, None)
+            elif key not in batch.failed:
+                batch.succeeded[key] = (
+                    self._decode_experiment(results[index]) if decode else results[index]
+                )
+        logging.info(
+            "Applied %s mutations to %s experiments, %s experiments failed",
+            len(operations),
+            len(batch.succeeded),
+            len(batch.failed),
+        )
+        return batch
+
     def remove_files_from_experiment(self, experiment_uuid: UUID, files: List[str]) -> None:
         """
         Remove files from an experiment
@@ -330,7 +934,7 @@ class AqueductClient(BaseModel):
 
         remove_url = f"{self.url}/files/{experiment_uuid}/delete_files"
         try:
-            response = post(remove_url, timeout=self.timeout, json={"file_list": files})
+            response = self._http_client.post(remove_url, json={"file_list": files})
         except TransportError as error:
             raise FileRemovalError("Couldn't remove files due to server error.") from error
 
@@ -350,13 +954,7 @@ class AqueductClient(BaseModel):
         Returns:
         List[str]: A list of all existing tags
         """
-        data = self.fetch_response(
-            get_all_tags_query,
-            {"limit": limit, "offset": offset, "dangling": dangling},
-        )
-        tags_obj = TagsData.from_dict(data["tags"])  # pylint: disable=unsubscriptable-object
-        logging.info("Fetched %s tags, total %s tags", len(tags_obj.tags), tags_obj.total_count)
-        return tags_obj
+        return tags_from_response(self.fetch_response(*tags_request(limit, offset, dangling)))
 
     def upload_file(self, experiment_uuid: UUID, file: str) -> None:
         """
@@ -371,13 +969,13 @@ class AqueductClient(BaseModel):
 
         """
 
-        headers = {"file_name": os.path.basename(file), **self._headers}
+        headers = {"file_name": os.path.basename(file)}
 
         upload_url = f"{self.url}/files/{str(experiment_uuid)}"
         with open(file, "rb") as files:
             try:
-                response = post(
-                    upload_url, headers=headers, timeout=self.timeout, files={"file": files}
+                response = self._http_client.post(
+                    upload_url, headers=headers, files={"file": files}
                 )
             except TransportError as error:
                 raise FileUploadError(f"Couldn't upload {file} due to transport error.") from error
@@ -404,9 +1002,7 @@ class AqueductClient(BaseModel):
 
         try:
             with open(destination, "wb") as download_file:
-                with stream(
-                    "GET", download_url, timeout=self.timeout, headers=self._headers
-                ) as response:
+                with self._http_client.stream("GET", download_url) as response:
                     total = int(response.headers["Content-Length"])
                     with tqdm(
                         total=total, unit_scale=True, unit_divisor=1024, unit="B"
@@ -428,18 +1024,7 @@ class AqueductClient(BaseModel):
         Returns:
             List of extension objects.
         """
-        try:
-            extensions_response = self._gql_client.execute(
-                get_all_extensions_query,
-            )
-        except gql_exceptions.TransportServerError as error:
-            if error.code:
-                process_response_common(codes(error.code))
-            raise
-        except gql_exceptions.TransportQueryError as error:
-            raise RemoteOperationError(
-                error.errors if error.errors else "Unknown error occurred in the remote operation."
-            ) from error
+        extensions_response = self.fetch_response(get_all_extensions_query, {})
 
         extensions_list = list(
             map(
@@ -466,47 +1051,100 @@ class AqueductClient(BaseModel):
         Returns:
             Extension execution result, `returnCode==0` corresponds to success.
         """
-        try:
-            params_list = [[k, str(v)] for k, v in params.items()]
-            extension_result = self._gql_client.execute(
-                execute_extension_action_mutation,
-                variable_values={
-                    "extension": extension,
-                    "action": action,
-                    "params": params_list,
-                },
-            )
-        except gql_exceptions.TransportServerError as error:
-            if error.code:
-                process_response_common(codes(error.code))
-            raise
-        except gql_exceptions.TransportQueryError as error:
-            raise RemoteOperationError(
-                error.errors if error.errors else "Unknown error occurred in the remote operation."
-            ) from error
+        extension_result = self.fetch_response(
+            execute_extension_action_mutation,
+            extension_action_variables(extension, action, params),
+        )
 
         result = ExtensionExecutionResultData.from_dict(
             extension_result["executeExtension"]  # pylint: disable=unsubscriptable-object
         )
-        logging.info(
-            "Executed a %s / %s extension action with result code %d",
-            extension,
-            action,
-            result.returnCode,
-        )
+        log_extension_result(extension, action, result)
         return result
 
-    def get_task(self, task_id: UUID) -> TaskData:
-        """Get details for a submitted taks
+    @staticmethod
+    def _task_fields(fields: Optional[Sequence[str]]) -> FrozenSet[str]:
+        return frozenset(TASK_FIELDS if fields is None else ("task_id", *fields))
+
+    def _cache_task(self, data: Dict[str, Any], fields: FrozenSet[str]) -> TaskData:
+        result = TaskData.from_dict(data)
+        self._task_cache.put(data, result, fields)
+        return result
+
+    def get_task(
+        self,
+        task_id: UUID,
+        fields: Optional[Sequence[str]] = None,
+        max_age: Optional[float] = None,
+    ) -> TaskData:
+        """Get details for a submitted taks. Data of finished tasks is cached by the client,
+        data of unfinished tasks is reused for `task_cache_ttl` seconds.
 
         Args:
             task_id: Task identifier
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier is always selected.
+            max_age: Maximum age in seconds of the cached data of an unfinished task,
+                limited by `task_cache_ttl`. Zero always fetches unfinished tasks.
         """
-        task_result = self.fetch_response(get_task_query, variable_values={"taskId": str(task_id)})
+        task_id = task_id if isinstance(task_id, UUID) else UUID(task_id)
+        selected = self._task_fields(fields)
+        cached = self._task_cache.get(task_id, selected, max_age)
+        if cached is not None:
+            return cached
+
+        task_result = self.fetch_response(*task_request(str(task_id), fields))
 
-        result = TaskData.from_dict(task_result["task"])  # pylint: disable=unsubscriptable-object
+        result = self._cache_task(
+            task_result["task"], selected  # pylint: disable=unsubscriptable-object
+        )
+        self._remember_eids([result.experiment])
         return result
 
+    def get_tasks_by_ids(
+        self,
+        task_ids: Sequence[UUID],
+        fields: Optional[Sequence[str]] = None,
+        chunk_size: int = 100,
+        max_age: Optional[float] = None,
+    ) -> BatchResult:
+        """Get many tasks by identifier with one request per chunk. Cached tasks are
+        taken from the cache like `get_task()` does.
+
+        Args:
+            task_ids: Task identifiers.
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier is always selected.
+            chunk_size: Maximum number of tasks fetched in one request.
+            max_age: Maximum age in seconds of the cached data of an unfinished task,
+                limited by `task_cache_ttl`. Zero always fetches unfinished tasks.
+
+        Returns:
+            Task data and errors keyed by the task UUID.
+
+        """
+        selected = self._task_fields(fields)
+        batch = BatchResult()
+        missing = []
+        for task_id in (UUID(str(task_id)) for task_id in task_ids):
+            cached = self._task_cache.get(task_id, selected, max_age)
+            if cached is None:
+                missing.append(task_id)
+            else:
+                batch.succeeded[task_id] = cached
+
+        results, failures = self.execute_batch(
+            [task_request(str(task_id), fields) for task_id in missing],
+            chunk_size=chunk_size,
+        )
+        batch.succeeded.update(
+            (missing[index], self._cache_task(data, selected)) for index, data in results.items()
+        )
+        batch.failed.update((missing[index], message) for index, message in failures.items())
+        self._remember_eids(task.experiment for task in batch.succeeded.values())
+        logging.info("Fetched %s tasks, %s failed", len(batch.succeeded), len(batch.failed))
+        return batch
+
     def get_tasks(  # pylint: disable=too-many-arguments
         self,
         limit: int,
@@ -517,7 +1155,8 @@ class AqueductClient(BaseModel):
         username: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> TaskData:
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[TaskData]:
         """Get details for a submitted taks
 
         Args:
@@ -529,33 +1168,149 @@ class AqueductClient(BaseModel):
             username: Username of user who ran the task.
             startDate: Start datetime to filter experiments (timezone aware).
             endDate: End datetime to filter experiments to (timezone aware).
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier is always selected.
         """
-        task_result = self.fetch_response(
+        task_result = self._fetch_tasks_page(
             get_tasks_query,
-            variable_values={
-                "limit": limit,
-                "offset": offset,
-                "extensionName": extension_name,
-                "experimentUuid": experiment_uuid,
-                "actionName": action_name,
-                "username": username,
-                "startDate": start_date,
-                "endDate": end_date,
-            },
+            limit,
+            offset,
+            task_filters(
+                extension_name, experiment_uuid, action_name, username, start_date, end_date
+            ),
+            fields,
         )
 
-        result = [
-            TaskData.from_dict(task)
-            for task in task_result["tasks"]["tasksData"]  # pylint: disable=unsubscriptable-object
-        ]
+        selected = self._task_fields(fields)
+        result = [self._cache_task(task, selected) for task in task_result["tasksData"]]
+        self._remember_eids(task.experiment for task in result)
         return result
 
+    def get_tasks_since(  # pylint: disable=too-many-arguments
+        self,
+        start_date: Optional[datetime],
+        page_size: int,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[TaskData]:
+        """Get all the tasks received since the given time, page by page. Tasks received
+        while paging shift the pages, so tasks repeated at page boundaries are dropped.
+
+        Args:
+            start_date: Start datetime to filter tasks (timezone aware), `None` gets
+                all the tasks.
+            page_size: Number of tasks fetched in one request.
+            extension_name: Name of extension for which task was ran.
+            experiment_uuid: Uuid of experiment for which task was ran.
+            action_name: Name of action for which task was ran.
+            username: Username of user who ran the task.
+            fields: Names of `TaskData` fields to select. All fields are selected by default,
+                task identifier and receiving time are always selected.
+
+        Returns:
+            Unique tasks in the server order.
+
+        """
+        if fields is not None and "received_at" not in fields:
+            fields = [*fields, "received_at"]
+        selected = self._task_fields(fields)
+        filters = task_filters(
+            extension_name, experiment_uuid, action_name, username, start_date, None
+        )
+        tasks: Dict[UUID, TaskData] = {}
+        offset = 0
+        while True:
+            page = self._fetch_tasks_page(get_tasks_query, page_size, offset, filters, fields)
+            for data in page["tasksData"]:
+                task = self._cache_task(data, selected)
+                tasks.setdefault(task.task_id, task)
+            offset += page_size
+            if not page["tasksData"] or offset >= page["totalTasksCount"]:
+                break
+        logging.info("Fetched %s tasks received since %s", len(tasks), start_date)
+        return list(tasks.values())
+
+    def _fetch_tasks_page(  # pylint: disable=too-many-arguments
+        self,
+        document: DocumentNode,
+        limit: int,
+        offset: int,
+        filters: Dict[str, Any],
+        fields: Optional[Sequence[str]],
+    ) -> Dict[str, Any]:
+        task_result = self.fetch_response(
+            tasks_document(document, fields),
+            variable_values={"limit": limit, "offset": offset, **filters},
+        )
+        return task_result["tasks"]  # pylint: disable=unsubscriptable-object
+
+    def get_task_columns(  # pylint: disable=too-many-arguments
+        self,
+        page_size: int,
+        extension_name: Optional[str] = None,
+        experiment_uuid: Optional[str] = None,
+        action_name: Optional[str] = None,
+        username: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> ColumnarData:
+        """Get all the tasks matching the filters as columns. The records of each page
+        are appended to the columns directly from the response, the next page is fetched
+        in a background thread meanwhile.
+
+        Args:
+            page_size: Number of tasks fetched in one request.
+            extension_name: Name of extension for which task was ran.
+            experiment_uuid: Uuid of experiment for which task was ran.
+            action_name: Name of action for which task was ran.
+            username: Username of user who ran the task.
+            start_date: Start datetime to filter tasks (timezone aware).
+            end_date: End datetime to filter tasks to (timezone aware).
+            fields: Names of `TaskData` fields to select, except `parameters`. All the other
+                fields but the logs are selected by default, task identifier is always
+                selected. Experiment is represented by its UUID in `experiment_uuid` column.
+
+        Returns:
+            Columns of the task fields in the server order.
+
+        """
+        if fields is None:
+            fields = [name for name in TASK_COLUMNS if name not in ("std_out", "std_err")]
+        selected = ["task_id"] + [name for name in fields if name != "task_id"]
+        check_fields(TASK_FIELDS, selected)
+        if "parameters" in selected:
+            raise ValueError("Task parameters can't be exported as a column.")
+        columns = ColumnarData.for_fields(TASK_COLUMNS, TASK_FIELDS, selected)
+        document = get_tasks_query
+        if "experiment" in selected:
+            # only UUID of the nested experiment is needed
+            document = project_document(
+                document, ("tasks", "tasksData", "experiment"), frozenset(["uuid"])
+            )
+        filters = task_filters(
+            extension_name, experiment_uuid, action_name, username, start_date, end_date
+        )
+        pages = self._prefetch_pages(
+            lambda offset: self._fetch_tasks_page(document, page_size, offset, filters, selected),
+            page_size,
+            lambda page, offset: bool(page["tasksData"]) and offset < page["totalTasksCount"],
+        )
+        for page in pages:
+            columns.extend(page["tasksData"])
+        logging.info("Fetched %s tasks as columns", len(columns))
+        return columns
+
     def cancel_task(self, task_id: str) -> ExtensionCancelResultData:
         """Stops and cancels task running in Celery
 
         Args:
             task_id: Task identifier
         """
+        self._task_cache.discard(UUID(str(task_id)))
         revoke_result = self.fetch_response(  # pylint: disable=unsubscriptable-object
             cancel_task_mutation,
             variable_values={"taskId": task_id},
@@ -0,0 +1,130 @@
+"""Columnar decoding of experiment and task listings.
+
+Records of a listing page are appended to the columns straight from the parsed response,
+one column at a time, without creating an object per record. Every column has a kind
+telling the type of its values, so the columns can be turned into typed arrays.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from pyaqueduct.client.decoding import intern_string, parse_datetime
+
+STRING = "string"
+"""Kind of the columns with `str` values."""
+
+INTEGER = "integer"
+"""Kind of the columns with `int` values."""
+
+TIMESTAMP = "timestamp"
+"""Kind of the columns with timezone aware `datetime` values."""
+
+STRING_LIST = "string_list"
+"""Kind of the columns with lists of `str` values."""
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Definition of a column decoded from a record field of the response."""
+
+    name: str
+    kind: str
+    convert: Optional[Callable[[Any], Any]] = None
+    """Function converting the response value, `None` keeps it as is."""
+
+
+def _timestamp(value: Optional[str]) -> Any:
+    return parse_datetime(value) if value is not None else None
+
+
+def _interned_list(values: Optional[List[str]]) -> Optional[List[str]]:
+    return [intern_string(value) for value in values] if values is not None else None
+
+
+def _file_names(files: Optional[List[Dict[str, Any]]]) -> Optional[List[str]]:
+    return [intern_string(file["name"]) for file in files] if files is not None else None
+
+
+def _experiment_uuid(experiment: Optional[Dict[str, Any]]) -> Optional[str]:
+    return experiment["uuid"] if experiment is not None else None
+
+
+EXPERIMENT_COLUMNS = {
+    "uuid": ColumnSpec("uuid", STRING),
+    "title": ColumnSpec("title", STRING),
+    "description": ColumnSpec("description", STRING),
+    "eid": ColumnSpec("eid", STRING),
+    "created_at": ColumnSpec("created_at", TIMESTAMP, _timestamp),
+    "updated_at": ColumnSpec("updated_at", TIMESTAMP, _timestamp),
+    "tags": ColumnSpec("tags", STRING_LIST, _interned_list),
+    "files": ColumnSpec("files", STRING_LIST, _file_names),
+}
+"""Columns of `ExperimentData` fields, files are represented by their names."""
+
+TASK_COLUMNS = {
+    "task_id": ColumnSpec("task_id", STRING),
+    "task_status": ColumnSpec("task_status", STRING, intern_string),
+    "extension_name": ColumnSpec("extension_name", STRING, intern_string),
+    "action_name": ColumnSpec("action_name", STRING, intern_string),
+    "created_by": ColumnSpec("created_by", STRING, intern_string),
+    "received_at": ColumnSpec("received_at", TIMESTAMP, _timestamp),
+    "ended_at": ColumnSpec("ended_at", TIMESTAMP, _timestamp),
+    "result_code": ColumnSpec("result_code", INTEGER),
+    "std_out": ColumnSpec("std_out", STRING),
+    "std_err": ColumnSpec("std_err", STRING),
+    "experiment": ColumnSpec("experiment_uuid", STRING, _experiment_uuid),
+}
+"""Columns of `TaskData` fields, the experiment is represented by its UUID."""
+
+
+@dataclass
+class ColumnarData:
+    """Dataclass for records decoded into columns.
+
+    Columns are keyed by their names, `kinds` gives the kind of each column.
+    """
+
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    kinds: Dict[str, str] = field(default_factory=dict)
+    _sources: Dict[str, ColumnSpec] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def for_fields(
+        cls, specs: Dict[str, ColumnSpec], field_names: Dict[str, str], fields: Sequence[str]
+    ) -> "ColumnarData":
+        """Create empty columns of the given record fields.
+
+        Args:
+            specs: Column definitions keyed by the record attribute name.
+            field_names: Mapping of the record attribute names to GraphQL field names.
+            fields: Attribute names of the fields to decode.
+
+        Returns:
+            Empty columnar data.
+
+        """
+        data = cls()
+        for name in fields:
+            spec = specs[name]
+            data.columns[spec.name] = []
+            data.kinds[spec.name] = spec.kind
+            data._sources[field_names[name]] = spec  # pylint: disable=protected-access
+        return data
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records of a response page to the columns.
+
+        Args:
+            records: Records as parsed from the response.
+
+        """
+        records = list(records)
+        for key, spec in self._sources.items():
+            convert = spec.convert
+            if convert is None:
+                self.columns[spec.name].extend([record[key] for record in records])
+            else:
+                self.columns[spec.name].extend([convert(record[key]) for record in records])
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
@@ -0,0 +1,65 @@
+"""Helpers to decode server responses into data records with little CPU overhead.
+
+JSON responses are parsed with `orjson` if it's installed (`pip install pyaqueduct[fast]`),
+falling back to the standard library parser. Timestamps repeat a lot within a listing,
+e.g. creation and update time of untouched experiments, so their parsing is memoized.
+Strings repeated across records, like tags and file names, are interned to save memory.
+"""
+
+import json
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from gql.transport.exceptions import TransportServerError
+from graphql import ExecutionResult
+from httpx import HTTPStatusError, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # pylint: disable=invalid-name
+
+
+def loads(content: bytes) -> Any:
+    """Parse JSON document with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(content)  # pylint: disable=no-member
+    return json.loads(content)
+
+
+def intern_string(value: Optional[str]) -> Optional[str]:
+    """Intern the string, so equal values repeated in many records share one object."""
+    return sys.intern(value) if value is not None else None
+
+
+@lru_cache(maxsize=8192)
+def parse_datetime(value: str) -> datetime:
+    """Parse ISO 8601 timestamp. Results are memoized, datetime objects are immutable."""
+    if value.endswith("Z"):
+        # `fromisoformat` accepts the UTC designator since Python 3.11 only
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class FastJSONResultMixin:  # pylint: disable=too-few-public-methods
+    """Mixin of HTTPX GraphQL transports which parses responses with `loads`."""
+
+    def _prepare_result(self, response: Response) -> ExecutionResult:
+        self.response_headers = response.headers  # pylint: disable=attribute-defined-outside-init
+        try:
+            result: Dict[str, Any] = loads(response.content)
+        except ValueError:
+            result = {}
+        if not isinstance(result, dict) or ("errors" not in result and "data" not in result):
+            try:
+                response.raise_for_status()
+            except HTTPStatusError as error:
+                raise TransportServerError(str(error), error.response.status_code) from error
+            return super()._prepare_result(response)  # type: ignore[misc]
+        return ExecutionResult(
+            errors=result.get("errors"),
+            data=result.get("data"),
+            extensions=result.get("extensions"),
+        )
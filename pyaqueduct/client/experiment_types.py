@@ -1,11 +1,28 @@
 """Dataclasses for experiment and it's components"""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from pyaqueduct.client.decoding import intern_string, parse_datetime
+from pyaqueduct.client.records import slotted
 
+EXPERIMENT_FIELDS = {
+    "uuid": "uuid",
+    "title": "title",
+    "description": "description",
+    "eid": "eid",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+    "tags": "tags",
+    "files": "files",
+}
+"""GraphQL field names of `ExperimentData` attributes."""
+
+
+@slotted
 @dataclass
 class ExperimentFile:
     """Dataclass for experiment file"""
@@ -18,37 +35,50 @@ class ExperimentFile:
     def from_dict(cls, data):
         """Convert experiment file object to dictionary"""
         return cls(
-            name=data["name"],
+            name=intern_string(data["name"]),
             path=data["path"],
-            modified_at=datetime.fromisoformat(data["modifiedAt"]),
+            modified_at=parse_datetime(data["modifiedAt"]),
+        )
+
+
+def _files_from_dicts(data: List[Dict[str, Any]]) -> List[ExperimentFile]:
+    # same as `ExperimentFile.from_dict`, inlined as listings hold many files
+    return [
+        ExperimentFile(
+            sys.intern(file["name"]), file["path"], parse_datetime(file["modifiedAt"])
         )
+        for file in data
+    ]
 
 
+@slotted
 @dataclass
 class ExperimentData:
-    """Dataclass for experiment"""
+    """Dataclass for experiment. Fields which weren't selected in the query are `None`.
+    Instances have no `__dict__`, and tags decoded from the response are interned
+    to keep large listings compact."""
 
     uuid: UUID
-    title: str
-    description: str
-    eid: str
-    created_at: datetime
-    updated_at: datetime
-    tags: List[str] = field(default_factory=list)
-    files: List[ExperimentFile] = field(default_factory=list)
+    title: Optional[str] = None
+    description: Optional[str] = None
+    eid: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    tags: Optional[List[str]] = field(default_factory=list)
+    files: Optional[List[ExperimentFile]] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data):
         """Convert experiment object to dictionary"""
         return cls(
             uuid=UUID(data["uuid"]),
-            title=data["title"],
-            description=data["description"],
-            tags=data["tags"],
-            eid=data["eid"],
-            files=[ExperimentFile.from_dict(file_data) for file_data in data["files"]],
-            created_at=datetime.fromisoformat(data["createdAt"]),
-            updated_at=datetime.fromisoformat(data["updatedAt"]),
+            title=data.get("title"),
+            description=data.get("description"),
+            tags=[intern_string(tag) for tag in data["tags"]] if "tags" in data else None,
+            eid=data.get("eid"),
+            files=_files_from_dicts(data["files"]) if "files" in data else None,
+            created_at=parse_datetime(data["createdAt"]) if "createdAt" in data else None,
+            updated_at=parse_datetime(data["updatedAt"]) if "updatedAt" in data else None,
         )
 
 
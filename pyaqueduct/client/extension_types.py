@@ -6,6 +6,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from pyaqueduct.client.decoding import intern_string
+
 
 class ExtensionParameterData(BaseModel):
     """Parameter definition for an extension action."""
@@ -28,10 +30,10 @@ class ExtensionParameterData(BaseModel):
             Object populated with server response data
         """
         return cls(
-            name=data["name"],
-            displayName=data["displayName"],
+            name=intern_string(data["name"]),
+            displayName=intern_string(data["displayName"]),
             description=data["description"],
-            dataType=data["dataType"],
+            dataType=intern_string(data["dataType"]),
             defaultValue=data["defaultValue"],
             options=data["options"],
         )
@@ -0,0 +1,209 @@
+"""Requests and responses shared by the synchronous and asynchronous clients.
+
+The clients differ only in how they send a request, so the GraphQL documents, their
+variables, the connection settings and the mapping of server errors are built here.
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from gql.transport import exceptions as gql_exceptions
+from graphql import DocumentNode
+from httpx import Limits, codes
+
+from pyaqueduct.client.experiment_types import EXPERIMENT_FIELDS, ExperimentsInfo, TagsData
+from pyaqueduct.client.extension_types import ExtensionExecutionResultData
+from pyaqueduct.client.task_types import TASK_FIELDS
+from pyaqueduct.exceptions import ForbiddenError, RemoteOperationError, UnAuthorizedError
+from pyaqueduct.schemas.projection import select_fields
+from pyaqueduct.schemas.queries import (
+    get_all_tags_query,
+    get_experiment_query,
+    get_experiments_query,
+    get_task_query,
+)
+
+Request = Tuple[DocumentNode, Dict[str, Any]]
+
+
+def process_response_common(code: codes) -> None:
+    """Process common HTTP return codes."""
+    if code is codes.OK:
+        return
+
+    if code is codes.FORBIDDEN:
+        raise ForbiddenError("Operation is not allowed for the current user.") from None
+
+    if code is codes.UNAUTHORIZED:
+        raise UnAuthorizedError("API token couldn't be verified or is missing.") from None
+
+    raise RemoteOperationError("Remote operation failed.")
+
+
+@contextmanager
+def server_errors() -> Iterator[None]:
+    """Raise the package exceptions for the HTTP errors of a request sent in the context."""
+    try:
+        yield
+    except gql_exceptions.TransportServerError as error:
+        if error.code:
+            process_response_common(codes(error.code))
+        raise
+
+
+@contextmanager
+def graphql_errors() -> Iterator[None]:
+    """Raise the package exceptions for the errors of a GraphQL request sent in the context."""
+    try:
+        with server_errors():
+            yield
+    except gql_exceptions.TransportQueryError as error:
+        raise RemoteOperationError(
+            error.errors if error.errors else "Unknown error occurred in the remote operation."
+        ) from error
+
+
+def http_client_arguments(
+    api_token: Optional[str], timeout: float, max_connections: int, max_keepalive_connections: int
+) -> Dict[str, Any]:
+    """Keyword arguments of the HTTP client sending the requests of the Aqueduct client.
+
+    Args:
+        api_token: Token used to authorize requests.
+        timeout: Response timeout in seconds.
+        max_connections: Maximum number of concurrent connections in the pool.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+
+    Returns:
+        Keyword arguments of `httpx.Client` or `httpx.AsyncClient`.
+
+    """
+    return {
+        "headers": {"Authorization": f"Bearer {api_token}"} if api_token else {},
+        "timeout": timeout,
+        "limits": Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    }
+
+
+def experiments_request(  # pylint: disable=too-many-arguments,duplicate-code
+    limit: int,
+    offset: int,
+    title: Optional[str],
+    tags: Optional[List[str]],
+    start_datetime: Optional[datetime],
+    end_datetime: Optional[datetime],
+    fields: Optional[Sequence[str]],
+) -> Request:
+    """Query of a page of experiments matching the filters, see `get_experiments`."""
+    return (
+        select_fields(
+            get_experiments_query,
+            ("experiments", "experimentsData"),
+            EXPERIMENT_FIELDS,
+            fields,
+            required=("uuid",),
+        ),
+        {
+            "limit": limit,
+            "offset": offset,
+            "title": title,
+            "startDate": start_datetime.isoformat() if start_datetime else None,
+            "endDate": end_datetime.isoformat() if end_datetime else None,
+            "tags": tags,
+        },
+    )
+
+
+def experiment_request(
+    identifier_type: str, value: str, fields: Optional[Sequence[str]]
+) -> Request:
+    """Query of a single experiment identified by its `UUID` or `EID`."""
+    return (
+        select_fields(
+            get_experiment_query, ("experiment",), EXPERIMENT_FIELDS, fields, required=("uuid",)
+        ),
+        {"type": identifier_type, "value": value},
+    )
+
+
+def task_request(task_id: str, fields: Optional[Sequence[str]]) -> Request:
+    """Query of a single task."""
+    return (
+        select_fields(get_task_query, ("task",), TASK_FIELDS, fields, required=("task_id",)),
+        {"taskId": task_id},
+    )
+
+
+def tasks_document(document: DocumentNode, fields: Optional[Sequence[str]]) -> DocumentNode:
+    """Project the task listing document to the given `TaskData` fields."""
+    return select_fields(
+        document, ("tasks", "tasksData"), TASK_FIELDS, fields, required=("task_id",)
+    )
+
+
+def task_filters(  # pylint: disable=too-many-arguments
+    extension_name: Optional[str],
+    experiment_uuid: Optional[str],
+    action_name: Optional[str],
+    username: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> Dict[str, Any]:
+    """Variables of the task listing filters."""
+    return {
+        "extensionName": extension_name,
+        "experimentUuid": experiment_uuid,
+        "actionName": action_name,
+        "username": username,
+        "startDate": start_date.isoformat() if start_date else None,
+        "endDate": end_date.isoformat() if end_date else None,
+    }
+
+
+def extension_action_variables(
+    extension: str, action: str, params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Variables of the extension action execution, parameters are sent as strings."""
+    return {
+        "extension": extension,
+        "action": action,
+        "params": [[k, str(v)] for k, v in params.items()],
+    }
+
+
+def log_experiments_page(experiments: ExperimentsInfo) -> None:
+    """Log the size of a fetched page of experiments."""
+    logging.info(
+        "Fetched %s experiments, total %s experiments",
+        len(experiments.experiments),
+        experiments.total_count,
+    )
+
+
+def tags_request(limit: int, offset: int, dangling: bool) -> Request:
+    """Query of a page of tags."""
+    return get_all_tags_query, {"limit": limit, "offset": offset, "dangling": dangling}
+
+
+def tags_from_response(data: Dict[str, Any]) -> TagsData:
+    """Decode the fetched page of tags and log its size."""
+    tags = TagsData.from_dict(data["tags"])
+    logging.info("Fetched %s tags, total %s tags", len(tags.tags), tags.total_count)
+    return tags
+
+
+def log_extension_result(
+    extension: str, action: str, result: ExtensionExecutionResultData
+) -> None:
+    """Log the result code of an executed extension action."""
+    logging.info(
+        "Executed a %s / %s extension action with result code %d",
+        extension,
+        action,
+        result.returnCode,
+    )
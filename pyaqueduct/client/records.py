@@ -0,0 +1,32 @@
+"""Helpers to define compact record classes."""
+
+from dataclasses import fields
+from typing import Type, TypeVar
+
+T = TypeVar("T")
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Recreate the dataclass with `__slots__`, so its instances don't carry `__dict__`.
+
+    This is what `@dataclass(slots=True)` does on Python 3.10 and newer.
+
+    Args:
+        cls: Dataclass to recreate.
+
+    Returns:
+        Equivalent dataclass with slots.
+
+    """
+    namespace = dict(cls.__dict__)
+    slots = []
+    for field in fields(cls):  # type: ignore[arg-type]
+        namespace.pop(field.name, None)
+        slots.append(field.name)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(slots)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
@@ -0,0 +1,71 @@
+"""Subscriptions to GraphQL operations over a websocket.
+
+Subscriptions need the optional `websockets` package (`pip install pyaqueduct[subscriptions]`).
+When it's missing, or the server doesn't accept the websocket connection or the operation,
+`SubscriptionUnavailableError` is raised, so the caller can fall back to polling.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+from gql import Client
+from gql.transport.exceptions import TransportError
+from graphql import DocumentNode
+
+from pyaqueduct.exceptions import SubscriptionUnavailableError
+
+try:
+    from gql.transport.websockets import WebsocketsTransport  # pylint: disable=ungrouped-imports
+    from websockets.exceptions import WebSocketException
+except ImportError:  # pragma: no cover - depends on the environment
+    WebsocketsTransport = None  # pylint: disable=invalid-name
+    WebSocketException = TransportError  # pylint: disable=invalid-name
+
+
+def websocket_url(url: str) -> str:
+    """Websocket URL of the GraphQL endpoint served at the given HTTP URL."""
+    if url.startswith("https://"):
+        return "wss://" + url[len("https://") :]
+    if url.startswith("http://"):
+        return "ws://" + url[len("http://") :]
+    return url
+
+
+async def subscribe(
+    url: str,
+    operation: DocumentNode,
+    variable_values: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10.0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Subscribe to the operation and yield its results until the server completes it.
+
+    Args:
+        url: Websocket URL of the GraphQL endpoint.
+        operation: Subscription schema.
+        variable_values: Values for the params to be sent with the subscription.
+        headers: Headers of the websocket handshake request.
+        timeout: Timeout in seconds of the connection and its acknowledgement.
+
+    Returns:
+        Asynchronous iterator over the results.
+
+    """
+    if WebsocketsTransport is None:
+        raise SubscriptionUnavailableError(
+            "websockets is required, install it with `pip install pyaqueduct[subscriptions]`."
+        )
+    transport = WebsocketsTransport(
+        url=url, headers=headers, connect_timeout=timeout, ack_timeout=timeout
+    )
+    try:
+        async with Client(transport=transport) as session:
+            subscription = session.subscribe(operation, variable_values=variable_values)
+            try:
+                async for result in subscription:  # pylint: disable=not-an-iterable
+                    yield result
+            finally:
+                # unsubscribe before the session closes, which waits for the listeners
+                await subscription.aclose()
+    except (OSError, asyncio.TimeoutError, TransportError, WebSocketException) as error:
+        raise SubscriptionUnavailableError(str(error) or type(error).__name__) from error
@@ -0,0 +1,143 @@
+"""Cache of the task data fetched by the client.
+
+Data of a task with a terminal status never changes, so it's kept until it's evicted
+from memory, and optionally in an SQLite database, which preserves it across sessions.
+Data of the other tasks is reused only for a short time. Records are fetched with
+a subset of their fields, so every entry remembers which fields it holds.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional
+from uuid import UUID
+
+from pyaqueduct.client.cache import LRUCache
+from pyaqueduct.client.task_types import TASK_FIELDS, TERMINAL_TASK_STATUSES, TaskData
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    uuid TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    __slots__ = ("record", "fields", "fetched_at", "terminal")
+
+    def __init__(self, record: TaskData, fields: FrozenSet[str], fetched_at: float):
+        self.record = record
+        self.fields = fields
+        self.fetched_at = fetched_at
+        self.terminal = record.task_status in TERMINAL_TASK_STATUSES
+
+
+class TaskCache:
+    """Thread-safe cache of task data keyed by the task identifier.
+
+    Args:
+        maxsize: Maximum number of tasks kept in memory. Zero disables the cache.
+        ttl: Time in seconds for which data of unfinished tasks is reused.
+        path: Path of the SQLite database keeping data of the finished tasks,
+            `None` keeps the data in memory only.
+
+    """
+
+    def __init__(self, maxsize: int, ttl: float, path: Optional[str] = None):
+        self.ttl = ttl
+        self._entries: LRUCache[UUID, _Entry] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get(
+        self, task_id: UUID, fields: FrozenSet[str], max_age: Optional[float] = None
+    ) -> Optional[TaskData]:
+        """Get the cached data of the task, if it holds all the fields.
+
+        Args:
+            task_id: Task identifier.
+            fields: Names of `TaskData` fields which have to be present.
+            max_age: Maximum age in seconds of the data of an unfinished task, limited
+                by the cache TTL. Data of the finished tasks is returned regardless.
+                Zero skips the database, as callers polling for a live status rarely
+                find the task there.
+
+        Returns:
+            Task data or `None` if it isn't cached.
+
+        """
+        entry = self._entries.get(task_id)
+        if entry is None and self._connection is not None and max_age != 0:
+            entry = self._load(task_id)
+        if entry is None or not fields <= entry.fields:
+            return None
+        if entry.terminal:
+            return entry.record
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        return entry.record if time.monotonic() - entry.fetched_at < ttl else None
+
+    def put(self, data: Dict[str, Any], record: TaskData, fields: FrozenSet[str]) -> None:
+        """Cache the task data decoded from the server response.
+
+        Args:
+            data: Task as it was received from the server.
+            record: Task data decoded from the response.
+            fields: Names of `TaskData` fields selected in the query.
+
+        """
+        entry = self._entries.get(record.task_id)
+        if entry is not None and entry.terminal and not fields >= entry.fields:
+            # data of a finished task doesn't change, so the fields can be merged
+            record = entry.record.model_copy(
+                update={name: getattr(record, name) for name in fields}
+            )
+            fields = entry.fields | fields
+        entry = _Entry(record, fields, time.monotonic())
+        self._entries.put(record.task_id, entry)
+        if entry.terminal and self._connection is not None:
+            self._store(data)
+
+    def discard(self, task_id: UUID) -> None:
+        """Remove the task from the cache, e.g. when it's going to change."""
+        self._entries.pop(task_id)
+        if self._connection is not None:
+            with self._lock:
+                self._connection.execute("DELETE FROM tasks WHERE uuid = ?", (str(task_id),))
+                self._connection.commit()
+
+    def _store(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM tasks WHERE uuid = ?", (data["uuid"],)
+            ).fetchone()
+            if row is not None:
+                data = {**json.loads(row[0]), **data}
+            self._connection.execute(
+                "INSERT OR REPLACE INTO tasks (uuid, data) VALUES (?, ?)",
+                (data["uuid"], json.dumps(data)),
+            )
+            self._connection.commit()
+
+    def _load(self, task_id: UUID) -> Optional[_Entry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM tasks WHERE uuid = ?", (str(task_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        fields = frozenset(name for name, key in TASK_FIELDS.items() if key in data)
+        entry = _Entry(TaskData.from_dict(data), fields, time.monotonic())
+        self._entries.put(task_id, entry)
+        return entry
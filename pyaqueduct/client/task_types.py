@@ -8,9 +8,40 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from pyaqueduct.client.decoding import intern_string
 from pyaqueduct.client.experiment_types import ExperimentData
 from pyaqueduct.client.extension_types import ExtensionParameterData
 
+TASK_FIELDS = {
+    "task_id": "uuid",
+    "task_status": "taskStatus",
+    "extension_name": "extensionName",
+    "action_name": "actionName",
+    "created_by": "createdBy",
+    "received_at": "receivedAt",
+    "ended_at": "endedAt",
+    "result_code": "resultCode",
+    "std_out": "stdOut",
+    "std_err": "stdErr",
+    "experiment": "experiment",
+    "parameters": "parameters",
+}
+"""GraphQL field names of `TaskData` attributes."""
+
+TASK_SUMMARY_FIELDS = (
+    "task_status",
+    "extension_name",
+    "action_name",
+    "created_by",
+    "received_at",
+    "ended_at",
+    "result_code",
+)
+"""`TaskData` fields of a task summary, without logs, experiment and parameters."""
+
+TERMINAL_TASK_STATUSES = frozenset({"SUCCESS", "FAILURE", "REVOKED", "REJECTED", "IGNORED"})
+"""Statuses of the tasks which have finished, their data doesn't change anymore."""
+
 
 class ParameterData(BaseModel):
     """Definition for task parameters"""
@@ -34,16 +65,16 @@ class ParameterData(BaseModel):
         )
 
 class TaskData(BaseModel):
-    """Parameter definition for a task."""
+    """Parameter definition for a task. Fields which weren't selected in the query are `None`."""
 
     task_id: UUID
-    task_status: str
-    extension_name: str
-    action_name: str
-    created_by: str
-    received_at: datetime
-    experiment: ExperimentData
-    parameters: List[ParameterData]
+    task_status: Optional[str] = None
+    extension_name: Optional[str] = None
+    action_name: Optional[str] = None
+    created_by: Optional[str] = None
+    received_at: Optional[datetime] = None
+    experiment: Optional[ExperimentData] = None
+    parameters: Optional[List[ParameterData]] = None
     result_code: Optional[int] = None
     ended_at: Optional[datetime] = None
     std_out: Optional[str] = None
@@ -59,21 +90,27 @@ class TaskData(BaseModel):
         Returns:
             Object populated with server response data.
         """
+        # identifier and timestamps are parsed by the compiled pydantic validator,
+        # which is faster than converting them in Python beforehand
         return cls(
-            task_id=UUID(data["uuid"]),
-            task_status=data["taskStatus"],
-            result_code=data["resultCode"],
-            extension_name=data["extensionName"],
-            action_name=data["actionName"],
-            created_by=data["createdBy"],
-            received_at=data["receivedAt"],
-            ended_at=data["endedAt"],
-            std_out=data["stdOut"],
-            std_err=data["stdErr"],
-            experiment=ExperimentData.from_dict(data["experiment"]),
-            parameters=[
-                ParameterData.from_dict(parameter) for parameter in data["parameters"]
-            ]
+            task_id=data["uuid"],
+            task_status=intern_string(data.get("taskStatus")),
+            result_code=data.get("resultCode"),
+            extension_name=intern_string(data.get("extensionName")),
+            action_name=intern_string(data.get("actionName")),
+            created_by=intern_string(data.get("createdBy")),
+            received_at=data.get("receivedAt"),
+            ended_at=data.get("endedAt"),
+            std_out=data.get("stdOut"),
+            std_err=data.get("stdErr"),
+            experiment=(
+                ExperimentData.from_dict(data["experiment"]) if "experiment" in data else None
+            ),
+            parameters=(
+                [ParameterData.from_dict(parameter) for parameter in data["parameters"]]
+                if "parameters" in data
+                else None
+            ),
         )
 
 
@@ -31,3 +31,11 @@ class FileDownloadError(PyAqueductError):
 
 class FileRemovalError(PyAqueductError):
     """File removal error."""
+
+
+class TaskTimeoutError(PyAqueductError):
+    """Tasks haven't finished within the timeout."""
+
+
+class SubscriptionUnavailableError(PyAqueductError):
+    """Subscription can't be established or has been interrupted."""
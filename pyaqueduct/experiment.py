@@ -2,21 +2,52 @@
 
 from __future__ import annotations
 
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, validate_call
+from pydantic import BaseModel
 
-from pyaqueduct.client import AqueductClient
+from pyaqueduct.client import AqueductClient, ExperimentData
+from pyaqueduct.exceptions import RemoteOperationError
+from pyaqueduct.validation import validate_call
 
 
 class Experiment(BaseModel):
-    """Experiment model."""
+    """Experiment model.
+
+    Experiment keeps a snapshot of the experiment data, so that reading several
+    properties doesn't cost a request each. The snapshot is fetched again when it's older
+    than `cache_ttl` seconds, on `refresh()` call, or after files of the experiment have
+    been changed. Modifications of the experiment update the snapshot from the response.
+
+    Changes of title, description and tags made within `batch()` context are collected and
+    sent in one request when the context exits.
+    """
 
     _client: AqueductClient
     "Client object reference."
 
+    _snapshot: Optional[ExperimentData] = None
+    "Latest known data of the experiment."
+
+    _snapshot_time: float = 0.0
+    "Monotonic time of the snapshot update."
+
+    _snapshot_fields: Optional[FrozenSet[str]] = None
+    "Names of the fields fetched into the snapshot, `None` if all of them were fetched."
+
+    _cache_ttl: float = 5.0
+    "Time in seconds for which the snapshot is considered fresh."
+
+    _pending: Optional[Dict[str, Any]] = None
+    "Changes collected within the batch context."
+
+    _validate_arguments: bool = True
+    "Whether arguments of the methods are validated."
+
     uuid: UUID
     "UUID of the experiment. This is an internal experiment identifier in the database"
 
@@ -26,14 +57,194 @@ class Experiment(BaseModel):
     created_at: datetime
     "Creation datetime of the experiment."
 
-    def __init__(self, uuid: UUID, eid: str, created_at: datetime, client: AqueductClient, **data):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        uuid: UUID,
+        eid: str,
+        created_at: datetime,
+        client: AqueductClient,
+        snapshot: Optional[ExperimentData] = None,
+        snapshot_fields: Optional[Iterable[str]] = None,
+        cache_ttl: float = 5.0,
+        validate_arguments: bool = True,
+        **data,
+    ):
         super().__init__(uuid=uuid, eid=eid, created_at=created_at, **data)
         self._client = client
+        self._cache_ttl = cache_ttl
+        self._validate_arguments = validate_arguments
+        if snapshot is not None:
+            self._update_snapshot(snapshot, snapshot_fields)
+
+    @classmethod
+    def from_data(  # pylint: disable=too-many-arguments
+        cls,
+        client: AqueductClient,
+        data: ExperimentData,
+        fields: Optional[Iterable[str]] = None,
+        cache_ttl: float = 5.0,
+        validate_arguments: bool = True,
+    ) -> Experiment:
+        """Create experiment object holding the data decoded from the server response,
+        without running the model validation of the constructor. The data is kept
+        as the snapshot.
+
+        Args:
+            client: Client object reference.
+            data: Experiment data.
+            fields: Names of the fields selected in the query, `None` if all of them were.
+            cache_ttl: Time in seconds for which the snapshot is considered fresh.
+            validate_arguments: Whether arguments of the methods are validated.
+
+        Returns:
+            Experiment object.
+        """
+        # same state as model_construct() leaves, but resolving the defaults of private
+        # attributes there costs several times more than the rest of the handle
+        experiment = cls.__new__(cls)
+        object.__setattr__(
+            experiment,
+            "__dict__",
+            {"uuid": data.uuid, "eid": data.eid, "created_at": data.created_at},
+        )
+        object.__setattr__(experiment, "__pydantic_fields_set__", {"uuid", "eid", "created_at"})
+        object.__setattr__(experiment, "__pydantic_extra__", None)
+        object.__setattr__(
+            experiment,
+            "__pydantic_private__",
+            {
+                "_client": client,
+                "_snapshot": data,
+                "_snapshot_time": time.monotonic(),
+                "_snapshot_fields": None if fields is None else frozenset(fields),
+                "_cache_ttl": cache_ttl,
+                "_pending": None,
+                "_validate_arguments": validate_arguments,
+            },
+        )
+        return experiment
+
+    def refresh(self) -> None:
+        """Fetch the latest data of the experiment from the server."""
+        self._update_snapshot(self._client.get_experiment(experiment_uuid=self.uuid))
+
+    def _update_snapshot(
+        self, snapshot: ExperimentData, fields: Optional[Iterable[str]] = None
+    ) -> None:
+        self._snapshot = snapshot
+        self._snapshot_fields = None if fields is None else frozenset(fields)
+        self._snapshot_time = time.monotonic()
+
+    def _invalidate_snapshot(self) -> None:
+        self._snapshot = None
+
+    @validate_call
+    def update(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        add_tags: Optional[List[str]] = None,
+        remove_tags: Optional[List[str]] = None,
+    ) -> None:
+        """Update title, description and tags of experiment in one request.
+
+        Args:
+            title: New title.
+            description: New description.
+            add_tags: List of tags to be added to the experiment.
+            remove_tags: List of tags to be removed from the experiment.
+
+        Raises:
+            RemoteOperationError: Some of the changes failed. The others might have been
+                applied, so the data is fetched again on the next access.
+
+        """
+        if self._collect(title, description, add_tags, remove_tags):
+            return
+
+        try:
+            snapshot = self._client.apply_experiment_changes(
+                experiment_uuid=self.uuid,
+                title=title,
+                description=description,
+                add_tags=add_tags,
+                remove_tags=remove_tags,
+            )
+        except RemoteOperationError:
+            # mutations preceding the failed one might have been applied already
+            self._invalidate_snapshot()
+            raise
+        if snapshot is not None:
+            self._update_snapshot(snapshot)
+
+    def _collect(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        add_tags: Optional[List[str]] = None,
+        remove_tags: Optional[List[str]] = None,
+    ) -> bool:
+        """Add the changes to the batch, if it's open. Returns whether they were collected."""
+        if self._pending is None:
+            return False
+        if title is not None:
+            self._pending["title"] = title
+        if description is not None:
+            self._pending["description"] = description
+        for tag in add_tags or []:
+            self._pending["remove_tags"].pop(tag, None)
+            self._pending["add_tags"][tag] = None
+        for tag in remove_tags or []:
+            self._pending["add_tags"].pop(tag, None)
+            self._pending["remove_tags"][tag] = None
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator[Experiment]:
+        """Collect changes of title, description and tags, and send them in one request.
+
+        The changes are sent when the context exits, and discarded if it exits with an
+        exception. Properties read within the context return the data known before it.
+        Nested contexts join the outer one.
+
+        Example:
+            ```python
+            with experiment.batch():
+                experiment.title = "New title"
+                experiment.add_tags(["reviewed"])
+                experiment.remove_tag("draft")
+            ```
+
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = {"add_tags": {}, "remove_tags": {}}
+        try:
+            yield self
+            pending, self._pending = self._pending, None
+            self.update(
+                title=pending.get("title"),
+                description=pending.get("description"),
+                add_tags=list(pending["add_tags"]),
+                remove_tags=list(pending["remove_tags"]),
+            )
+        finally:
+            self._pending = None
+
+    def _snapshot_field(self, name: str) -> Any:
+        if self._snapshot is None or time.monotonic() - self._snapshot_time >= self._cache_ttl:
+            self.refresh()
+        elif self._snapshot_fields is not None and name not in self._snapshot_fields:
+            # snapshot was taken from a projected query without this field
+            self.refresh()
+        return getattr(self._snapshot, name)
 
     @property
     def title(self) -> str:
         """Get title of experiment."""
-        return self._client.get_experiment(experiment_uuid=self.uuid).title
+        return self._snapshot_field("title")
 
     @title.setter
     @validate_call
@@ -44,12 +255,15 @@ class Experiment(BaseModel):
             value: New title.
 
         """
-        self._client.update_experiment(experiment_uuid=self.uuid, title=value)
+        if not self._collect(title=value):
+            self._update_snapshot(
+                self._client.update_experiment(experiment_uuid=self.uuid, title=value)
+            )
 
     @property
     def description(self) -> str:
         """Get description of experiment."""
-        return self._client.get_experiment(self.uuid).description
+        return self._snapshot_field("description")
 
     @description.setter
     @validate_call
@@ -60,12 +274,15 @@ class Experiment(BaseModel):
             value: New description.
 
         """
-        self._client.update_experiment(experiment_uuid=self.uuid, description=value)
+        if not self._collect(description=value):
+            self._update_snapshot(
+                self._client.update_experiment(experiment_uuid=self.uuid, description=value)
+            )
 
     @property
     def tags(self) -> List[str]:
         """Gets tags of experiment."""
-        return self._client.get_experiment(self.uuid).tags
+        return self._snapshot_field("tags")
 
     @validate_call
     def add_tags(self, tags: List[str]) -> None:
@@ -75,12 +292,18 @@ class Experiment(BaseModel):
             tags: List of tags to be added to the experiment.
 
         """
-        self._client.add_tags_to_experiment(experiment_uuid=self.uuid, tags=tags)
+        if not self._collect(add_tags=tags):
+            self._update_snapshot(
+                self._client.add_tags_to_experiment(experiment_uuid=self.uuid, tags=tags)
+            )
 
     @validate_call
     def remove_tag(self, tag: str) -> None:
         """Remove tag from experiment."""
-        self._client.remove_tag_from_experiment(experiment_uuid=self.uuid, tag=tag)
+        if not self._collect(remove_tags=[tag]):
+            self._update_snapshot(
+                self._client.remove_tag_from_experiment(experiment_uuid=self.uuid, tag=tag)
+            )
 
     @validate_call
     def remove_files(self, files: List[str]) -> None:
@@ -91,13 +314,12 @@ class Experiment(BaseModel):
 
         """
         self._client.remove_files_from_experiment(experiment_uuid=self.uuid, files=files)
+        self._invalidate_snapshot()
 
     @property
     def files(self) -> List[Tuple[str, datetime]]:
         """Get file names of expriment."""
-        return [
-            (item.name, item.modified_at) for item in self._client.get_experiment(self.uuid).files
-        ]
+        return [(item.name, item.modified_at) for item in self._snapshot_field("files")]
 
     @validate_call
     def download_file(self, file_name: str, destination_dir: str) -> None:
@@ -108,8 +330,9 @@ class Experiment(BaseModel):
     def upload_file(self, file: str) -> None:
         """Upload the specified file to experiment."""
         self._client.upload_file(self.uuid, file=file)
+        self._invalidate_snapshot()
 
     @property
     def updated_at(self) -> datetime:
         """Get last updated datetime of the experiment."""
-        return self._client.get_experiment(self.uuid).updated_at
+        return self._snapshot_field("updated_at")
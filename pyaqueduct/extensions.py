@@ -5,13 +5,19 @@ parameters."""
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import threading
+import time
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from pyaqueduct.client import AqueductClient
 from pyaqueduct.client.extension_types import (
     ExtensionActionData,
+    ExtensionData,
     ExtensionExecutionResultData,
     ExtensionParameterData,
 )
@@ -39,6 +45,27 @@ class ExtensionAction(BaseModel):
         super().__init__(extension=extension, data=action_data, parameters=action_data.parameters)
         self._client = client
 
+    @classmethod
+    def from_data(
+        cls, extension: Extension, action_data: ExtensionActionData, client: AqueductClient
+    ) -> ExtensionAction:
+        """Create extension action from the data decoded from the server response.
+        The parameters are taken from the data as they are.
+
+        Args:
+            extension: Extension to which the action belongs.
+            action_data: Extension action data.
+            client: Client object reference.
+
+        Returns:
+            Extension action object.
+        """
+        action = cls.model_construct(
+            extension=extension, data=action_data, parameters=action_data.parameters
+        )
+        action._client = client  # pylint: disable=protected-access
+        return action
+
     @property
     def name(self) -> str:
         """Extension action name. Unique inside an extension."""
@@ -86,6 +113,8 @@ class Extension(BaseModel):
 
     actions: List[ExtensionAction]
 
+    _actions_by_name: Dict[str, ExtensionAction] = PrivateAttr(default_factory=dict)
+
     def __init__(
         self,
         name: str,
@@ -97,3 +126,138 @@ class Extension(BaseModel):
         super().__init__(name=name, description=description, authors=authors, actions=[])
         for action in actions:
             self.actions.append(ExtensionAction(self, action, client))
+        self._actions_by_name = {action.name: action for action in self.actions}
+
+    @classmethod
+    def from_data(cls, data: ExtensionData, client: AqueductClient) -> Extension:
+        """Create extension and its actions from the data decoded from the server
+        response, without validating it.
+
+        Args:
+            data: Extension data.
+            client: Client object reference.
+
+        Returns:
+            Extension object.
+        """
+        extension = cls.model_construct(
+            name=data.name, description=data.description, authors=data.authors, actions=[]
+        )
+        extension.actions.extend(
+            ExtensionAction.from_data(extension, action, client) for action in data.actions
+        )
+        extension._actions_by_name = {  # pylint: disable=protected-access
+            action.name: action for action in extension.actions
+        }
+        return extension
+
+    def action(self, name: str) -> ExtensionAction:
+        """Get the action of the extension by its name.
+
+        Args:
+            name: Name of the action.
+
+        Returns:
+            Extension action object.
+        """
+        try:
+            return self._actions_by_name[name]
+        except KeyError:
+            raise KeyError(f"Extension {self.name} has no action {name}.") from None
+
+
+class ExtensionCatalogue(BaseModel):
+    """Cache of the extensions available on the server. The extension list is fetched
+    again once it's older than `ttl` seconds, or after `invalidate()` call. Extensions and
+    their actions are looked up by name without scanning the list.
+
+    Args:
+        client: Client object reference.
+        ttl: Time in seconds for which the fetched extension list is reused.
+            Zero fetches the list on every access.
+        path: Path of a JSON file to save the fetched extension list to, so that the next
+            session can reuse it while it's fresh. `None` keeps it in memory only.
+
+    """
+
+    _client: AqueductClient = PrivateAttr()
+    _ttl: float = PrivateAttr()
+    _path: Optional[str] = PrivateAttr()
+    _extensions: Optional[Dict[str, Extension]] = PrivateAttr(default=None)
+    _fetched_at: float = PrivateAttr(default=0.0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(self, client: AqueductClient, ttl: float, path: Optional[str] = None):
+        super().__init__()
+        self._client = client
+        self._ttl = ttl
+        self._path = path
+
+    def get_extensions(self) -> List[Extension]:
+        """Get the extensions, fetching them if the cached list has expired.
+
+        Returns:
+            List of extension objects.
+        """
+        return list(self._catalogue().values())
+
+    def get_extension(self, name: str) -> Extension:
+        """Get the extension by its name, fetching the extensions if the cached list
+        has expired.
+
+        Args:
+            name: Name of the extension.
+
+        Returns:
+            Extension object.
+        """
+        try:
+            return self._catalogue()[name]
+        except KeyError:
+            raise KeyError(f"There's no extension {name}.") from None
+
+    def invalidate(self) -> None:
+        """Drop the cached extension list, including the saved one."""
+        with self._lock:
+            self._extensions = None
+            if self._path is not None and os.path.exists(self._path):
+                os.remove(self._path)
+
+    def _catalogue(self) -> Dict[str, Extension]:
+        with self._lock:
+            if self._extensions is None and self._path is not None:
+                self._load()
+            if self._extensions is None or time.time() - self._fetched_at >= self._ttl:
+                extensions = self._client.get_extensions()
+                self._set(extensions, time.time())
+                if self._path is not None:
+                    self._save(extensions)
+            return self._extensions
+
+    def _set(self, extensions: List[ExtensionData], fetched_at: float) -> None:
+        self._extensions = {
+            data.name: Extension.from_data(data, self._client) for data in extensions
+        }
+        self._fetched_at = fetched_at
+
+    def _save(self, extensions: List[ExtensionData]) -> None:
+        temporary_path = f"{self._path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "fetched_at": self._fetched_at,
+                    "extensions": [data.model_dump(mode="json") for data in extensions],
+                },
+                file,
+            )
+        os.replace(temporary_path, self._path)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                saved = json.load(file)
+            extensions = [ExtensionData.model_validate(data) for data in saved["extensions"]]
+        except (OSError, ValueError, KeyError) as error:
+            logging.info("Saved extension list can't be used: %s", error)
+            return
+        self._set(extensions, saved["fetched_at"])
@@ -0,0 +1,187 @@
+"""In-memory index module to query experiment data without requests to the server."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, PrivateAttr
+
+from pyaqueduct.client import ExperimentData
+
+_MAX_UUID = UUID(int=(1 << 128) - 1)
+
+
+def _utc(value: datetime) -> datetime:
+    # the server sends naive times in UTC, the local store returns aware ones
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _window(
+    timeline: List[Tuple[datetime, UUID]], after: Optional[datetime], before: Optional[datetime]
+) -> Set[UUID]:
+    # (time,) sorts before and (time, _MAX_UUID) after all the entries of the same time
+    start = 0 if after is None else bisect_left(timeline, (_utc(after),))
+    end = (
+        len(timeline) if before is None else bisect_right(timeline, (_utc(before), _MAX_UUID))
+    )
+    return {uuid for _, uuid in timeline[start:end]}
+
+
+class ExperimentIndex(BaseModel):
+    """Index of experiment data for combined queries answered locally.
+
+    Tags and file names are kept in inverted indexes, creation and update times in
+    sorted lists, so a query only touches the experiments matching its most selective
+    filters. Times are compared in UTC, naive datetimes are taken as UTC. Experiment data
+    is typically taken from `LocalStore.find_experiments()` or `API.scan_experiments()`,
+    all its fields have to be fetched.
+
+    Args:
+        experiments: Initial experiment data to index.
+
+    """
+
+    _experiments: Dict[UUID, ExperimentData] = PrivateAttr(default_factory=dict)
+    _by_eid: Dict[str, UUID] = PrivateAttr(default_factory=dict)
+    _by_tag: Dict[str, Set[UUID]] = PrivateAttr(default_factory=lambda: defaultdict(set))
+    _by_file_name: Dict[str, Set[UUID]] = PrivateAttr(default_factory=lambda: defaultdict(set))
+    _created: List[Tuple[datetime, UUID]] = PrivateAttr(default_factory=list)
+    _updated: List[Tuple[datetime, UUID]] = PrivateAttr(default_factory=list)
+
+    def __init__(self, experiments: Iterable[ExperimentData] = ()):
+        super().__init__()
+        self.update(experiments)
+
+    def __len__(self) -> int:
+        return len(self._experiments)
+
+    def __contains__(self, uuid: UUID) -> bool:
+        return uuid in self._experiments
+
+    def update(self, experiments: Iterable[ExperimentData]) -> None:
+        """Add experiments to the index, replacing the indexed data of the same experiments.
+
+        Args:
+            experiments: Experiment data to index.
+
+        """
+        batch = {experiment.uuid: experiment for experiment in experiments}
+        indexed = self._experiments
+        self.remove([uuid for uuid in batch if uuid in indexed])
+        indexed.update(batch)
+        by_eid, by_tag, by_file_name = self._by_eid, self._by_tag, self._by_file_name
+        for uuid, experiment in batch.items():
+            by_eid[experiment.eid] = uuid
+            for tag in experiment.tags:
+                by_tag[tag].add(uuid)
+            for file in experiment.files:
+                by_file_name[file.name].add(uuid)
+        # sorting once merges the sorted runs, rather than inserting one by one
+        created, updated = self._created, self._updated
+        created.extend((_utc(experiment.created_at), uuid) for uuid, experiment in batch.items())
+        created.sort()
+        updated.extend((_utc(experiment.updated_at), uuid) for uuid, experiment in batch.items())
+        updated.sort()
+
+    def remove(self, uuids: Iterable[UUID]) -> None:
+        """Remove experiments from the index. Unknown UUIDs are ignored.
+
+        Args:
+            uuids: UUIDs of the experiments.
+
+        """
+        indexed, by_eid = self._experiments, self._by_eid
+        by_tag, by_file_name = self._by_tag, self._by_file_name
+        removed = set()
+        for uuid in uuids:
+            experiment = indexed.pop(uuid, None)
+            if experiment is None:
+                continue
+            removed.add(uuid)
+            if by_eid.get(experiment.eid) == uuid:
+                del by_eid[experiment.eid]
+            for tag in experiment.tags:
+                self._discard(by_tag, tag, uuid)
+            for file in experiment.files:
+                self._discard(by_file_name, file.name, uuid)
+        if removed:
+            self._created = [entry for entry in self._created if entry[1] not in removed]
+            self._updated = [entry for entry in self._updated if entry[1] not in removed]
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[UUID]], key: str, uuid: UUID) -> None:
+        index[key].discard(uuid)
+        if not index[key]:
+            del index[key]
+
+    def get(self, uuid: UUID) -> Optional[ExperimentData]:
+        """Get indexed data of the experiment, `None` if it isn't indexed."""
+        return self._experiments.get(uuid)
+
+    def get_by_eid(self, eid: str) -> Optional[ExperimentData]:
+        """Get indexed data of the experiment by its EID, `None` if it isn't indexed."""
+        uuid = self._by_eid.get(eid)
+        return None if uuid is None else self._experiments[uuid]
+
+    def find_experiments(  # pylint: disable=too-many-arguments
+        self,
+        search: Optional[str] = None,
+        all_tags: Optional[List[str]] = None,
+        any_tags: Optional[List[str]] = None,
+        file_names: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+    ) -> List[ExperimentData]:
+        """Find the indexed experiments matching all the filters provided in arguments.
+        The experiments are ordered from the most recently created.
+
+        Args:
+            search: The string to search for in the title of experiments, case insensitive.
+            all_tags: Experiments having every of these tags are returned.
+            any_tags: Experiments having at least one of these tags are returned.
+            file_names: Experiments having a file with any of these names are returned.
+            created_after: Experiments created at or after this datetime are returned.
+            created_before: Experiments created at or before this datetime are returned.
+            updated_after: Experiments updated at or after this datetime are returned.
+            updated_before: Experiments updated at or before this datetime are returned.
+
+        Returns:
+            List of experiments data.
+
+        """
+        candidates: List[Set[UUID]] = []
+        for tag in all_tags or []:
+            candidates.append(self._by_tag.get(tag, set()))
+        if any_tags is not None:
+            candidates.append(set().union(*(self._by_tag.get(tag, ()) for tag in any_tags)))
+        if file_names is not None:
+            candidates.append(
+                set().union(*(self._by_file_name.get(name, ()) for name in file_names))
+            )
+        if created_after is not None or created_before is not None:
+            candidates.append(_window(self._created, created_after, created_before))
+        if updated_after is not None or updated_before is not None:
+            candidates.append(_window(self._updated, updated_after, updated_before))
+
+        if candidates:
+            candidates.sort(key=len)
+            uuids = set(candidates[0]).intersection(*candidates[1:])
+        else:
+            uuids = set(self._experiments)
+
+        experiments = [self._experiments[uuid] for uuid in uuids]
+        if search:
+            search = search.casefold()
+            experiments = [
+                experiment for experiment in experiments if search in experiment.title.casefold()
+            ]
+        experiments.sort(key=lambda experiment: _utc(experiment.created_at), reverse=True)
+        return experiments
@@ -0,0 +1,233 @@
+"""Polling module to wait for tasks to finish with few requests to the server."""
+
+import asyncio
+import logging
+import random
+import time
+from functools import partial
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field, PositiveFloat
+
+from pyaqueduct.client import AqueductClient
+from pyaqueduct.client.task_types import TERMINAL_TASK_STATUSES, TaskData
+from pyaqueduct.exceptions import (
+    RemoteOperationError,
+    SubscriptionUnavailableError,
+    TaskTimeoutError,
+)
+from pyaqueduct.schemas.subscriptions import task_status_subscription
+
+
+class Backoff(BaseModel):
+    """Polling intervals growing exponentially up to a limit. Every interval is randomly
+    stretched or shrunk by the `jitter` fraction, so that many clients started together
+    don't poll the server in lockstep.
+
+    Args:
+        initial: First interval in seconds.
+        maximum: Limit of the intervals in seconds.
+        factor: Ratio of consecutive intervals.
+        jitter: Maximum relative deviation of an interval.
+
+    """
+
+    initial: PositiveFloat = 0.5
+    maximum: PositiveFloat = 10.0
+    factor: float = Field(default=1.5, ge=1.0)
+    jitter: float = Field(default=0.1, ge=0.0, lt=1.0)
+
+    def intervals(self) -> Iterator[float]:
+        """Generate the polling intervals.
+
+        Returns:
+            Infinite iterator over the intervals in seconds.
+
+        """
+        interval = self.initial
+        while True:
+            yield interval * random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+            interval = min(interval * self.factor, self.maximum)
+
+
+def _fetch(client: AqueductClient, task_ids: List[UUID], fields: Optional[List[str]]):
+    batch = client.get_tasks_by_ids(task_ids, fields=fields, max_age=0)
+    if batch.failed:
+        raise RemoteOperationError(
+            "; ".join(f"{task_id}: {message}" for task_id, message in batch.failed.items())
+        )
+    return batch.succeeded
+
+
+def wait_for_tasks(
+    client: AqueductClient,
+    task_ids: Sequence[UUID],
+    timeout: Optional[float] = None,
+    backoff: Optional[Backoff] = None,
+) -> Iterator[TaskData]:
+    """Wait for the tasks to finish, yielding them in the order of completion.
+
+    Every tick fetches only the status of all the outstanding tasks, in a single request.
+    The full data is fetched once for the tasks which have reached a terminal status,
+    and these tasks aren't polled anymore.
+
+    Args:
+        client: Client object reference.
+        task_ids: Identifiers of the tasks.
+        timeout: Maximum time to wait in seconds, `None` waits without limit.
+        backoff: Polling intervals, the default ones if not given.
+
+    Returns:
+        Iterator over the full data of the finished tasks.
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    intervals = (backoff or Backoff()).intervals()
+    outstanding = list(dict.fromkeys(UUID(str(task_id)) for task_id in task_ids))
+    while outstanding:
+        statuses = _fetch(client, outstanding, ["task_status"])
+        finished = [
+            task_id
+            for task_id in outstanding
+            if statuses[task_id].task_status in TERMINAL_TASK_STATUSES
+        ]
+        if finished:
+            finished_set = set(finished)
+            outstanding = [task_id for task_id in outstanding if task_id not in finished_set]
+            records = _fetch(client, finished, None)
+            logging.info("%s tasks finished, %s outstanding", len(finished), len(outstanding))
+            yield from (records[task_id] for task_id in finished)
+            if not outstanding:
+                return
+
+        delay = next(intervals)  # pylint: disable=stop-iteration-return
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TaskTimeoutError(
+                    f"{len(outstanding)} tasks haven't finished within {timeout} seconds."
+                )
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+
+def stream_task_logs(
+    client: AqueductClient, task_id: UUID, backoff: Optional[Backoff] = None
+) -> Iterator[Tuple[str, str]]:
+    """Yield the output and errors the task has logged since the previous tick, until
+    the task reaches a terminal status.
+
+    Every tick fetches only the status and logs of the task. The server sends the logs
+    in full, the parts which have been already yielded are cut off by their length.
+    Polling intervals start over whenever the task has logged something new.
+
+    Args:
+        client: Client object reference.
+        task_id: Identifier of the task.
+        backoff: Polling intervals, the default ones if not given.
+
+    Returns:
+        Iterator over pairs of new output and new errors, at least one of them not empty.
+
+    """
+    backoff = backoff or Backoff()
+    intervals = backoff.intervals()
+    out_offset = err_offset = 0
+    while True:
+        task = client.get_task(task_id, fields=["task_status", "std_out", "std_err"], max_age=0)
+        std_out, std_err = task.std_out or "", task.std_err or ""
+        if len(std_out) > out_offset or len(std_err) > err_offset:
+            yield std_out[out_offset:], std_err[err_offset:]
+            intervals = backoff.intervals()
+        out_offset, err_offset = len(std_out), len(std_err)
+        if task.task_status in TERMINAL_TASK_STATUSES:
+            return
+        time.sleep(next(intervals))  # pylint: disable=stop-iteration-return
+
+
+async def _fetch_status(client: AqueductClient, task_id: UUID) -> TaskData:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, partial(client.get_task, task_id, fields=["task_status"], max_age=0)
+    )
+
+
+async def _subscribed_statuses(
+    client: AqueductClient, task_id: UUID, idle_timeout: Optional[float]
+) -> AsyncIterator[TaskData]:
+    # the current status, fetched once the subscription has been started, and then
+    # the pushed ones until the subscription completes or nothing is pushed for a while
+    subscription = client.subscribe(task_status_subscription, {"taskId": str(task_id)})
+    pending = asyncio.ensure_future(subscription.__anext__())
+    try:
+        yield await _fetch_status(client, task_id)
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=idle_timeout)
+            if not done:
+                logging.info("No task status pushed for %s seconds", idle_timeout)
+                return
+            try:
+                result = pending.result()
+            except StopAsyncIteration:
+                return
+            yield TaskData.from_dict(result["taskStatus"])
+            pending = asyncio.ensure_future(subscription.__anext__())
+    finally:
+        pending.cancel()
+        await asyncio.gather(pending, return_exceptions=True)
+        await subscription.aclose()
+
+
+async def watch_task_status(
+    client: AqueductClient,
+    task_id: UUID,
+    backoff: Optional[Backoff] = None,
+    use_subscription: bool = True,
+    idle_timeout: Optional[float] = 30.0,
+) -> AsyncIterator[TaskData]:
+    """Yield the task whenever its status changes, until it reaches a terminal status.
+
+    Status changes are pushed by the server over a subscription. The current status is
+    fetched once the subscription has been started, so a task which has already finished
+    is yielded right away. If the subscription is unavailable, gets interrupted or
+    nothing is pushed for `idle_timeout` seconds, the status is polled instead, with
+    the growing intervals of `backoff`.
+
+    Args:
+        client: Client object reference.
+        task_id: Identifier of the task.
+        backoff: Polling intervals, the default ones if not given.
+        use_subscription: Try the subscription before falling back to polling.
+        idle_timeout: Time in seconds to wait for a pushed status change before falling
+            back to polling, `None` waits without limit.
+
+    Returns:
+        Asynchronous iterator over the task data with the changed status.
+
+    """
+    status: Optional[str] = None
+    if use_subscription:
+        statuses = _subscribed_statuses(client, task_id, idle_timeout)
+        try:
+            async for task in statuses:
+                if task.task_status != status:
+                    status = task.task_status
+                    yield task
+                if status in TERMINAL_TASK_STATUSES:
+                    return
+            logging.info("Task status subscription has ended, polling instead")
+        except SubscriptionUnavailableError as error:
+            logging.info("Task status subscription is unavailable, polling instead: %s", error)
+        finally:
+            await statuses.aclose()
+
+    intervals = (backoff or Backoff()).intervals()
+    while True:
+        task = await _fetch_status(client, task_id)
+        if task.task_status != status:
+            status = task.task_status
+            yield task
+        if status in TERMINAL_TASK_STATUSES:
+            return
+        await asyncio.sleep(next(intervals))  # pylint: disable=stop-iteration-return
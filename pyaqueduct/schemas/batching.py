@@ -0,0 +1,146 @@
+"""Composition of several GraphQL operations into a single aliased document.
+
+Every operation is expected to select exactly one top-level field, as all the documents
+in `queries` and `mutations` modules do. The field of the operation with index `i` gets
+the alias `op<i>` and each of its variables gets the suffix `_<i>`, so the operations can
+be sent in one request and their results and errors told apart in the response.
+"""
+
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from graphql import (
+    DocumentNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    Visitor,
+    visit,
+)
+
+
+def operation_alias(index: int) -> str:
+    """Alias of the operation field with the given index in a composed document."""
+    return f"op{index}"
+
+
+def operation_variable(name: str, index: int) -> str:
+    """Name of the variable of the operation with the given index in a composed document."""
+    return f"{name}_{index}"
+
+
+class _VariableRenamer(Visitor):
+    """Visitor which adds the operation index suffix to every variable reference."""
+
+    def __init__(self, index: int):
+        super().__init__()
+        self.index = index
+
+    def enter_variable(self, node: VariableNode, *_) -> VariableNode:
+        """Replace variable node with the renamed copy."""
+        return VariableNode(name=NameNode(value=operation_variable(node.name.value, self.index)))
+
+
+def _single_operation(document: DocumentNode) -> OperationDefinitionNode:
+    operations = [
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    if len(operations) != 1 or len(operations[0].selection_set.selections) != 1:
+        raise ValueError("Only documents with a single operation field can be composed.")
+    return operations[0]
+
+
+def is_mutation(document: DocumentNode) -> bool:
+    """Check if the single operation of the document is a mutation."""
+    return _single_operation(document).operation is OperationType.MUTATION
+
+
+@lru_cache(maxsize=256)
+def compose_documents(documents: Tuple[DocumentNode, ...]) -> DocumentNode:
+    """Compose operations into one document with aliased fields and suffixed variables.
+
+    Args:
+        documents: Documents of the operations in the order of execution.
+
+    Returns:
+        Document executing all the operations in a single request.
+
+    """
+    operations = [_single_operation(document) for document in documents]
+    if len({operation.operation for operation in operations}) != 1:
+        raise ValueError("Queries and mutations can't be composed into one document.")
+
+    variable_definitions = []
+    selections = []
+    for index, operation in enumerate(operations):
+        renamed = visit(operation, _VariableRenamer(index))
+        variable_definitions.extend(renamed.variable_definitions)
+        field = copy(renamed.selection_set.selections[0])
+        field.alias = NameNode(value=operation_alias(index))
+        selections.append(field)
+
+    return DocumentNode(
+        definitions=[
+            OperationDefinitionNode(
+                operation=operations[0].operation,
+                name=NameNode(value=f"Batched{operations[0].name.value}"),
+                variable_definitions=variable_definitions,
+                directives=[],
+                selection_set=SelectionSetNode(selections=selections),
+            )
+        ]
+    )
+
+
+def compose_variables(variables: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge variables of several operations into variables of the composed document.
+
+    Args:
+        variables: Variable values of every operation in the order of execution.
+
+    Returns:
+        Variable values for the composed document.
+
+    """
+    return {
+        operation_variable(name, index): value
+        for index, operation_variables in enumerate(variables)
+        for name, value in operation_variables.items()
+    }
+
+
+def split_results(
+    data: Optional[Dict[str, Any]], errors: List[Any], count: int
+) -> Tuple[Dict[int, Any], Dict[int, str]]:
+    """Split response of the composed document into results of the single operations.
+
+    Args:
+        data: Data part of the response. It may be partial, if some operations failed.
+        errors: Errors part of the response.
+        count: Number of the composed operations.
+
+    Returns:
+        Results and error messages keyed by the operation index. Operations which are
+        in neither of them were discarded by a failure of a non-nullable sibling.
+
+    """
+    data = data or {}
+    results: Dict[int, Any] = {}
+    failures: Dict[int, str] = {}
+    aliases = {operation_alias(index): index for index in range(count)}
+
+    for error in errors:
+        path = error.get("path") if isinstance(error, dict) else None
+        if path and path[0] in aliases:
+            failures.setdefault(aliases[path[0]], error.get("message", str(error)))
+
+    for alias, index in aliases.items():
+        if alias in data and index not in failures:
+            results[index] = data[alias]
+
+    return results, failures
@@ -0,0 +1,107 @@
+"""Projection of GraphQL documents to a subset of the selected fields.
+
+The documents in `queries` module select every field of the returned records. Projection
+keeps the operation and its variables intact, but limits the selection set of the record
+to the requested fields, so the server doesn't compute and send the unused ones.
+"""
+
+from copy import copy
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from graphql import DocumentNode, FieldNode, OperationDefinitionNode, SelectionSetNode
+
+
+def _project_selection_set(
+    selection_set: SelectionSetNode, path: Tuple[str, ...], fields: FrozenSet[str]
+) -> SelectionSetNode:
+    if not path:
+        selections = [
+            selection
+            for selection in selection_set.selections
+            if isinstance(selection, FieldNode) and selection.name.value in fields
+        ]
+        missing = fields - {selection.name.value for selection in selections}
+        if missing:
+            raise ValueError(f"Fields {sorted(missing)} can't be selected.")
+        return SelectionSetNode(selections=selections)
+
+    projected_selections = []
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode) and selection.name.value == path[0]:
+            selection = copy(selection)
+            selection.selection_set = _project_selection_set(
+                selection.selection_set, path[1:], fields
+            )
+        projected_selections.append(selection)
+    return SelectionSetNode(selections=projected_selections)
+
+
+@lru_cache(maxsize=128)
+def project_document(
+    document: DocumentNode, path: Tuple[str, ...], fields: FrozenSet[str]
+) -> DocumentNode:
+    """Limit selection of the record in the document to the given fields.
+
+    Args:
+        document: Document with a single operation.
+        path: Names of the fields leading from the operation to the record.
+        fields: GraphQL names of the record fields to keep.
+
+    Returns:
+        Projected document.
+
+    """
+    definitions = []
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            definition = copy(definition)
+            definition.selection_set = _project_selection_set(
+                definition.selection_set, path, fields
+            )
+        definitions.append(definition)
+    return DocumentNode(definitions=definitions)
+
+
+def check_fields(field_names: Dict[str, str], fields: Iterable[str]) -> None:
+    """Check that the record fields given by their Python attribute names exist.
+
+    Args:
+        field_names: Mapping of the record attribute names to GraphQL field names.
+        fields: Attribute names of the fields.
+
+    """
+    unknown = set(fields) - set(field_names)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}, expected some of {list(field_names)}.")
+
+
+def select_fields(
+    document: DocumentNode,
+    path: Tuple[str, ...],
+    field_names: Dict[str, str],
+    fields: Optional[Iterable[str]],
+    required: Iterable[str] = (),
+) -> DocumentNode:
+    """Project the document to the record fields given by their Python attribute names.
+
+    Args:
+        document: Document with a single operation.
+        path: Names of the fields leading from the operation to the record.
+        field_names: Mapping of the record attribute names to GraphQL field names.
+        fields: Attribute names of the fields to select. `None` selects all the fields.
+        required: Attribute names of the fields which are always selected.
+
+    Returns:
+        Projected document, or the original one if no projection is requested.
+
+    """
+    if fields is None:
+        return document
+
+    check_fields(field_names, fields)
+    return project_document(
+        document,
+        path,
+        frozenset(field_names[field] for field in (*required, *fields)),
+    )
@@ -0,0 +1,20 @@
+"""Aqueduct GraphQL Subscription schemas"""
+
+from gql import gql
+
+task_status_subscription = gql(
+    """
+    subscription TaskStatusSubscription (
+        $taskId: UUID!,
+    ) {
+        taskStatus (
+            taskId: $taskId
+        ) {
+            uuid
+            taskStatus
+            resultCode
+            endedAt
+        }
+    }
+    """
+)
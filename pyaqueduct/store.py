@@ -0,0 +1,307 @@
+"""Local store module, which mirrors experiment metadata in an SQLite database."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, PrivateAttr
+
+from pyaqueduct.client import AqueductClient, ExperimentData, ExperimentFile
+from pyaqueduct.index import ExperimentIndex
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    uuid TEXT PRIMARY KEY,
+    eid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    files TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS experiments_eid ON experiments (eid);
+CREATE INDEX IF NOT EXISTS experiments_created_at ON experiments (created_at);
+CREATE TABLE IF NOT EXISTS experiment_tags (
+    uuid TEXT NOT NULL REFERENCES experiments (uuid) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, uuid)
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "uuid, eid, title, description, created_at, updated_at, tags, files"
+
+
+@dataclass
+class SyncResult:
+    """Dataclass for outcome of the local store synchronisation"""
+
+    updated: int
+    removed: int
+
+
+def _timestamp(value: datetime) -> str:
+    # stored in UTC with a fixed width, so that the text sorts and compares by time;
+    # naive datetimes are taken as UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _to_row(experiment: ExperimentData) -> Tuple[Any, ...]:
+    return (
+        str(experiment.uuid),
+        experiment.eid,
+        experiment.title,
+        experiment.description,
+        _timestamp(experiment.created_at),
+        _timestamp(experiment.updated_at),
+        json.dumps(experiment.tags),
+        json.dumps(
+            [
+                {"name": file.name, "path": file.path, "modifiedAt": file.modified_at.isoformat()}
+                for file in experiment.files
+            ]
+        ),
+    )
+
+
+def _from_row(row: Tuple[Any, ...]) -> ExperimentData:
+    # pylint: disable=invalid-name
+    uuid, eid, title, description, created_at, updated_at, tags, files = row
+    return ExperimentData(
+        uuid=UUID(uuid),
+        eid=eid,
+        title=title,
+        description=description,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+        tags=json.loads(tags),
+        files=[ExperimentFile.from_dict(file) for file in json.loads(files)],
+    )
+
+
+class LocalStore(BaseModel):
+    """Local copy of experiment metadata kept in an SQLite database.
+
+    The store is filled and updated by `sync()`, and queries of the store don't send
+    any requests to the server. Data of the experiments is as fresh as the last `sync()`.
+    The database is opened in WAL mode, so it can be read by other processes while
+    the store is being synchronised. Creation and update times are stored in UTC.
+
+    Args:
+        path: Path of the database file. It's created if it doesn't exist.
+        client: Client used to fetch experiments from the server.
+        page_size: The number of experiments to list in a single request during sync.
+        max_workers: The maximum number of concurrent requests during sync.
+
+    """
+
+    path: str
+    page_size: int
+    max_workers: int
+
+    _client: AqueductClient = PrivateAttr()
+    _connection: sqlite3.Connection = PrivateAttr()
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(
+        self, path: str, client: AqueductClient, page_size: int = 100, max_workers: int = 8
+    ):
+        super().__init__(path=path, page_size=page_size, max_workers=max_workers)
+        self._client = client
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> LocalStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def last_sync(self) -> Optional[datetime]:
+        """Time of the last successful synchronisation, `None` if the store wasn't synced."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM metadata WHERE key = 'last_sync'"
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def sync(self) -> SyncResult:
+        """Bring the store up to date with the server.
+
+        The server is asked for the UUID and update time of every experiment only, and full
+        data is fetched for the experiments which are new or were updated since the last
+        sync. Experiments removed from the server are removed from the store.
+
+        Returns:
+            Numbers of updated and removed experiments.
+
+        """
+        started_at = datetime.now(timezone.utc)
+        listing = self._client.scan_experiments(
+            page_size=self.page_size, max_workers=self.max_workers, fields=["updated_at"]
+        )
+        with self._lock:
+            known: Dict[str, str] = dict(
+                self._connection.execute("SELECT uuid, updated_at FROM experiments")
+            )
+        changed = [
+            experiment.uuid
+            for experiment in listing
+            if known.get(str(experiment.uuid)) != _timestamp(experiment.updated_at)
+        ]
+        removed = set(known) - {str(experiment.uuid) for experiment in listing}
+
+        fetched = self._client.get_experiments_by_uuids(
+            experiment_uuids=changed, chunk_size=self.page_size
+        )
+        for uuid, error in fetched.failed.items():
+            # the experiment might have been removed after listing
+            logging.info("Experiment %s wasn't synced: %s", uuid, error)
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM experiments WHERE uuid = ?", [(uuid,) for uuid in removed]
+            )
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO experiments ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [_to_row(experiment) for experiment in fetched.succeeded.values()],
+            )
+            self._connection.executemany(
+                "DELETE FROM experiment_tags WHERE uuid = ?",
+                [(str(uuid),) for uuid in fetched.succeeded],
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO experiment_tags (uuid, tag) VALUES (?, ?)",
+                [
+                    (str(uuid), tag)
+                    for uuid, experiment in fetched.succeeded.items()
+                    for tag in experiment.tags
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_sync', ?)",
+                (started_at.isoformat(),),
+            )
+
+        logging.info(
+            "Synced local store, %s experiments updated, %s removed",
+            len(fetched.succeeded),
+            len(removed),
+        )
+        return SyncResult(updated=len(fetched.succeeded), removed=len(removed))
+
+    def build_index(self) -> ExperimentIndex:
+        """Load all the stored experiments into an in-memory index for combined queries.
+
+        Returns:
+            Index of the stored experiments.
+
+        """
+        return ExperimentIndex(self.find_experiments())
+
+    def get_experiment_by_uuid(self, uuid: UUID) -> Optional[ExperimentData]:
+        """Get the stored experiment by the specified identifier.
+
+        Args:
+            uuid: UUID of the experiment.
+
+        Returns:
+            Data of the experiment, or `None` if it isn't in the store.
+
+        """
+        return self._fetch_one("uuid = ?", str(uuid))
+
+    def get_experiment_by_eid(self, eid: str) -> Optional[ExperimentData]:
+        """Get the stored experiment by the specified identifier.
+
+        Args:
+            eid: EID of the experiment.
+
+        Returns:
+            Data of the experiment, or `None` if it isn't in the store.
+
+        """
+        return self._fetch_one("eid = ?", eid)
+
+    def _fetch_one(self, condition: str, value: str) -> Optional[ExperimentData]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM experiments WHERE {condition}", (value,)
+            ).fetchone()
+        return _from_row(row) if row else None
+
+    def find_experiments(  # pylint: disable=too-many-arguments
+        self,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        tags: Optional[List[str]] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None,
+    ) -> List[ExperimentData]:
+        """Find the stored experiments that have the search criteria provided in arguments.
+        The experiments are ordered from the most recently created.
+
+        Args:
+            search: The string to search for in the title and EID of experiments.
+            limit: The maximum number of experiments to return. All are returned by default.
+            offset: The number of experiments to skip from the beginning of the results.
+            tags: List of tags, experiments having any of them are returned.
+            start_datetime: Start datetime to filter the experiments created after it.
+                A naive datetime is taken as UTC.
+            end_datetime: End datetime to filter the experiments created before it.
+                A naive datetime is taken as UTC.
+
+        Returns:
+            List of experiments data.
+
+        """
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("(title LIKE ? ESCAPE '\\' OR eid LIKE ? ESCAPE '\\')")
+            parameters.extend([pattern + "%", pattern + "%"])
+        if tags:
+            conditions.append(
+                "uuid IN (SELECT uuid FROM experiment_tags WHERE tag IN "
+                f"({', '.join('?' * len(tags))}))"
+            )
+            parameters.extend(tags)
+        if start_datetime:
+            conditions.append("created_at >= ?")
+            parameters.append(_timestamp(start_datetime))
+        if end_datetime:
+            conditions.append("created_at <= ?")
+            parameters.append(_timestamp(end_datetime))
+
+        query = f"SELECT {_COLUMNS} FROM experiments"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        parameters.extend([-1 if limit is None else limit, offset])
+
+        with self._lock:
+            rows = self._connection.execute(query, parameters).fetchall()
+        return [_from_row(row) for row in rows]
@@ -0,0 +1,102 @@
+"""Table module to analyse experiment and task listings in a columnar form."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, PrivateAttr
+
+from pyaqueduct.client.columns import INTEGER, STRING, STRING_LIST, TIMESTAMP, ColumnarData
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - depends on the environment
+    pyarrow = None  # pylint: disable=invalid-name
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover - depends on the environment
+    pandas = None  # pylint: disable=invalid-name
+
+
+class Table(BaseModel):
+    """Records of a listing stored as columns, one list of values per selected field.
+    Tables are returned by `API.export_experiments()` and `API.export_tasks()`.
+
+    The columns can be converted to an Arrow table or a pandas data frame for vectorized
+    analysis. These conversions need the optional dependencies, which are installed with
+    `pip install pyaqueduct[arrow]` and `pip install pyaqueduct[pandas]`.
+    """
+
+    _data: ColumnarData = PrivateAttr()
+
+    def __init__(self, data: ColumnarData):
+        super().__init__()
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def column_names(self) -> List[str]:
+        """Names of the columns in the order of the selected fields."""
+        return list(self._data.columns)
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Get the columns as lists of Python values.
+
+        Returns:
+            Lists of values keyed by the column name. Timestamps are timezone aware
+            `datetime` objects, tags and file names are lists of strings.
+
+        """
+        return self._data.columns
+
+    def to_arrow(self) -> Any:
+        """Convert the columns to an Arrow table. Timestamps are converted to UTC.
+
+        Returns:
+            `pyarrow.Table` object.
+
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "pyarrow is required, install it with `pip install pyaqueduct[arrow]`."
+            )
+        types = {
+            STRING: pyarrow.string(),
+            INTEGER: pyarrow.int64(),
+            TIMESTAMP: pyarrow.timestamp("us", tz="UTC"),
+            STRING_LIST: pyarrow.list_(pyarrow.string()),
+        }
+        return pyarrow.table(
+            {
+                name: pyarrow.array(values, type=types[self._data.kinds[name]])
+                for name, values in self._data.columns.items()
+            }
+        )
+
+    def to_pandas(self) -> Any:
+        """Convert the columns to a pandas data frame. Timestamps are converted to UTC,
+        integer columns have nullable `Int64` type.
+
+        Returns:
+            `pandas.DataFrame` object.
+
+        """
+        if pandas is None:
+            raise ImportError(
+                "pandas is required, install it with `pip install pyaqueduct[pandas]`."
+            )
+        converters = {
+            STRING: lambda values: pandas.array(values, dtype="string"),
+            INTEGER: lambda values: pandas.array(values, dtype="Int64"),
+            TIMESTAMP: lambda values: pandas.to_datetime(values, utc=True),
+            STRING_LIST: lambda values: values,
+        }
+        return pandas.DataFrame(
+            {
+                name: converters[self._data.kinds[name]](values)
+                for name, values in self._data.columns.items()
+            }
+        )
@@ -1,19 +1,23 @@
 """Task module."""
 
+import asyncio
+import os
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Set, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import AwareDatetime, BaseModel, PrivateAttr
 
 from pyaqueduct.client import AqueductClient
 from pyaqueduct.client.experiment_types import ExperimentData
 from pyaqueduct.client.extension_types import ExtensionCancelResultData
-from pyaqueduct.client.task_types import ParameterData
+from pyaqueduct.client.task_types import ParameterData, TaskData
+from pyaqueduct.polling import Backoff, stream_task_logs, wait_for_tasks, watch_task_status
 
 
 class Task(BaseModel):
-    """Task representation. Contains all data and metadata about Aqueduct Task"""
+    """Task representation. Contains all data and metadata about Aqueduct Task.
+    Fields which weren't selected when the task was fetched are `None`."""
 
     _client: AqueductClient = PrivateAttr()
     "Client object reference."
@@ -21,34 +25,34 @@ class Task(BaseModel):
     uuid: UUID
     """UUID for task."""
 
-    created_by: str
+    created_by: Optional[str] = None
     """User who executed the task."""
 
-    received_at: datetime
+    received_at: Optional[datetime] = None
     """Time at which action was executed."""
 
-    experiment: ExperimentData
+    experiment: Optional[ExperimentData] = None
     """Experiment to which task belongs"""
 
-    extension_name: str
+    extension_name: Optional[str] = None
     """Name of extension to which action belongs."""
 
-    action_name: str
+    action_name: Optional[str] = None
     """Name of action called."""
 
-    parameters: List[ParameterData]
+    parameters: Optional[List[ParameterData]] = None
     """List of parameters with key and value passed to action"""
 
     def __init__( # pylint: disable=too-many-arguments
         self,
         client: AqueductClient,
         uuid: UUID,
-        created_by: str,
-        received_at: datetime,
-        experiment: ExperimentData,
-        extension_name: str,
-        action_name: str,
-        parameters: List[ParameterData]
+        created_by: Optional[str] = None,
+        received_at: Optional[datetime] = None,
+        experiment: Optional[ExperimentData] = None,
+        extension_name: Optional[str] = None,
+        action_name: Optional[str] = None,
+        parameters: Optional[List[ParameterData]] = None,
     ):
         # Call parent constructor for Pydantic validation
         super().__init__(
@@ -63,32 +67,288 @@ class Task(BaseModel):
 
         self._client = client
 
+    @classmethod
+    def from_data(cls, client: AqueductClient, data: TaskData) -> "Task":
+        """Create task object from the task data decoded from the server response,
+        skipping the field validation of the constructor.
+
+        Args:
+            client: Client object reference.
+            data: Task data.
+
+        Returns:
+            Task object.
+        """
+        task = cls.model_construct(
+            uuid=data.task_id,
+            created_by=data.created_by,
+            received_at=data.received_at,
+            experiment=data.experiment,
+            extension_name=data.extension_name,
+            action_name=data.action_name,
+            parameters=data.parameters,
+        )
+        task._client = client  # pylint: disable=protected-access
+        return task
+
+    def _fetch_field(self, name: str):
+        return getattr(self._client.get_task(self.uuid, fields=[name]), name)
+
     @property
     def task_status(self) -> str:
         """Status of task."""
-        return self._client.get_task(str(self.uuid)).task_status
+        return self._fetch_field("task_status")
 
     @property
     def result_code(self) -> int:
         """Result code for executed process."""
-        return self._client.get_task(str(self.uuid)).result_code
+        return self._fetch_field("result_code")
 
     @property
     def ended_at(self) -> datetime:
         """Time at which execution of task was completed."""
-        return self._client.get_task(str(self.uuid)).ended_at
+        return self._fetch_field("ended_at")
 
     @property
     def std_out(self) -> str:
         """Output string of task execution."""
-        return self._client.get_task(str(self.uuid)).std_out
+        return self._fetch_field("std_out")
 
     @property
     def std_err(self) -> str:
         """Errors propagated during task execution."""
-        return self._client.get_task(str(self.uuid)).std_err
+        return self._fetch_field("std_err")
+
+    def wait(self, timeout: Optional[float] = None, backoff: Optional[Backoff] = None) -> TaskData:
+        """Wait for the task to finish. Only the status is fetched while the task runs,
+        with growing intervals between the requests. The full task data is fetched once
+        the task reaches a terminal status.
+
+        Args:
+            timeout: Maximum time to wait in seconds, `None` waits without limit.
+            backoff: Polling intervals, the default ones if not given.
+
+        Returns:
+            Data of the finished task.
+        """
+        return next(wait_for_tasks(self._client, [self.uuid], timeout=timeout, backoff=backoff))
+
+    def stream_logs(self, backoff: Optional[Backoff] = None) -> Iterator[Tuple[str, str]]:
+        """Follow the logs of the task until it finishes. Only the status and the logs are
+        fetched on every poll, and only the output and errors logged since the previous
+        poll are yielded.
+
+        Args:
+            backoff: Polling intervals, they start over whenever something new is logged.
+
+        Returns:
+            Iterator over pairs of new output and new errors.
+        """
+        return stream_task_logs(self._client, self.uuid, backoff=backoff)
+
+    def status_changes(
+        self,
+        backoff: Optional[Backoff] = None,
+        use_subscription: bool = True,
+        idle_timeout: Optional[float] = 30.0,
+    ) -> AsyncIterator[TaskData]:
+        """Asynchronous iterator over the status changes of the task, ending when the task
+        finishes. Changes are pushed by the server over a websocket subscription, which
+        needs `pip install pyaqueduct[subscriptions]`. The status is polled instead if the
+        subscription isn't available.
+
+        Args:
+            backoff: Polling intervals used without the subscription.
+            use_subscription: Try the subscription before falling back to polling.
+            idle_timeout: Time in seconds to wait for a pushed change before falling back
+                to polling, `None` waits without limit.
+
+        Returns:
+            Asynchronous iterator over the task data with the new status.
+        """
+        return watch_task_status(
+            self._client,
+            self.uuid,
+            backoff=backoff,
+            use_subscription=use_subscription,
+            idle_timeout=idle_timeout,
+        )
+
+    def watch(
+        self,
+        callback: Callable[[TaskData], None],
+        backoff: Optional[Backoff] = None,
+        use_subscription: bool = True,
+        idle_timeout: Optional[float] = 30.0,
+    ) -> Optional[TaskData]:
+        """Call the function on every status change of the task until it finishes.
+        It runs an event loop, use `status_changes()` within a coroutine instead.
+
+        Args:
+            callback: Function called with the task data with the new status.
+            backoff: Polling intervals used without the subscription.
+            use_subscription: Try the subscription before falling back to polling.
+            idle_timeout: Time in seconds to wait for a pushed change before falling back
+                to polling, `None` waits without limit.
+
+        Returns:
+            Task data with the terminal status.
+        """
+
+        async def consume() -> Optional[TaskData]:
+            task = None
+            async for task in self.status_changes(backoff, use_subscription, idle_timeout):
+                callback(task)
+            return task
+
+        return asyncio.run(consume())
 
     def cancel_task(self) -> ExtensionCancelResultData:
         """Cancel or revoke current executing task"""
         result = self._client.cancel_task(str(self.uuid))
         return result
+
+
+class TaskSummary(BaseModel):
+    """Summary of a task without its logs, experiment and parameters, which make most of
+    the task data. Status, result code and end time are the ones at the time of listing.
+    Logs are fetched on access with a query selecting just the logs of this task."""
+
+    _client: AqueductClient = PrivateAttr()
+    "Client object reference."
+
+    # fields mirror the summary fields of TaskData
+    # pylint: disable=duplicate-code
+    uuid: UUID
+    """UUID for task."""
+
+    task_status: Optional[str] = None
+    """Status of the task when it was listed."""
+
+    extension_name: Optional[str] = None
+    """Name of extension to which action belongs."""
+
+    action_name: Optional[str] = None
+    """Name of action called."""
+
+    created_by: Optional[str] = None
+    """User who executed the task."""
+
+    received_at: Optional[datetime] = None
+    """Time at which action was executed."""
+
+    ended_at: Optional[datetime] = None
+    """Time at which execution of the task was completed, if it was when listed."""
+
+    result_code: Optional[int] = None
+    """Result code of the executed process, if it was completed when listed."""
+    # pylint: enable=duplicate-code
+
+    @classmethod
+    def from_data(cls, client: AqueductClient, data: TaskData) -> "TaskSummary":
+        """Create task summary from the task data decoded from the server response.
+        Listings create one per task, so the fields are assigned without validation.
+
+        Args:
+            client: Client object reference.
+            data: Task data with the summary fields.
+
+        Returns:
+            Task summary object.
+        """
+        summary = cls.model_construct(
+            uuid=data.task_id,
+            task_status=data.task_status,
+            extension_name=data.extension_name,
+            action_name=data.action_name,
+            created_by=data.created_by,
+            received_at=data.received_at,
+            ended_at=data.ended_at,
+            result_code=data.result_code,
+        )
+        summary._client = client  # pylint: disable=protected-access
+        return summary
+
+    @property
+    def std_out(self) -> str:
+        """Output string of task execution, fetched on access."""
+        return self._client.get_task(self.uuid, fields=["std_out"]).std_out
+
+    @property
+    def std_err(self) -> str:
+        """Errors propagated during task execution, fetched on access."""
+        return self._client.get_task(self.uuid, fields=["std_err"]).std_err
+
+    def get_logs(self) -> Tuple[str, str]:
+        """Fetch both logs of the task in a single request.
+
+        Returns:
+            Output and errors of the task execution.
+        """
+        task = self._client.get_task(self.uuid, fields=["std_out", "std_err"])
+        return task.std_out, task.std_err
+
+    def get_task(self) -> Task:
+        """Fetch the full data of the task.
+
+        Returns:
+            Task object.
+        """
+        return Task.from_data(self._client, self._client.get_task(self.uuid))
+
+
+class TaskCursor(BaseModel):
+    """Position in the feed of the received tasks, see `API.iter_new_tasks()`.
+    The cursor is a high-water mark of the receiving time, plus the tasks received
+    exactly at that time, which have been consumed already.
+
+    Args:
+        received_at: Receiving time of the latest consumed task (timezone aware).
+            `None` starts the feed from the first task.
+        seen: UUIDs of the consumed tasks received at `received_at`.
+
+    """
+
+    received_at: Optional[AwareDatetime] = None
+    seen: Set[UUID] = set()
+
+    def is_new(self, task: TaskData) -> bool:
+        """Check if the task is after the cursor."""
+        if self.received_at is None or task.received_at > self.received_at:
+            return True
+        return task.received_at == self.received_at and task.task_id not in self.seen
+
+    def advance(self, task: TaskData) -> None:
+        """Move the cursor past the task."""
+        if self.received_at is None or task.received_at > self.received_at:
+            self.received_at = task.received_at
+            self.seen = {task.task_id}
+        else:
+            self.seen.add(task.task_id)
+
+    def save(self, path: str) -> None:
+        """Save the cursor to a JSON file. The file is replaced atomically.
+
+        Args:
+            path: Path of the file.
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.model_dump_json())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str, default: Optional[datetime] = None) -> "TaskCursor":
+        """Load the cursor saved to a JSON file.
+
+        Args:
+            path: Path of the file.
+            default: Receiving time the cursor starts at if the file doesn't exist.
+
+        Returns:
+            Cursor object.
+        """
+        if not os.path.exists(path):
+            return cls(received_at=default)
+        with open(path, encoding="utf-8") as file:
+            return cls.model_validate_json(file.read())
@@ -0,0 +1,51 @@
+"""Validation of public method arguments, which can be switched off per object.
+
+Methods decorated with `validate_call` validate and coerce their arguments with
+pydantic, unless the object they are bound to has `_validate_arguments` attribute set
+to `False`. In that case the arguments are passed through as is, so they have to be
+of the annotated types already.
+"""
+
+import inspect
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+import pydantic
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _validation_enabled(args: tuple) -> bool:
+    return not args or getattr(args[0], "_validate_arguments", True) is not False
+
+
+def validate_call(function: F) -> F:
+    """Decorate the method to validate its arguments with pydantic, if enabled
+    for the object the method is called on.
+
+    Args:
+        function: Method to decorate.
+
+    Returns:
+        Decorated method.
+
+    """
+    validated = pydantic.validate_call(function)
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            if _validation_enabled(args):
+                return await validated(*args, **kwargs)
+            return await function(*args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if _validation_enabled(args):
+            return validated(*args, **kwargs)
+        return function(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -1,13 +1,20 @@
 # pylint: skip-file
 from collections import namedtuple
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
+import pytest
 from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportQueryError
+from graphql import print_ast
+from pydantic import ValidationError
 
 from pyaqueduct.api import API
 from pyaqueduct.client import AqueductClient, ExperimentData, ExperimentsInfo
+from pyaqueduct.client.task_types import TaskData
+from pyaqueduct.experiment import Experiment
 from pyaqueduct.extensions import Extension, ExtensionAction
+from pyaqueduct.task import TaskCursor
 from tests.unittests.mock import patched_execute
 
 test_api_url = "http://test.com"
@@ -98,6 +105,42 @@ def test_get_experiment_by_uuid(monkeypatch):
     assert experiment.created_at == expected_datetime
 
 
+def test_trusted_arguments(monkeypatch):
+    experiment_uuid = uuid4()
+    received_tags = []
+
+    def patched_get_experiment(self, experiment_uuid):
+        return ExperimentData(uuid=experiment_uuid, eid="mock_eid", created_at=datetime.now())
+
+    def patched_add_tags(self, experiment_uuid, tags):
+        received_tags.append(tags)
+        return ExperimentData(uuid=experiment_uuid, tags=list(tags))
+
+    monkeypatch.setattr(AqueductClient, "get_experiment", patched_get_experiment)
+    monkeypatch.setattr(AqueductClient, "add_tags_to_experiment", patched_add_tags)
+
+    validating_api = API(url=test_api_url, timeout=1)
+    with pytest.raises(ValidationError):
+        validating_api.get_experiment_by_uuid(uuid="not a uuid")
+    experiment = validating_api.get_experiment_by_uuid(uuid=str(experiment_uuid))
+    assert experiment.uuid == experiment_uuid
+    experiment.add_tags(("tag1",))
+    assert received_tags[-1] == ["tag1"]
+
+    trusted_api = API(url=test_api_url, timeout=1, validate_arguments=False)
+    experiment = trusted_api.get_experiment_by_uuid(uuid=experiment_uuid)
+    assert experiment.uuid == experiment_uuid
+    experiment.add_tags(("tag1",))
+    assert received_tags[-1] == ("tag1",)
+    assert set(experiment.__pydantic_private__) == set(Experiment.__private_attributes__)
+    assert experiment.model_dump() == {
+        "uuid": experiment_uuid,
+        "eid": "mock_eid",
+        "created_at": experiment.created_at,
+    }
+    assert experiment.tags == ["tag1"]
+
+
 def test_remove_experiment_by_eid(monkeypatch):
     expected_uuid = uuid4()
     expected_title = "test title"
@@ -108,7 +151,7 @@ def test_remove_experiment_by_eid(monkeypatch):
     def patched_remove_experiment(self, experiment_uuid):
         assert experiment_uuid == expected_uuid
 
-    def patched_get_experiment(self, eid):
+    def patched_get_experiment(self, eid, fields=None):
         assert eid == expected_eid
 
         return ExperimentData(
@@ -139,7 +182,9 @@ def test_find_experiments(monkeypatch):
         )
         experiments_list.append(new_experiment)
 
-    def patched_get_experiments(self, title, limit, offset, tags, start_datetime, end_datetime):
+    def patched_get_experiments(
+        self, title, limit, offset, tags, start_datetime, end_datetime, fields=None
+    ):
         return ExperimentsInfo(
             experiments=[
                 ExperimentData(
@@ -191,6 +236,289 @@ def test_execute_extension_action(monkeypatch):
     assert result.stderr == ""
 
 
+def test_extension_catalogue_cache(monkeypatch, tmp_path):
+    requests = []
+
+    def execute(self, query, *args, **kwargs):
+        requests.append(query.definitions[0].name.value)
+        return patched_execute(self, query, *args, **kwargs)
+
+    clock = [1000.0]
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    monkeypatch.setattr("pyaqueduct.extensions.time.time", lambda: clock[0])
+    path = str(tmp_path / "extensions.json")
+    api = API(url=test_api_url, timeout=1, extension_cache_ttl=30, extension_cache_path=path)
+
+    extensions = api.get_extensions()
+    action = api.get_extension("Dummy extension").action("echo")
+    assert action is extensions[0].actions[0]
+    assert len(requests) == 1
+    with pytest.raises(KeyError):
+        api.get_extension("Unknown extension")
+    with pytest.raises(KeyError):
+        extensions[0].action("unknown")
+
+    clock[0] += 31
+    api.get_extensions()
+    assert len(requests) == 2
+    api.invalidate_extensions()
+    api.get_extensions()
+    assert len(requests) == 3
+
+    # a fresh saved list is reused by a new session
+    api = API(url=test_api_url, timeout=1, extension_cache_path=path)
+    assert api.get_extension("Dummy extension").action("echo").experiment_variable_name == "var4"
+    assert len(requests) == 3
+
+
 def test_get_tasks(monkeypatch):
     monkeypatch.setattr(SyncClientSession, "execute", patched_execute)
     api = API(url=test_api_url, timeout=1)
+
+
+def test_tasks_wrap_decoded_data(monkeypatch):
+    decoded = []
+    original_from_dict = TaskData.from_dict
+
+    def recording_from_dict(data):
+        decoded.append(original_from_dict(data))
+        return decoded[-1]
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_execute)
+    monkeypatch.setattr(TaskData, "from_dict", recording_from_dict)
+    api = API(url=test_api_url, timeout=1)
+    tasks = api.get_tasks()
+
+    assert [task.uuid for task in tasks] == [data.task_id for data in decoded]
+    for task, data in zip(tasks, decoded):
+        assert task.parameters is data.parameters
+        assert task.experiment is data.experiment
+        assert task.received_at == data.received_at
+        assert task._client is api._client
+
+
+def test_get_task_summaries(monkeypatch):
+    requests = []
+    task_uuid = str(uuid4())
+
+    def patched_summary_execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        if query.definitions[0].name.value == "GetTaskQuery":
+            assert variable_values == {"taskId": task_uuid}
+            return {"task": {"uuid": task_uuid, "stdOut": "output", "stdErr": "error"}}
+        return {
+            "tasks": {
+                "tasksData": [
+                    {
+                        "uuid": task_uuid,
+                        "taskStatus": "SUCCESS",
+                        "extensionName": "Dummy extension",
+                        "actionName": "echo",
+                        "createdBy": "admin",
+                        "receivedAt": "2024-09-25T15:31:42.922265+00:00",
+                        "endedAt": "2024-09-25T15:31:44.922265+00:00",
+                        "resultCode": 0,
+                    }
+                ],
+                "totalTasksCount": 1,
+            }
+        }
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_summary_execute)
+    api = API(url=test_api_url, timeout=1)
+
+    summaries = api.get_task_summaries(limit=10)
+
+    assert len(requests) == 1
+    for field in ("stdOut", "stdErr", "experiment", "parameters"):
+        assert field not in requests[0]
+    summary = summaries[0]
+    assert str(summary.uuid) == task_uuid
+    assert summary.task_status == "SUCCESS" and summary.result_code == 0
+    assert summary.ended_at > summary.received_at
+
+    assert summary.std_out == "output"
+    assert "stdOut" in requests[1] and "stdErr" not in requests[1]
+    assert "experiment" not in requests[1]
+    assert summary.get_logs() == ("output", "error")
+    assert len(requests) == 3
+
+
+def test_bulk_mutations(monkeypatch):
+    monkeypatch.setattr(SyncClientSession, "execute", patched_execute)
+    api = API(url=test_api_url, timeout=1)
+    uuids = [uuid4() for _ in range(5)]
+
+    result = api.bulk_add_tags({uuid: ["tag1", "tag2"] for uuid in uuids}, chunk_size=2)
+    assert not result.failed
+    assert list(result.succeeded) == uuids
+    assert all(isinstance(experiment, Experiment) for experiment in result.succeeded.values())
+
+    result = api.bulk_update({uuid: {"title": "new title"} for uuid in uuids})
+    assert list(result.succeeded) == uuids
+
+    result = api.bulk_remove_tags({uuids[0]: ["tag1", "tag2"]})
+    assert list(result.succeeded) == uuids[:1]
+
+    result = api.bulk_remove(uuids)
+    assert list(result.succeeded) == uuids
+
+
+def test_bulk_mutations_partial_failure(monkeypatch):
+    uuids = [uuid4() for _ in range(3)]
+
+    def patched_failing_execute(self, query, variable_values, **kwargs):
+        data = patched_execute(self, query, variable_values)
+        data["op1"] = None
+        raise TransportQueryError(
+            "Tag limit reached",
+            errors=[{"message": "Tag limit reached", "path": ["op1"]}],
+            data=data,
+        )
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_failing_execute)
+    api = API(url=test_api_url, timeout=1)
+
+    result = api.bulk_add_tags({uuid: ["tag"] for uuid in uuids})
+
+    assert list(result.succeeded) == [uuids[0], uuids[2]]
+    assert result.failed == {uuids[1]: "Tag limit reached"}
+
+
+def test_find_experiments_hydrates_handles(monkeypatch):
+    def patched_get_experiment(self, experiment_uuid):
+        raise AssertionError("Experiment data should be taken from the search results.")
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_execute)
+    monkeypatch.setattr(AqueductClient, "get_experiment", patched_get_experiment)
+    api = API(url=test_api_url, timeout=1)
+
+    experiments = api.find_experiments(limit=5)
+
+    assert [experiment.title for experiment in experiments] == [
+        f"test title {idx}" for idx in range(1, 6)
+    ]
+    assert [experiment.description for experiment in experiments] == [
+        f"test description {idx}" for idx in range(1, 6)
+    ]
+    assert all(experiment.tags == [] and experiment.files == [] for experiment in experiments)
+
+
+def test_iter_experiments(monkeypatch):
+    total_count = 23
+    offsets = []
+
+    def patched_get_experiments(
+        self, limit, offset, title, tags, start_datetime, end_datetime, fields=None
+    ):
+        offsets.append(offset)
+        return ExperimentsInfo(
+            experiments=[
+                ExperimentData(
+                    uuid=uuid4(),
+                    title=f"test title {idx}",
+                    description="test description",
+                    eid=f"mock_eid_{idx}",
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+                for idx in range(offset, min(offset + limit, total_count))
+            ],
+            total_count=total_count,
+        )
+
+    monkeypatch.setattr(AqueductClient, "get_experiments", patched_get_experiments)
+    api = API(url=test_api_url, timeout=1)
+
+    experiments = list(api.iter_experiments(search="test", page_size=10))
+
+    assert offsets == [0, 10, 20]
+    assert [experiment.eid for experiment in experiments] == [
+        f"mock_eid_{idx}" for idx in range(total_count)
+    ]
+
+
+def test_scan_experiments(monkeypatch):
+    total_count = 45
+    uuids = [uuid4() for _ in range(total_count)]
+
+    def patched_get_experiments(
+        self, limit, offset, title, tags, start_datetime, end_datetime, fields=None
+    ):
+        # an experiment was added during the scan, so pages overlap by one item
+        start = max(offset - 1, 0)
+        return ExperimentsInfo(
+            experiments=[
+                ExperimentData(
+                    uuid=uuids[idx],
+                    title="test title",
+                    description="test description",
+                    eid=f"mock_eid_{idx}",
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                )
+                for idx in range(start, min(start + limit, total_count))
+            ],
+            total_count=total_count,
+        )
+
+    monkeypatch.setattr(AqueductClient, "get_experiments", patched_get_experiments)
+    api = API(url=test_api_url, timeout=1)
+
+    experiments = api.scan_experiments(tags=["tag1"], page_size=10, max_workers=3)
+
+    assert [experiment.uuid for experiment in experiments] == uuids
+
+
+def test_iter_new_tasks(monkeypatch, tmp_path):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    server = []
+    requests = []
+
+    def receive(minute):
+        received_at = (start + timedelta(minutes=minute)).isoformat()
+        server.insert(0, {"uuid": str(uuid4()), "receivedAt": received_at})
+
+    def feed_execute(self, query, variable_values, **kwargs):
+        requests.append(variable_values)
+        tasks = [
+            task
+            for task in server
+            if variable_values["startDate"] is None
+            or task["receivedAt"] >= variable_values["startDate"]
+        ]
+        offset, limit = variable_values["offset"], variable_values["limit"]
+        page = tasks[offset : offset + limit]
+        if offset == 0 and len(server) == 5:
+            # a task received while paging shifts the next page by one
+            receive(5)
+        return {"tasks": {"tasksData": page, "totalTasksCount": len(tasks)}}
+
+    for minute in [0, 1, 2, 2, 3]:
+        receive(minute)
+    monkeypatch.setattr(SyncClientSession, "execute", feed_execute)
+    api = API(url=test_api_url, timeout=1)
+    cursor = TaskCursor()
+
+    tasks = list(api.iter_new_tasks(since=cursor, page_size=2, fields=["task_status"]))
+
+    # the task received while paging isn't listed, it's left for the next run
+    received = [task.received_at for task in tasks]
+    assert received == sorted(received) and len(tasks) == 5
+    assert len({task.uuid for task in tasks}) == 5
+    assert cursor.received_at == start + timedelta(minutes=3)
+
+    path = str(tmp_path / "cursor.json")
+    cursor.save(path)
+    receive(6)
+    requests.clear()
+    cursor = TaskCursor.load(path)
+    tasks = list(api.iter_new_tasks(since=cursor, page_size=2))
+    assert [task.received_at for task in tasks] == [
+        start + timedelta(minutes=5),
+        start + timedelta(minutes=6),
+    ]
+    assert requests[0]["startDate"] == (start + timedelta(minutes=3)).isoformat()
+    assert list(api.iter_new_tasks(since=cursor)) == []
+
+    assert TaskCursor.load(str(tmp_path / "missing.json"), default=start).received_at == start
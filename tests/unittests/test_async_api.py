@@ -0,0 +1,90 @@
+# pylint: skip-file
+import asyncio
+import tempfile
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from gql.client import AsyncClientSession
+from httpx import AsyncClient as AsyncHTTPClient
+from httpx import MockTransport, Response
+
+from pyaqueduct.async_api import AsyncAPI
+from pyaqueduct.client import AsyncAqueductClient
+from pyaqueduct.exceptions import FileDownloadError
+from tests.unittests.mock import patched_execute
+
+test_api_url = "http://test.com"
+
+
+async def patched_async_execute(self, query, variable_values, **kwargs):
+    await asyncio.sleep(0)
+    return patched_execute(self, query, variable_values, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_experiment(monkeypatch):
+    monkeypatch.setattr(AsyncClientSession, "execute", patched_async_execute)
+
+    async with AsyncAPI(url=test_api_url, timeout=1) as api:
+        experiment = await api.create_experiment(title="test title", description="description")
+        assert experiment.title == "test title"
+
+        experiment = await api.update_experiment(uuid=experiment.uuid, title="new title")
+        assert experiment.title == "new title"
+
+        experiment = await api.add_tags(uuid=experiment.uuid, tags=["tag1"])
+        assert experiment.tags == ["tag1"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries(monkeypatch):
+    monkeypatch.setattr(AsyncClientSession, "execute", patched_async_execute)
+
+    async with AsyncAqueductClient(url=test_api_url, timeout=1) as client:
+        uuids = [uuid4() for _ in range(20)]
+        experiments = await asyncio.gather(*(client.get_experiment(uuid) for uuid in uuids))
+        assert [experiment.uuid for experiment in experiments] == uuids
+
+        pages, tags, extensions = await asyncio.gather(
+            client.get_experiments(limit=5, offset=0),
+            client.get_tags(limit=3, offset=0),
+            client.get_extensions(),
+        )
+        assert len(pages.experiments) == 5
+        assert len(tags.tags) == 3
+        assert extensions[0].actions[0].name == "echo"
+
+
+@pytest.mark.asyncio
+@patch("pyaqueduct.client.async_client.AsyncHTTPClient.post")
+async def test_file_upload(fake_httpx_post):
+    fake_httpx_post.return_value = Response(status_code=200)
+
+    async with AsyncAqueductClient(url=test_api_url, timeout=1) as client:
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(b"a,b\n")
+            file.flush()
+            await client.upload_file(uuid4(), file.name)
+
+    file_name = fake_httpx_post.call_args.kwargs["headers"]["file_name"]
+    assert fake_httpx_post.call_args.kwargs["files"] == {"file": (file_name, b"a,b\n")}
+
+
+@pytest.mark.asyncio
+async def test_file_download(tmp_path):
+    def handler(request):
+        if request.url.path.endswith("/data.csv"):
+            return Response(status_code=200, content=b"a,b\n" * 10000)
+        return Response(status_code=404)
+
+    async with AsyncAqueductClient(url=test_api_url, timeout=1) as client:
+        await client._http_client.aclose()
+        client._http_client = AsyncHTTPClient(transport=MockTransport(handler))
+
+        await client.download_file(uuid4(), "data.csv", str(tmp_path))
+        assert (tmp_path / "data.csv").read_bytes() == b"a,b\n" * 10000
+
+        with pytest.raises(FileDownloadError):
+            await client.download_file(uuid4(), "missing.csv", str(tmp_path))
+        assert not (tmp_path / "missing.csv").exists()
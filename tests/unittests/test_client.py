@@ -1,12 +1,25 @@
+import sys
 import tempfile
+from dataclasses import fields
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportQueryError
+from graphql import print_ast
+from httpx import Client as HTTPClient
 from httpx import Response
 
-from pyaqueduct.client import AqueductClient
+from pyaqueduct.client import AqueductClient, ExperimentData
+from pyaqueduct.client.task_cache import TaskCache
+from pyaqueduct.schemas.queries import (
+    get_experiment_query,
+    get_experiments_query,
+    get_tasks_query,
+)
 from tests.unittests.mock import patched_execute
 
 
@@ -209,7 +222,7 @@ def test_execute_extension_action(monkeypatch):
     assert exec_result.stderr == ""
 
 
-@patch("pyaqueduct.client.client.post")
+@patch("pyaqueduct.client.client.HTTPClient.post")
 def test_file_upload(fake_httpx_post):
     fake_httpx_post.return_value = Response(status_code=200)
 
@@ -219,7 +232,7 @@ def test_file_upload(fake_httpx_post):
         data = client.upload_file(uuid4(), file.name)
 
 
-@patch("pyaqueduct.client.client.stream")
+@patch("pyaqueduct.client.client.HTTPClient.stream")
 def test_file_download(fake_httpx_stream, mocker):
     fake_httpx_stream.return_value.__enter__.return_value = mocker.Mock()
     fake_httpx_stream.return_value.__enter__.return_value.status_code = 200
@@ -244,3 +257,225 @@ def test_file_download(fake_httpx_stream, mocker):
 
     with tempfile.TemporaryDirectory() as dir:
         response = client.download_file(uuid4(), "sample.txt", dir)
+
+
+def test_shared_connection_pool(monkeypatch):
+    opened_clients = []
+    original_init = HTTPClient.__init__
+
+    def patched_init(self, *args, **kwargs):
+        opened_clients.append(kwargs)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(HTTPClient, "__init__", patched_init)
+    monkeypatch.setattr(SyncClientSession, "execute", patched_execute)
+
+    with AqueductClient(
+        url="http://test.com", timeout=1, api_token="token", max_connections=5
+    ) as client:
+        client.get_experiments(limit=1, offset=0)
+        client.get_tags(limit=1, offset=0)
+
+    assert len(opened_clients) == 1
+    assert opened_clients[0]["limits"].max_connections == 5
+    assert opened_clients[0]["headers"] == {"Authorization": "Bearer token"}
+
+
+def test_get_experiments_by_uuids(monkeypatch):
+    experiment_ids = [uuid4() for _ in range(5)]
+    missing_id = experiment_ids[3]
+    requests = []
+
+    def patched_batch_execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        data, errors = {}, []
+        for name, value in variable_values.items():
+            if not name.startswith("value_"):
+                continue
+            alias = f"op{name.split('_')[1]}"
+            if value == str(missing_id):
+                errors.append({"message": "Experiment not found", "path": [alias]})
+                data[alias] = None
+            else:
+                data[alias] = patched_execute(self, get_experiment_query, {"value": value})[
+                    "experiment"
+                ]
+        if errors:
+            raise TransportQueryError(errors[0]["message"], errors=errors, data=data)
+        return data
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_batch_execute)
+
+    client = AqueductClient(url="http://test.com", timeout=1)
+    result = client.get_experiments_by_uuids(experiment_ids, chunk_size=2)
+
+    assert len(requests) == 3
+    assert requests[0].count("experiment(") == 2
+    assert "op1: experiment" in requests[0]
+    assert set(result.succeeded) == set(experiment_ids) - {missing_id}
+    assert result.failed == {missing_id: "Experiment not found"}
+    assert all(result.succeeded[uuid].uuid == uuid for uuid in result.succeeded)
+
+
+def test_field_projection(monkeypatch):
+    requests = []
+
+    def patched_projected_execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        full_query, key, selected = {
+            "GetExperiments": (get_experiments_query, "experiments", "title"),
+            "GetTasksQuery": (get_tasks_query, "tasks", "taskStatus"),
+        }[query.definitions[0].name.value]
+        data = patched_execute(self, full_query, variable_values, **kwargs)
+        data[key][f"{key}Data"] = [
+            {name: value for name, value in record.items() if name in ("uuid", selected)}
+            for record in data[key][f"{key}Data"]
+        ]
+        return data
+
+    monkeypatch.setattr(SyncClientSession, "execute", patched_projected_execute)
+
+    client = AqueductClient(url="http://test.com", timeout=1)
+    experiments = client.get_experiments(limit=2, offset=0, fields=["title"])
+    tasks = client.get_tasks(limit=2, offset=0, fields=["task_status"])
+
+    assert "files" not in requests[0] and "description" not in requests[0]
+    assert "uuid" in requests[0] and "title" in requests[0]
+    assert "stdOut" not in requests[1] and "taskStatus" in requests[1]
+    assert experiments.experiments[0].title is not None
+    assert experiments.experiments[0].description is None
+    assert tasks[0].task_status is not None
+    assert tasks[0].std_out is None
+
+    with pytest.raises(ValueError):
+        client.get_experiments(limit=2, offset=0, fields=["unknown"])
+
+
+def test_eid_resolution_cache(monkeypatch):
+    requests = []
+
+    def counting_execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        if query.definitions[0].name.value == "GetExperimentByIdentifier":
+            return {"experiment": {"uuid": str(uuid4()), "eid": variable_values["value"]}}
+        return patched_execute(self, query, variable_values, **kwargs)
+
+    monkeypatch.setattr(SyncClientSession, "execute", counting_execute)
+    client = AqueductClient(url="http://test.com", timeout=1, eid_cache_size=2)
+
+    experiments = client.get_experiments(limit=3, offset=0).experiments
+    assert len(requests) == 1
+    assert client.resolve_eid(experiments[2].eid) == experiments[2].uuid
+    assert client.resolve_eid(experiments[1].eid) == experiments[1].uuid
+    assert len(requests) == 1
+
+    # the least recently used mapping was evicted
+    client.resolve_eid(experiments[0].eid)
+    assert len(requests) == 2
+    assert "description" not in requests[-1]
+
+    client.remove_experiment(experiments[1].uuid)
+    client.resolve_eid(experiments[1].eid)
+    assert len(requests) == 4
+
+
+@patch("pyaqueduct.client.client.HTTPClient.post")
+def test_response_decoding(fake_httpx_post):
+    experiment_uuid = uuid4()
+    fake_httpx_post.return_value = Response(
+        status_code=200,
+        json={
+            "data": {
+                "experiment": {
+                    "uuid": str(experiment_uuid),
+                    "title": "test title",
+                    "description": "test description",
+                    "eid": "230101-01",
+                    "tags": [],
+                    "createdAt": "2023-01-01T00:00:00Z",
+                    "updatedAt": "2023-01-01T00:00:00Z",
+                    "files": [
+                        {"name": "file1", "path": "path1", "modifiedAt": "2023-01-01T00:00:00Z"}
+                    ],
+                }
+            }
+        },
+    )
+
+    client = AqueductClient(url="http://test.com", timeout=1)
+    experiment = client.get_experiment(experiment_uuid)
+
+    assert experiment.uuid == experiment_uuid
+    assert experiment.created_at == datetime(2023, 1, 1, tzinfo=timezone.utc)
+    # timestamps repeated in the response are parsed once
+    assert experiment.updated_at is experiment.created_at
+    assert experiment.files[0].name == "file1"
+    assert experiment.files[0].modified_at == experiment.created_at
+    assert not hasattr(experiment, "__dict__")
+    assert not hasattr(experiment.files[0], "__dict__")
+    # no raw response data is retained next to the fields
+    assert ExperimentData.__slots__ == tuple(field.name for field in fields(ExperimentData))
+    assert experiment.files[0].name is sys.intern("file1")
+
+
+def test_task_cache(monkeypatch, tmp_path):
+    finished_id, running_id = uuid4(), uuid4()
+    requests = []
+    clock = [0.0]
+
+    def task_execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        task_id = variable_values["taskId"]
+        task = {
+            "uuid": task_id,
+            "taskStatus": "SUCCESS" if task_id == str(finished_id) else "STARTED",
+            "endedAt": "2024-09-25T15:31:44+00:00" if task_id == str(finished_id) else None,
+            "stdOut": "output",
+            "stdErr": "",
+        }
+        task_fields = query.definitions[0].selection_set.selections[0].selection_set.selections
+        return {"task": {field.name.value: task[field.name.value] for field in task_fields}}
+
+    monkeypatch.setattr(SyncClientSession, "execute", task_execute)
+    monkeypatch.setattr("pyaqueduct.client.task_cache.time.monotonic", lambda: clock[0])
+    path = str(tmp_path / "tasks.db")
+    client = AqueductClient(
+        url="http://test.com", timeout=1, task_cache_ttl=2.0, task_cache_path=path
+    )
+
+    # finished task is fetched once, fields fetched separately are merged
+    assert client.get_task(finished_id, fields=["task_status"]).task_status == "SUCCESS"
+    assert client.get_task(finished_id, fields=["task_status"]).task_status == "SUCCESS"
+    assert client.get_task(finished_id, fields=["std_out"]).std_out == "output"
+    task = client.get_task(finished_id, fields=["task_status", "std_out"], max_age=0)
+    assert task.task_status == "SUCCESS" and task.std_out == "output"
+    assert len(requests) == 2
+
+    # running task is reused for the TTL only
+    client.get_task(running_id, fields=["task_status"])
+    client.get_task(running_id, fields=["task_status"])
+    assert len(requests) == 3
+    client.get_task(running_id, fields=["task_status"], max_age=0)
+    assert len(requests) == 4
+    clock[0] += 2.0
+    client.get_task(running_id, fields=["task_status"])
+    assert len(requests) == 5
+    client.close()
+
+    # finished task is kept on disk across sessions, but polls don't look there
+    client = AqueductClient(url="http://test.com", timeout=1, task_cache_path=path)
+    with monkeypatch.context() as patch:
+        patch.setattr(TaskCache, "_load", lambda self, task_id: pytest.fail("disk lookup"))
+        client.get_task(running_id, fields=["task_status"], max_age=0)
+    assert len(requests) == 6
+    task = client.get_task(str(finished_id), fields=["std_out", "task_status"])
+    assert task.std_out == "output" and task.task_status == "SUCCESS"
+    assert len(requests) == 6
+    assert client.get_task(finished_id, fields=["ended_at"]).ended_at is not None
+    assert len(requests) == 7
+
+    # identifiers given as strings are looked up and returned as UUIDs
+    batch = client.get_tasks_by_ids([str(finished_id)], fields=["task_status"])
+    assert list(batch.succeeded) == [finished_id] and not batch.failed
+    assert len(requests) == 7
+    client.close()
@@ -2,8 +2,13 @@
 from datetime import datetime
 from uuid import uuid4
 
+import pytest
+from gql.client import SyncClientSession
+
 from pyaqueduct.client import AqueductClient, ExperimentData, ExperimentFile
+from pyaqueduct.exceptions import RemoteOperationError
 from pyaqueduct.experiment import Experiment
+from tests.unittests.mock import patched_execute
 
 
 def test_experiment_title(monkeypatch):
@@ -204,3 +209,196 @@ def test_experiment_files(monkeypatch):
     assert experiment.files == [(item.name, item.modified_at) for item in expected_files]
     experiment.upload_file(file="/tmp/new_file_path.json")
     experiment.download_file(file_name="new_file_path.json", destination_dir="/tmp")
+
+
+def test_experiment_snapshot_cache(monkeypatch):
+    expected_id = uuid4()
+    expected_datetime = datetime.now()
+    fetched = []
+
+    def patched_get_experiment(self, experiment_uuid):
+        fetched.append(experiment_uuid)
+        return ExperimentData(
+            uuid=experiment_uuid,
+            title="test title",
+            description="test description",
+            eid="test_eid",
+            created_at=expected_datetime,
+            updated_at=expected_datetime,
+            tags=["tag1"],
+        )
+
+    def patched_update_experiment(self, experiment_uuid, description):
+        return ExperimentData(
+            uuid=experiment_uuid,
+            title="test title",
+            description=description,
+            eid="test_eid",
+            created_at=expected_datetime,
+            updated_at=expected_datetime,
+            tags=["tag1"],
+        )
+
+    def patched_upload_file(self, experiment_uuid, file):
+        pass
+
+    monkeypatch.setattr(AqueductClient, "get_experiment", patched_get_experiment)
+    monkeypatch.setattr(AqueductClient, "update_experiment", patched_update_experiment)
+    monkeypatch.setattr(AqueductClient, "upload_file", patched_upload_file)
+    mocked_client = AqueductClient(url="http://test.com", timeout=1)
+    experiment = Experiment(
+        client=mocked_client,
+        uuid=expected_id,
+        eid="test_eid",
+        created_at=expected_datetime,
+        cache_ttl=60,
+    )
+
+    assert (experiment.title, experiment.description, experiment.tags) == (
+        "test title",
+        "test description",
+        ["tag1"],
+    )
+    assert len(fetched) == 1
+
+    experiment.description = "new description"
+    assert experiment.description == "new description"
+    assert len(fetched) == 1
+
+    experiment.upload_file(file="/tmp/file.json")
+    assert experiment.files == []
+    assert len(fetched) == 2
+
+    experiment.refresh()
+    assert len(fetched) == 3
+    assert experiment.description == "test description"
+
+    uncached_experiment = Experiment(
+        client=mocked_client,
+        uuid=expected_id,
+        eid="test_eid",
+        created_at=expected_datetime,
+        cache_ttl=0,
+    )
+    uncached_experiment.title
+    uncached_experiment.title
+    assert len(fetched) == 5
+
+
+def test_experiment_snapshot_fields(monkeypatch):
+    expected_datetime = datetime.now()
+    fetched = []
+
+    def patched_get_experiment(self, experiment_uuid):
+        fetched.append(experiment_uuid)
+        return ExperimentData(
+            uuid=experiment_uuid,
+            title="test title",
+            eid="test_eid",
+            created_at=expected_datetime,
+            tags=["tag1"],
+        )
+
+    monkeypatch.setattr(AqueductClient, "get_experiment", patched_get_experiment)
+    mocked_client = AqueductClient(url="http://test.com", timeout=1)
+    snapshot = patched_get_experiment(None, uuid4())
+    fetched.clear()
+
+    experiment = Experiment(
+        client=mocked_client,
+        uuid=snapshot.uuid,
+        eid="test_eid",
+        created_at=expected_datetime,
+        snapshot=snapshot,
+        cache_ttl=60,
+    )
+    assert experiment.description is None
+    assert experiment.description is None
+    assert not fetched
+
+    projected_experiment = Experiment(
+        client=mocked_client,
+        uuid=snapshot.uuid,
+        eid="test_eid",
+        created_at=expected_datetime,
+        snapshot=ExperimentData(uuid=snapshot.uuid, title="test title"),
+        snapshot_fields=["title"],
+        cache_ttl=60,
+    )
+    assert projected_experiment.title == "test title"
+    assert not fetched
+    assert projected_experiment.tags == ["tag1"]
+    assert projected_experiment.description is None
+    assert len(fetched) == 1
+
+
+def test_experiment_partial_update_failure(monkeypatch):
+    expected_id = uuid4()
+    fetched = []
+
+    def patched_get_experiment(self, experiment_uuid):
+        fetched.append(experiment_uuid)
+        return ExperimentData(uuid=experiment_uuid, title="new title", tags=["new"])
+
+    def patched_apply_experiment_changes(self, experiment_uuid, **changes):
+        # the title update was applied, the tag removal failed
+        raise RemoteOperationError(["Tag not found"])
+
+    monkeypatch.setattr(AqueductClient, "get_experiment", patched_get_experiment)
+    monkeypatch.setattr(
+        AqueductClient, "apply_experiment_changes", patched_apply_experiment_changes
+    )
+    mocked_client = AqueductClient(url="http://test.com", timeout=1)
+    experiment = Experiment(
+        client=mocked_client,
+        uuid=expected_id,
+        eid="test_eid",
+        created_at=datetime.now(),
+        snapshot=ExperimentData(uuid=expected_id, title="old title", tags=["old"]),
+        cache_ttl=60,
+    )
+
+    with pytest.raises(RemoteOperationError):
+        experiment.update(title="new title", remove_tags=["missing"])
+    assert (experiment.title, experiment.tags) == ("new title", ["new"])
+    assert len(fetched) == 1
+
+
+def test_experiment_batch(monkeypatch):
+    requests = []
+
+    def counting_execute(self, query, variable_values, **kwargs):
+        requests.append(query)
+        return patched_execute(self, query, variable_values, **kwargs)
+
+    monkeypatch.setattr(SyncClientSession, "execute", counting_execute)
+    mocked_client = AqueductClient(url="http://test.com", timeout=1)
+    experiment = Experiment(
+        client=mocked_client, uuid=uuid4(), eid="test_eid", created_at=datetime.now()
+    )
+
+    with experiment.batch():
+        experiment.title = "new title"
+        experiment.description = "new description"
+        experiment.add_tags(["tag1", "tag2"])
+        experiment.remove_tag("tag2")
+        experiment.remove_tag("tag3")
+        assert not requests
+
+    assert len(requests) == 1
+    operations = requests[0].definitions[0].selection_set.selections
+    assert [operation.name.value for operation in operations] == [
+        "updateExperiment",
+        "addTagsToExperiment",
+        "removeTagFromExperiment",
+        "removeTagFromExperiment",
+    ]
+
+    experiment.update(title="other title", add_tags=["tag4"])
+    assert len(requests) == 2
+
+    with pytest.raises(RuntimeError):
+        with experiment.batch():
+            experiment.title = "discarded title"
+            raise RuntimeError()
+    assert len(requests) == 2
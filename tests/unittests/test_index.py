@@ -0,0 +1,84 @@
+# pylint: skip-file
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pyaqueduct.client import ExperimentData, ExperimentFile
+from pyaqueduct.index import ExperimentIndex
+
+
+def make_experiment(idx, tags, files):
+    return ExperimentData(
+        uuid=uuid4(),
+        eid=f"230101-0{idx}",
+        title=f"Test Title {idx}",
+        description=f"test description {idx}",
+        created_at=datetime(2023, 1, idx),
+        updated_at=datetime(2023, 2, 10 - idx),
+        tags=tags,
+        files=[
+            ExperimentFile(name=name, path=name, modified_at=datetime(2023, 1, idx))
+            for name in files
+        ],
+    )
+
+
+def test_experiment_index():
+    first = make_experiment(1, ["a", "b"], ["data.csv"])
+    second = make_experiment(2, ["b"], ["data.csv", "plot.png"])
+    third = make_experiment(3, ["c"], [])
+    index = ExperimentIndex([first, second, third])
+
+    assert len(index) == 3
+    assert index.find_experiments() == [third, second, first]
+    assert index.find_experiments(all_tags=["a", "b"]) == [first]
+    assert index.find_experiments(any_tags=["a", "c"]) == [third, first]
+    assert index.find_experiments(any_tags=["b"], file_names=["plot.png"]) == [second]
+    assert index.find_experiments(created_after=datetime(2023, 1, 2)) == [third, second]
+    assert index.find_experiments(created_before=datetime(2023, 1, 2)) == [second, first]
+    assert index.find_experiments(updated_after=datetime(2023, 2, 8), search="title 1") == [
+        first
+    ]
+    assert index.find_experiments(all_tags=["unknown"]) == []
+
+    updated_second = make_experiment(2, ["c"], [])
+    updated_second.uuid = second.uuid
+    index.update([updated_second])
+    index.remove([third.uuid, uuid4()])
+
+    assert len(index) == 2
+    assert third.uuid not in index
+    assert index.get(second.uuid) == updated_second
+    assert index.find_experiments(any_tags=["b", "c"]) == [updated_second, first]
+    assert index.find_experiments(file_names=["plot.png"]) == []
+
+
+def test_experiment_index_mixed_offsets():
+    naive = make_experiment(1, [], [])
+    aware = make_experiment(2, [], [])
+    # 2023-01-02 00:00 at UTC+02:00 is 2023-01-01 22:00 UTC, after the naive one
+    aware.created_at = datetime(2023, 1, 2, tzinfo=timezone(timedelta(hours=2)))
+    aware.updated_at = aware.updated_at.replace(tzinfo=timezone.utc)
+    index = ExperimentIndex([naive])
+    index.update([aware])
+
+    assert index.find_experiments() == [aware, naive]
+    assert index.find_experiments(created_after=datetime(2023, 1, 1, 12)) == [aware]
+    assert index.find_experiments(
+        created_before=datetime(2023, 1, 1, 23, tzinfo=timezone.utc)
+    ) == [aware, naive]
+    assert index.find_experiments(
+        created_after=datetime(2023, 1, 1, 23, tzinfo=timezone(timedelta(hours=2))),
+        updated_before=datetime(2023, 2, 9),
+    ) == [aware]
+
+
+def test_experiment_index_eid():
+    first = make_experiment(1, [], [])
+    second = make_experiment(2, [], [])
+    index = ExperimentIndex([first, second])
+
+    assert index.get_by_eid(first.eid) == first
+    assert index.get_by_eid("unknown") is None
+    index.remove([first.uuid])
+    assert index.get_by_eid(first.eid) is None
+    assert index.get_by_eid(second.eid) == second
@@ -0,0 +1,267 @@
+# pylint: skip-file
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from gql.client import SyncClientSession
+from graphql import print_ast
+
+from pyaqueduct.api import API
+from pyaqueduct.client.task_types import TaskData
+from pyaqueduct.exceptions import TaskTimeoutError
+from pyaqueduct.polling import Backoff
+from pyaqueduct.task import Task
+
+test_api_url = "http://test.com"
+
+
+def make_server(ticks_to_finish):
+    """Tasks finishing after the given number of status polls, keyed by task UUID."""
+    polls = {task_id: 0 for task_id in ticks_to_finish}
+    requests = []
+
+    def execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        data = {}
+        for index, selection in enumerate(query.definitions[0].selection_set.selections):
+            task_id = variable_values[f"taskId_{index}"]
+            fields = [field.name.value for field in selection.selection_set.selections]
+            if fields == ["uuid", "taskStatus"]:
+                polls[task_id] += 1
+            status = "SUCCESS" if polls[task_id] >= ticks_to_finish[task_id] else "STARTED"
+            data[selection.alias.value] = {
+                "uuid": task_id,
+                "taskStatus": status,
+                "stdOut": "output",
+                "stdErr": "",
+                "resultCode": 0,
+            }
+        return data
+
+    return polls, requests, execute
+
+
+def test_backoff_intervals():
+    backoff = Backoff(initial=1.0, maximum=4.0, factor=2.0, jitter=0.1)
+    intervals = backoff.intervals()
+    values = [next(intervals) for _ in range(5)]
+    for value, expected in zip(values, [1.0, 2.0, 4.0, 4.0, 4.0]):
+        assert expected * 0.9 <= value <= expected * 1.1
+
+
+def test_as_completed(monkeypatch):
+    task_ids = [str(uuid4()) for _ in range(3)]
+    polls, requests, execute = make_server(dict(zip(task_ids, [3, 1, 2])))
+    sleeps = []
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    monkeypatch.setattr("pyaqueduct.polling.time.sleep", sleeps.append)
+    api = API(url=test_api_url, timeout=1)
+    tasks = [Task(client=api._client, uuid=task_id) for task_id in task_ids]
+
+    finished = [str(task.task_id) for task in api.as_completed(tasks)]
+
+    assert finished == [task_ids[1], task_ids[2], task_ids[0]]
+    # three status polls and a full fetch after each of them
+    assert len(requests) == 6
+    assert "stdOut" not in requests[0] and requests[0].count("taskStatus") == 3
+    assert "stdOut" in requests[1] and requests[1].count("taskStatus") == 1
+    assert requests[2].count("taskStatus") == 2
+    assert polls == dict(zip(task_ids, [3, 1, 2]))
+    assert len(sleeps) == 2 and sleeps[0] < sleeps[1]
+
+    # finished tasks are cached
+    requests.clear()
+    results = api.wait_tasks(tasks)
+    assert [str(task.task_id) for task in results] == task_ids
+    assert all(isinstance(task, TaskData) and task.std_out == "output" for task in results)
+    assert len(requests) == 0
+
+
+def test_task_wait_timeout(monkeypatch):
+    task_id = str(uuid4())
+    _, requests, execute = make_server({task_id: 100})
+    clock = [0.0]
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    monkeypatch.setattr("pyaqueduct.polling.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr(
+        "pyaqueduct.polling.time.sleep", lambda delay: clock.__setitem__(0, clock[0] + delay)
+    )
+    api = API(url=test_api_url, timeout=1)
+    task = Task(client=api._client, uuid=task_id)
+
+    with pytest.raises(TaskTimeoutError):
+        task.wait(timeout=3.0, backoff=Backoff(initial=1.0, factor=1.0, jitter=0.0))
+    assert len(requests) == 4
+
+
+def test_task_watch_falls_back_to_polling(monkeypatch):
+    task_id = str(uuid4())
+    statuses = iter(["PENDING", "STARTED", "STARTED", "SUCCESS"])
+
+    def execute(self, query, variable_values, **kwargs):
+        assert "stdOut" not in print_ast(query)
+        return {"task": {"uuid": variable_values["taskId"], "taskStatus": next(statuses)}}
+
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    monkeypatch.setattr("pyaqueduct.client.subscriptions.WebsocketsTransport", None)
+    api = API(url=test_api_url, timeout=1)
+    task = Task(client=api._client, uuid=task_id)
+    changes = []
+
+    final = task.watch(changes.append, backoff=Backoff(initial=0.001, jitter=0.0))
+
+    assert [change.task_status for change in changes] == ["PENDING", "STARTED", "SUCCESS"]
+    assert final is changes[-1]
+
+
+def make_subscription_handler(task_id, pushed_statuses, subscriptions):
+    """Websocket handler acknowledging subscriptions and pushing the given statuses."""
+
+    async def handler(websocket, *_):
+        async for message in websocket:
+            message = json.loads(message)
+            if message["type"] == "connection_init":
+                await websocket.send(json.dumps({"type": "connection_ack"}))
+            elif message["type"] == "subscribe":
+                subscriptions.append(message["payload"])
+                if not pushed_statuses:
+                    continue
+                for status in pushed_statuses:
+                    result = {"uuid": task_id, "taskStatus": status}
+                    await websocket.send(
+                        json.dumps(
+                            {
+                                "id": message["id"],
+                                "type": "next",
+                                "payload": {"data": {"taskStatus": result}},
+                            }
+                        )
+                    )
+                await websocket.send(json.dumps({"id": message["id"], "type": "complete"}))
+
+    return handler
+
+
+def make_status_server(task_id, statuses):
+    """Task status queries answered with the given statuses, the last one repeated."""
+    fetches = []
+
+    def execute(self, query, variable_values, **kwargs):
+        status = statuses[min(len(fetches), len(statuses) - 1)]
+        fetches.append(status)
+        return {"task": {"uuid": task_id, "taskStatus": status}}
+
+    return fetches, execute
+
+
+@pytest.mark.asyncio
+async def test_task_status_subscription(monkeypatch):
+    websockets = pytest.importorskip("websockets")
+    task_id = str(uuid4())
+    subscriptions = []
+    handler = make_subscription_handler(task_id, ["STARTED", "STARTED", "SUCCESS"], subscriptions)
+    fetches, execute = make_status_server(task_id, ["STARTED"])
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+
+    async with websockets.serve(
+        handler, "localhost", 0, subprotocols=["graphql-transport-ws"]
+    ) as server:
+        port = next(iter(server.sockets)).getsockname()[1]
+        api = API(url=f"http://localhost:{port}", timeout=1)
+        task = Task(client=api._client, uuid=task_id)
+
+        changes = [change.task_status async for change in task.status_changes()]
+
+    assert changes == ["STARTED", "SUCCESS"]
+    # the current status is fetched once, the changes are pushed
+    assert len(fetches) == 1
+    assert subscriptions[0]["variables"] == {"taskId": task_id}
+    assert "TaskStatusSubscription" in subscriptions[0]["query"]
+
+
+@pytest.mark.asyncio
+async def test_task_status_subscription_without_pushes(monkeypatch):
+    websockets = pytest.importorskip("websockets")
+    handler = make_subscription_handler(None, [], [])
+
+    async def collect(statuses, **kwargs):
+        task_id = str(uuid4())
+        fetches, execute = make_status_server(task_id, statuses)
+        monkeypatch.setattr(SyncClientSession, "execute", execute)
+        task = Task(client=api._client, uuid=task_id)
+        changes = [change.task_status async for change in task.status_changes(**kwargs)]
+        return changes, fetches
+
+    async with websockets.serve(
+        handler, "localhost", 0, subprotocols=["graphql-transport-ws"]
+    ) as server:
+        port = next(iter(server.sockets)).getsockname()[1]
+        api = API(url=f"http://localhost:{port}", timeout=1)
+
+        # an already finished task isn't waited for
+        changes, _ = await asyncio.wait_for(collect(["SUCCESS"]), 5)
+        assert changes == ["SUCCESS"]
+
+        # the status is polled once nothing is pushed for the idle timeout
+        changes, fetches = await asyncio.wait_for(
+            collect(
+                ["STARTED", "STARTED", "SUCCESS"],
+                idle_timeout=0.05,
+                backoff=Backoff(initial=0.001),
+            ),
+            5,
+        )
+        assert changes == ["STARTED", "SUCCESS"]
+        assert len(fetches) == 3
+
+        # cancelling the watch doesn't fall back to polling
+        task_id = str(uuid4())
+        fetches, execute = make_status_server(task_id, ["STARTED"])
+        monkeypatch.setattr(SyncClientSession, "execute", execute)
+        task = Task(client=api._client, uuid=task_id)
+        changes = []
+
+        async def consume():
+            async for change in task.status_changes(idle_timeout=None):
+                changes.append(change.task_status)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(consume(), 0.3)
+        assert changes == ["STARTED"]
+        assert len(fetches) == 1
+
+
+def test_task_stream_logs(monkeypatch):
+    task_id = str(uuid4())
+    ticks = iter(
+        [
+            ("STARTED", "", ""),
+            ("STARTED", "line 1\n", ""),
+            ("STARTED", "line 1\n", ""),
+            ("STARTED", "line 1\nline 2\n", "warning\n"),
+            ("SUCCESS", "line 1\nline 2\ndone\n", "warning\n"),
+        ]
+    )
+    requests = []
+    sleeps = []
+
+    def execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        status, std_out, std_err = next(ticks)
+        return {
+            "task": {"uuid": task_id, "taskStatus": status, "stdOut": std_out, "stdErr": std_err}
+        }
+
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    monkeypatch.setattr("pyaqueduct.polling.time.sleep", sleeps.append)
+    api = API(url=test_api_url, timeout=1)
+    task = Task(client=api._client, uuid=task_id)
+
+    chunks = list(task.stream_logs(backoff=Backoff(initial=1.0, factor=2.0, jitter=0.0)))
+
+    assert chunks == [("line 1\n", ""), ("line 2\n", "warning\n"), ("done\n", "")]
+    assert len(requests) == 5
+    assert "experiment" not in requests[0] and "parameters" not in requests[0]
+    # intervals start over after new output
+    assert sleeps == [1.0, 1.0, 2.0, 1.0]
@@ -0,0 +1,131 @@
+# pylint: skip-file
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pyaqueduct.client import AqueductClient, BatchResult, ExperimentData, ExperimentFile
+from pyaqueduct.store import LocalStore
+
+
+def make_experiment(uuid, idx, updated_at, tags):
+    return ExperimentData(
+        uuid=uuid,
+        eid=f"230101-0{idx}",
+        title=f"test title {idx}",
+        description=f"test description {idx}",
+        created_at=datetime(2023, 1, idx, tzinfo=timezone.utc),
+        updated_at=updated_at,
+        tags=tags,
+        files=[ExperimentFile(name="file.txt", path="file.txt", modified_at=updated_at)],
+    )
+
+
+def test_local_store_sync(monkeypatch, tmp_path):
+    updated_at = datetime(2023, 2, 1, tzinfo=timezone.utc)
+    server = {
+        uuid: make_experiment(uuid, idx, updated_at, [f"tag{idx}", "common"])
+        for idx, uuid in enumerate([uuid4() for _ in range(3)], start=1)
+    }
+    fetched = []
+
+    def patched_scan_experiments(self, page_size, max_workers, fields):
+        assert fields == ["updated_at"]
+        return [
+            ExperimentData(uuid=experiment.uuid, updated_at=experiment.updated_at)
+            for experiment in server.values()
+        ]
+
+    def patched_get_experiments_by_uuids(self, experiment_uuids, chunk_size):
+        fetched.append(list(experiment_uuids))
+        return BatchResult(succeeded={uuid: server[uuid] for uuid in experiment_uuids})
+
+    monkeypatch.setattr(AqueductClient, "scan_experiments", patched_scan_experiments)
+    monkeypatch.setattr(
+        AqueductClient, "get_experiments_by_uuids", patched_get_experiments_by_uuids
+    )
+    client = AqueductClient(url="http://test.com", timeout=1)
+    path = str(tmp_path / "store.db")
+
+    with LocalStore(path=path, client=client) as store:
+        assert store.last_sync is None
+        result = store.sync()
+        assert (result.updated, result.removed) == (3, 0)
+        assert store.last_sync is not None
+
+    first, second, third = server
+    server[second] = make_experiment(second, 2, updated_at + timedelta(hours=1), ["new"])
+    del server[third]
+
+    with LocalStore(path=path, client=client) as store:
+        result = store.sync()
+        assert (result.updated, result.removed) == (1, 1)
+        assert fetched[-1] == [second]
+
+        assert store.get_experiment_by_uuid(first) == server[first]
+        assert store.get_experiment_by_eid("230101-02") == server[second]
+        assert store.get_experiment_by_uuid(third) is None
+        assert [experiment.uuid for experiment in store.find_experiments()] == [second, first]
+        assert [experiment.uuid for experiment in store.find_experiments(tags=["new"])] == [
+            second
+        ]
+        assert [experiment.uuid for experiment in store.find_experiments(search="TITLE 1")] == [
+            first
+        ]
+        assert store.find_experiments(start_datetime=datetime(2023, 1, 2), limit=5) == [
+            server[second]
+        ]
+        assert store.find_experiments(search="%") == []
+
+        result = store.sync()
+        assert (result.updated, result.removed) == (0, 0)
+
+
+def test_local_store_mixed_offsets(monkeypatch, tmp_path):
+    plus_two = timezone(timedelta(hours=2))
+    minus_five = timezone(timedelta(hours=-5))
+    # created at 09:00, 10:30 and 11:00 UTC
+    created = [
+        datetime(2023, 1, 1, 11, 0, tzinfo=plus_two),
+        datetime(2023, 1, 1, 5, 30, tzinfo=minus_five),
+        datetime(2023, 1, 1, 11, 0, tzinfo=timezone.utc),
+    ]
+    server = {}
+    for idx, created_at in enumerate(created, start=1):
+        experiment = make_experiment(uuid4(), idx, created_at, [])
+        experiment.created_at = created_at
+        server[experiment.uuid] = experiment
+
+    monkeypatch.setattr(
+        AqueductClient,
+        "scan_experiments",
+        lambda self, page_size, max_workers, fields: list(server.values()),
+    )
+    monkeypatch.setattr(
+        AqueductClient,
+        "get_experiments_by_uuids",
+        lambda self, experiment_uuids, chunk_size: BatchResult(
+            succeeded={uuid: server[uuid] for uuid in experiment_uuids}
+        ),
+    )
+    client = AqueductClient(url="http://test.com", timeout=1)
+    first, second, third = server
+
+    with LocalStore(path=str(tmp_path / "store.db"), client=client) as store:
+        store.sync()
+
+        assert [experiment.uuid for experiment in store.find_experiments()] == [
+            third,
+            second,
+            first,
+        ]
+        found = store.find_experiments(
+            start_datetime=datetime(2023, 1, 1, 5, 0, tzinfo=minus_five),
+            end_datetime=datetime(2023, 1, 1, 12, 45, tzinfo=plus_two),
+        )
+        assert [experiment.uuid for experiment in found] == [second]
+        # naive bounds are taken as UTC
+        found = store.find_experiments(start_datetime=datetime(2023, 1, 1, 10, 0))
+        assert [experiment.uuid for experiment in found] == [third, second]
+        assert store.get_experiment_by_uuid(first).created_at == created[0]
+        assert store.get_experiment_by_uuid(first).created_at.tzinfo == timezone.utc
+
+        assert store.sync().updated == 0
@@ -0,0 +1,131 @@
+# pylint: skip-file
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from gql.client import SyncClientSession
+from graphql import print_ast
+
+from pyaqueduct.api import API
+
+test_api_url = "http://test.com"
+
+
+def make_server(experiment_count, task_count):
+    experiments = [
+        {
+            "uuid": str(uuid4()),
+            "title": f"title {idx}",
+            "description": "description",
+            "eid": f"240101-{idx}",
+            "createdAt": f"2024-01-01T00:{idx:02d}:00+00:00",
+            "updatedAt": f"2024-01-02T00:{idx:02d}:00Z",
+            "tags": ["common", f"tag{idx % 2}"],
+            "files": [{"name": "data.csv", "path": "data.csv", "modifiedAt": "2024-01-02"}],
+        }
+        for idx in range(experiment_count)
+    ]
+    tasks = [
+        {
+            "uuid": str(uuid4()),
+            "taskStatus": "SUCCESS" if idx % 3 else "FAILURE",
+            "extensionName": "Dummy extension",
+            "actionName": "echo",
+            "createdBy": "admin",
+            "receivedAt": f"2024-01-01T00:{idx:02d}:00+00:00",
+            "endedAt": None if idx == 0 else f"2024-01-01T00:{idx:02d}:30+00:00",
+            "resultCode": None if idx == 0 else idx % 3,
+            "stdOut": "output",
+            "stdErr": "",
+            "experiment": experiments[0],
+        }
+        for idx in range(task_count)
+    ]
+    requests = []
+
+    def execute(self, query, variable_values, **kwargs):
+        requests.append(print_ast(query))
+        start = variable_values["offset"]
+        stop = start + variable_values["limit"]
+        if query.definitions[0].name.value == "GetExperiments":
+            return {
+                "experiments": {
+                    "experimentsData": experiments[start:stop],
+                    "totalExperimentsCount": len(experiments),
+                }
+            }
+        return {"tasks": {"tasksData": tasks[start:stop], "totalTasksCount": len(tasks)}}
+
+    return experiments, tasks, requests, execute
+
+
+def test_export_experiments(monkeypatch):
+    experiments, _, requests, execute = make_server(25, 0)
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    api = API(url=test_api_url, timeout=1)
+
+    table = api.export_experiments(page_size=10)
+
+    assert len(requests) == 3
+    assert len(table) == 25
+    columns = table.to_columns()
+    assert table.column_names == list(columns) and "uuid" in columns
+    assert columns["uuid"] == [experiment["uuid"] for experiment in experiments]
+    assert columns["created_at"][3] == datetime(2024, 1, 1, 0, 3, tzinfo=timezone.utc)
+    assert columns["updated_at"][3] == datetime(2024, 1, 2, 0, 3, tzinfo=timezone.utc)
+    assert columns["tags"][1] == ["common", "tag1"]
+    assert columns["files"][1] == ["data.csv"]
+    assert columns["tags"][0][0] is columns["tags"][1][0]
+
+    requests.clear()
+    table = api.export_experiments(page_size=100, fields=["created_at"])
+    assert list(table.to_columns()) == ["uuid", "created_at"]
+    assert "files" not in requests[0] and "description" not in requests[0]
+
+    with pytest.raises(ValueError):
+        api.export_experiments(fields=["unknown"])
+
+
+def test_export_tasks(monkeypatch):
+    experiments, tasks, requests, execute = make_server(1, 12)
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    api = API(url=test_api_url, timeout=1)
+
+    table = api.export_tasks(page_size=5)
+
+    assert len(requests) == 3
+    assert "stdOut" not in requests[0] and "parameters" not in requests[0]
+    assert "files" not in requests[0]
+    columns = table.to_columns()
+    assert "std_out" not in columns
+    assert columns["task_id"] == [task["uuid"] for task in tasks]
+    assert columns["experiment_uuid"] == [experiments[0]["uuid"]] * 12
+    assert columns["result_code"][:3] == [None, 1, 2]
+    assert columns["ended_at"][0] is None
+
+    with pytest.raises(ValueError):
+        api.export_tasks(fields=["parameters"])
+    with pytest.raises(ValueError):
+        api.export_tasks(fields=["unknown"])
+
+
+def test_table_conversions(monkeypatch):
+    _, _, _, execute = make_server(3, 3)
+    monkeypatch.setattr(SyncClientSession, "execute", execute)
+    api = API(url=test_api_url, timeout=1)
+    table = api.export_tasks(fields=["task_status", "received_at", "ended_at", "result_code"])
+
+    monkeypatch.setattr("pyaqueduct.table.pandas", None)
+    with pytest.raises(ImportError):
+        table.to_pandas()
+    monkeypatch.undo()
+
+    pandas = pytest.importorskip("pandas")
+    frame = table.to_pandas()
+    assert str(frame["result_code"].dtype) == "Int64"
+    assert isinstance(frame["received_at"].dtype, pandas.DatetimeTZDtype)
+
+    pyarrow = pytest.importorskip("pyarrow")
+    arrow_table = table.to_arrow()
+    assert arrow_table.num_rows == 3
+    assert arrow_table.schema.field("ended_at").type == pyarrow.timestamp("us", tz="UTC")